@@ -3,7 +3,11 @@ import os
 import json
 import time
 from streamlit_lottie import st_lottie
-from components import home_page, netflix_dashboard, prime_dashboard, disney_dashboard, hulu_dashboard
+from functools import partial
+from components import home_page, platform_dashboard, talent_network
+from utils.dashboard_spec import DASHBOARDS
+from utils.scheduler import get_scheduler
+from utils.session_resources import get_session_resources, touch_session
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
@@ -13,6 +17,10 @@ st.set_page_config(
     initial_sidebar_state="auto"
 )
 
+# --- BACKGROUND REFRESH (trending feed, catalog files) ---
+scheduler = get_scheduler()
+touch_session()
+
 # --- LOAD LOTTIE ANIMATION ---
 def load_lottiefile(filepath: str):
     try:
@@ -63,8 +71,8 @@ else:
         st.header("DataFlix 🔮")
         st.markdown("Welcome to DataFlix, your gateway to streaming analytics!")
         
-        PAGES = ["Home", "Netflix", "Prime Video", "Disney+", "Hulu"]
-        ICONS = ["🏠", "🔴", "🔵", "⚪", "🟢"]
+        PAGES = ["Home", *DASHBOARDS, "Talent Network"]
+        ICONS = ["🏠", *(spec['icon'] for spec in DASHBOARDS.values()), "🎭"]
         
         for page, icon in zip(PAGES, ICONS):
             if st.button(f"{icon} {page}", use_container_width=True, on_click=set_page, args=(page,)):
@@ -102,13 +110,34 @@ else:
         """
         st.components.v1.html(audio_html, height=35)
 
+        # --- SYSTEM STATUS ---
+        with st.expander("⚙️ System Status"):
+            status = scheduler.status()
+            st.caption(f"Catalog version: `{status['catalog_version']}`"
+                       + (f" · TMDb table: `{status['enrichment_version']}`" if status['enrichment_version'] else ""))
+            for job, job_status in status['jobs'].items():
+                last_success = job_status['last_success']
+                age = f"{time.time() - last_success:.0f}s ago" if last_success else "pending"
+                st.caption(f"**{job}** · refreshed {age} · runs: {job_status['runs']}")
+                if job_status['last_error']:
+                    st.caption(f"⚠️ {job_status['last_error']}")
+
+            memory = get_session_resources().metrics()
+            mb = 2**20
+            st.caption(f"**session artefacts** (not raw session state) · {memory['sessions']} tracked · {memory['bytes'] / mb:.1f} MB held "
+                       f"of {memory['process_budget'] / mb:.0f} MB · largest {memory['largest_session_bytes'] / mb:.1f} MB "
+                       f"of {memory['session_budget'] / mb:.0f} MB")
+            st.caption(f"**evictions** {memory['evictions']} ({memory['evicted_bytes'] / mb:.1f} MB) · "
+                       f"**reaped** {memory['reaped_sessions']} sessions ({memory['reaped_bytes'] / mb:.1f} MB)")
+            if memory['rss_bytes'] is not None:
+                shared = f" · shared caches {memory['shared_cache_bytes'] / mb:.0f} MB" if memory['shared_cache_bytes'] is not None else ""
+                st.caption(f"**worker** RSS {memory['rss_bytes'] / mb:.0f} MB{shared}")
+
     # --- MAIN PAGE ROUTING ---
     PAGE_MAP = {
         "Home": home_page.show_home_page,
-        "Netflix": netflix_dashboard.show_netflix_dashboard,
-        "Prime Video": prime_dashboard.show_prime_dashboard,
-        "Disney+": disney_dashboard.show_disney_dashboard,
-        "Hulu": hulu_dashboard.show_hulu_dashboard,
+        **{platform: partial(platform_dashboard.show_platform_dashboard, platform) for platform in DASHBOARDS},
+        "Talent Network": talent_network.show_talent_network,
     }
 
     if st.session_state.page == "Home":
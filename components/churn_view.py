@@ -0,0 +1,55 @@
+import streamlit as st
+import plotly.graph_objects as go
+from utils.snapshots import churn_history, diff_snapshots
+
+OP_LABELS = {'added': "Added", 'changed': "Changed", 'removed': "Removed"}
+OP_COLORS = {'added': '#2CA02C', 'changed': '#9E9E9E', 'removed': '#D62728'}
+DIFF_COLUMNS = ['title', 'type', 'release_year', 'date_added', 'listed_in']
+
+def _snapshot_label(row):
+    return f"#{row.id} · {row.taken_at:%Y-%m-%d %H:%M}"
+
+def show_catalog_churn(platform, key_prefix, template='plotly_dark'):
+    """Renders the catalog churn tab: titles added, changed and removed between recorded snapshots."""
+    st.subheader("Catalog Churn")
+    history = churn_history(platform)
+    if len(history) < 2:
+        st.info("Churn needs at least two catalog snapshots. A snapshot is recorded whenever the file in "
+                "`data/` changes, or run `python -m utils.snapshots` after replacing it.")
+        return
+
+    changes = history.iloc[1:]
+    latest = history.iloc[-1]
+    kpi_cols = st.columns(4)
+    kpi_cols[0].metric("Snapshots", len(history))
+    kpi_cols[1].metric("Added (latest)", f"{latest['added']:,}")
+    kpi_cols[2].metric("Removed (latest)", f"{latest['removed']:,}")
+    kpi_cols[3].metric("Changed (latest)", f"{latest['changed']:,}")
+
+    st.markdown("##### Titles Added and Removed per Snapshot")
+    fig = go.Figure()
+    for op, sign in (('added', 1), ('changed', 1), ('removed', -1)):
+        fig.add_trace(go.Bar(x=changes['taken_at'], y=sign * changes[op], name=OP_LABELS[op],
+                             marker_color=OP_COLORS[op]))
+    fig.update_layout(barmode='relative', template=template, paper_bgcolor='rgba(0,0,0,0)',
+                      plot_bgcolor='rgba(0,0,0,0)', yaxis_title='Titles', xaxis_title='Snapshot')
+    st.plotly_chart(fig, use_container_width=True)
+
+    st.markdown("##### Compare Two Snapshots")
+    labels = {row.id: _snapshot_label(row) for row in history.itertuples()}
+    ids = list(labels)
+    col1, col2 = st.columns(2)
+    from_id = col1.selectbox("From", ids[:-1], index=len(ids) - 2, format_func=labels.get,
+                             key=f"{key_prefix}_churn_from")
+    to_id = col2.selectbox("To", [i for i in ids if i > from_id], index=None, placeholder="Latest",
+                           format_func=labels.get, key=f"{key_prefix}_churn_to") or ids[-1]
+
+    diff = diff_snapshots(platform, from_id, to_id)
+    counts = diff['_op'].value_counts()
+    st.caption(" · ".join(f"{OP_LABELS[op]}: {counts.get(op, 0):,}" for op in OP_LABELS))
+    ops = st.multiselect("Show", list(OP_LABELS), default=list(OP_LABELS), format_func=OP_LABELS.get,
+                         key=f"{key_prefix}_churn_ops")
+    shown = diff[diff['_op'].isin(ops)]
+    columns = ['_op'] + [col for col in DIFF_COLUMNS if col in shown.columns]
+    st.dataframe(shown[columns].rename(columns={'_op': 'change'}).sort_values(['change', 'title']),
+                 use_container_width=True, hide_index=True)
@@ -0,0 +1,61 @@
+import streamlit as st
+from utils.data_loader import catalog_snapshot
+from utils.bitmap_index import get_bitmap_index
+
+FILTER_LABELS = {
+    'platform': "Platform",
+    'type': "Content Type",
+    'genre': "Genre",
+    'country': "Country",
+    'rating': "Rating",
+    'release_year': "Release Year",
+    'date_added': "Date Added",
+}
+
+def _month_label(ordinal):
+    return f"{ordinal // 12}-{ordinal % 12 + 1:02d}"
+
+def render_cross_filters(platform, key_prefix, apply=True, version=None):
+    """
+    Renders the sidebar cross-filters for a platform's catalog (the combined
+    catalog when `platform` is None) and applies them through its bitmap
+    index. The frame and the index come from the same catalog snapshot.
+    Returns the filtered frame (None when `apply` is off, for pages that
+    aggregate from the selection) and the selection.
+    """
+    st.sidebar.header("Filters")
+    snapshot = catalog_snapshot(version)
+    index = get_bitmap_index(platform, snapshot)
+    if index is None:
+        return None, {}
+
+    selection = {}
+    for dim, kind in index.kinds.items():
+        label = FILTER_LABELS[dim]
+        key = f"{key_prefix}_{dim}"
+        if kind == 'range':
+            values = index.values[dim]
+            if len(values) < 2:
+                continue
+            if dim == 'date_added':
+                labels = [_month_label(v) for v in values]
+                lo, hi = st.sidebar.select_slider(label, options=labels, value=(labels[0], labels[-1]), key=key)
+                lo, hi = values[labels.index(lo)], values[labels.index(hi)]
+            else:
+                min_value, max_value = index.extent(dim)
+                lo, hi = st.sidebar.slider(label, min_value, max_value, (min_value, max_value), key=key)
+            # Only narrowed ranges filter, so titles with no value stay visible by default
+            if lo > values[0] or hi < values[-1]:
+                selection[dim] = (int(lo), int(hi))
+        else:
+            chosen = st.sidebar.multiselect(label, index.values[dim], key=key, placeholder="All")
+            if chosen:
+                selection[dim] = tuple(chosen)
+
+    df = snapshot.frame(platform) if apply else None
+    if not selection:
+        return (df.copy() if apply else None), selection
+
+    bitset = index.evaluate(selection)
+    st.sidebar.caption(f"{index.count(bitset):,} of {index.n_rows:,} titles match")
+    return (df[index.to_mask(bitset)].copy() if apply else None), selection
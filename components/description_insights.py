@@ -0,0 +1,36 @@
+import streamlit as st
+import plotly.express as px
+from utils.bitmap_index import selection_key
+from utils.text_analytics import word_cloud_image, rising_terms, RECENT_YEARS
+
+def show_description_insights(platform, selection, colormap='Reds', template='plotly_dark'):
+    """Renders the description tab: a word cloud and the rising terms for the current filters."""
+    st.subheader("What the Descriptions Talk About")
+    key = selection_key(selection)
+
+    st.markdown("##### Most Frequent Description Terms")
+    image = word_cloud_image(platform, key, colormap)
+    if image is None:
+        st.info("No descriptions match the current filters.")
+        return
+    st.image(image, use_container_width=True)
+
+    st.markdown(f"##### Rising Terms (last {RECENT_YEARS} years added vs. earlier)")
+    rising, trend = rising_terms(platform, key)
+    if rising.empty:
+        st.info(f"Rising terms need titles added in more than {RECENT_YEARS} distinct years.")
+        return
+    col1, col2 = st.columns(2)
+    with col1:
+        fig_rising = px.bar(rising, x='z_score', y='term', orientation='h', color='recent_share',
+                            color_continuous_scale=colormap, hover_data=['recent_titles', 'earlier_share'],
+                            labels={'z_score': 'Rise (z-score)', 'term': 'Term', 'recent_share': 'Recent Share'})
+        fig_rising.update_layout(template=template, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                                 yaxis={'categoryorder': 'total ascending'})
+        st.plotly_chart(fig_rising, use_container_width=True)
+    with col2:
+        fig_trend = px.line(trend, x=trend.index, y=trend.columns, markers=True,
+                            labels={'x': 'Year Added', 'value': 'Share of Titles', 'variable': 'Term'})
+        fig_trend.update_layout(template=template, paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                                yaxis_tickformat='.0%')
+        st.plotly_chart(fig_trend, use_container_width=True)
@@ -1,41 +1,69 @@
 import streamlit as st
 import plotly.express as px
+import pandas as pd
 from utils import api_utils
-from utils.data_loader import load_all_data
+from utils.scheduler import get_scheduler
+from utils.data_loader import load_data, data_version, PLATFORM_FILES
+from utils.bitmap_index import selection_key
+from utils.sketches import catalog_summary
+from utils.dashboard_spec import DASHBOARDS
+from utils.session_resources import session_artefact, keep_session_artefact
+from components.cross_filters import render_cross_filters
 
-def get_platform_kpis(df, platform_name):
+COMPOSITION_DIMENSIONS = {"Genre": 'genre', "Country": 'country', "Director": 'director', "Rating": 'rating'}
+
+def _approx(value, summary):
+    """Formats a number, marked '≈' when it comes from a sketch."""
+    return f"≈ {value:,.0f}" if summary['approximate'] else f"{value:,.0f}"
+
+def get_platform_kpis(selection, platform_name, approximate=False):
     """Helper function to calculate KPIs for a given platform."""
-    platform_df = df[df['platform'] == platform_name]
-    if platform_df.empty:
+    if selection.get('platform') and platform_name not in selection['platform']:
+        return {"Total Titles": 0, "Movies": 0, "TV Shows": 0, "Top Genre": "N/A"}
+    summary = catalog_summary(selection_key({**selection, 'platform': (platform_name,)}), approximate)
+    if summary['titles'] == 0:
         return {"Total Titles": 0, "Movies": 0, "TV Shows": 0, "Top Genre": "N/A"}
-    
-    total_titles = platform_df.shape[0]
-    movies = platform_df[platform_df['type'] == 'Movie'].shape[0]
-    tv_shows = platform_df[platform_df['type'] == 'TV Show'].shape[0]
-    top_genre = platform_df['listed_in'].str.split(', ').explode().mode()[0] if not platform_df['listed_in'].dropna().empty else "N/A"
-    return {"Total Titles": total_titles, "Movies": movies, "TV Shows": tv_shows, "Top Genre": top_genre}
+
+    top_genres = summary['top']['genre']
+    top_genre = top_genres['key'].iloc[0] if not top_genres.empty else "N/A"
+    return {"Total Titles": summary['titles'], "Movies": summary['by_type'].get('Movie', 0),
+            "TV Shows": summary['by_type'].get('TV Show', 0), "Top Genre": top_genre}
 
 def show_home_page(set_page_callback):
     # --- HEADER ---
     st.title("DataFlix: Streaming Insights Reimagined 🔮")
     st.markdown("Your central command for streaming analytics. Get a high-level market overview or select a platform for a deep dive.")
     
-    # Load combined data for homepage analytics
-    all_df = load_all_data()
-    if all_df.empty:
+    # Platforms whose data loaded, for homepage analytics
+    version = data_version()
+    platform_names = [platform for platform in PLATFORM_FILES if load_data(platform, version) is not None]
+    if not platform_names:
+        st.error("No datasets could be loaded. Please check the `data` folder.")
         return
+    _, selection = render_cross_filters(None, key_prefix="home", apply=False, version=version)
+    approximate = st.sidebar.toggle("⚡ Approximate mode", key="home_approximate",
+                                    help="Answer the overview from pre-merged sketches instead of scanning every title.")
+    summary = catalog_summary(selection_key(selection), approximate)
+    if approximate and not summary['approximate']:
+        st.sidebar.caption("Approximate mode covers the platform, type and release-year filters. "
+                           "Showing exact results for the current filters.")
 
     # --- GLOBAL KPIS ---
     st.markdown("### Global Streaming Landscape")
     with st.container(border=True):
-        total_titles = all_df.shape[0]
-        total_platforms = all_df['platform'].nunique()
-        top_genre_global = all_df['listed_in'].str.split(', ').explode().mode()[0]
-        
-        kpi_cols = st.columns(3)
-        kpi_cols[0].metric(label="Total Titles Analyzed", value=f"{total_titles:,}")
-        kpi_cols[1].metric(label="Platforms Monitored", value=total_platforms)
-        kpi_cols[2].metric(label="Top Genre Across Platforms", value=top_genre_global)
+        distinct_titles, distinct_error = summary['distinct']['titles']
+        top_genres = summary['top']['genre']
+        top_genre_global = top_genres['key'].iloc[0] if not top_genres.empty else "N/A"
+
+        kpi_cols = st.columns(4)
+        kpi_cols[0].metric(label="Total Titles Analyzed", value=f"{summary['titles']:,}")
+        kpi_cols[1].metric(label="Unique Titles", value=_approx(distinct_titles, summary),
+                           help=f"± {distinct_error:,.0f} (95%)" if summary['approximate'] else
+                           "Titles counted once even when several platforms carry them.")
+        kpi_cols[2].metric(label="Platforms Monitored", value=summary['platforms'])
+        kpi_cols[3].metric(label="Top Genre Across Platforms", value=top_genre_global,
+                           help=(f"At least {top_genres['lower'].iloc[0]:,} and at most {top_genres['upper'].iloc[0]:,} titles"
+                                 if summary['approximate'] and not top_genres.empty else None))
         st.markdown('</div>', unsafe_allow_html=True)
 
     # --- MARKET SHARE & PLATFORM SELECTION ---
@@ -44,30 +72,22 @@ def show_home_page(set_page_callback):
 
     with col1:
         st.markdown("##### Library Size by Platform")
-        platform_counts = all_df['platform'].value_counts()
+        platform_counts = pd.Series(summary['by_platform']).sort_values(ascending=False)
         fig_pie = px.pie(platform_counts, values=platform_counts.values, names=platform_counts.index, hole=0.6,
-                         color_discrete_map={
-                             "Netflix": "#E50914", "Prime Video": "#00A8E1", 
-                             "Disney+": "#3E82FC", "Hulu": "#3DBB3D"
-                         })
+                         color=platform_counts.index,
+                         color_discrete_map={name: spec['brand_color'] for name, spec in DASHBOARDS.items()})
         fig_pie.update_layout(template='plotly_dark', paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', legend_title_text='Platform')
-        fig_pie.update_traces(textinfo='percent+label', pull=[0.05, 0, 0, 0])
+        # Pulls out the largest platform's slice
+        fig_pie.update_traces(textinfo='percent+label', pull=[0.05] + [0] * (len(platform_counts) - 1))
         st.plotly_chart(fig_pie, use_container_width=True)
 
     with col2:
         st.markdown("##### Select a Platform")
         
-        platforms = {
-            "Netflix": "https://image.tmdb.org/t/p/original/wwemzKWzjKYJFfCeiB57q3r4Bcm.svg",
-            "Prime Video": "https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Amazon_Prime_Video_logo.svg/1280px-Amazon_Prime_Video_logo.svg.png",
-            "Disney+": "https://upload.wikimedia.org/wikipedia/commons/3/3e/Disney%2B_logo.svg",
-            "Hulu": "https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Hulu_logo_%282014%29.svg/2560px-Hulu_logo_%282014%29.svg.png"
-        }
-        
         # This structure now creates a clickable container around each logo
-        for platform, logo_url in platforms.items():
+        for platform, spec in DASHBOARDS.items():
             with st.container(border=True):
-                st.image(logo_url)
+                st.image(spec['logo'])
                 # The button text is now just a space, making it invisible. CSS handles the rest.
                 if st.button("Click Here", key=f"btn_{platform}", use_container_width=True):
                     set_page_callback(platform)
@@ -78,12 +98,12 @@ def show_home_page(set_page_callback):
     st.markdown("### Platform Head-to-Head Comparison 🥊")
     with st.container(border=True):
         c1, c2 = st.columns(2)
-        platform1 = c1.selectbox("Select Platform 1", all_df['platform'].unique(), index=0)
-        platform2 = c2.selectbox("Select Platform 2", all_df['platform'].unique(), index=1)
+        platform1 = c1.selectbox("Select Platform 1", platform_names, index=0)
+        platform2 = c2.selectbox("Select Platform 2", platform_names, index=1)
         
         if platform1 and platform2:
-            kpi1 = get_platform_kpis(all_df, platform1)
-            kpi2 = get_platform_kpis(all_df, platform2)
+            kpi1 = get_platform_kpis(selection, platform1, approximate)
+            kpi2 = get_platform_kpis(selection, platform2, approximate)
             
             st.markdown(f"##### Comparing **{platform1}** vs. **{platform2}**")
             
@@ -96,6 +116,32 @@ def show_home_page(set_page_callback):
                     st.metric(label=f"{key} ({platform2})", value=value)
         st.markdown('</div>', unsafe_allow_html=True)
 
+    # --- MARKET COMPOSITION ---
+    st.markdown("### Market Composition")
+    with st.container(border=True):
+        dimension = st.radio("Break down by", list(COMPOSITION_DIMENSIONS), horizontal=True, key="home_composition")
+        top = summary['top'][COMPOSITION_DIMENSIONS[dimension]]
+        fig_top = px.bar(top, x='estimate', y='key', orientation='h', color='estimate', color_continuous_scale='Purples',
+                         error_x=top['upper'] - top['estimate'], error_x_minus=top['estimate'] - top['lower'],
+                         labels={'estimate': 'Titles', 'key': dimension})
+        fig_top.update_layout(template='plotly_dark', paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                              yaxis={'categoryorder': 'total ascending'}, coloraxis_showscale=False)
+        st.plotly_chart(fig_top, use_container_width=True)
+
+        quantiles = summary['quantiles']
+        q_cols = st.columns(4)
+        for col, (label, metric, name, unit) in zip(q_cols, [
+                ("Median Movie Length", 'movie_minutes', 'p50', "min"),
+                ("90th Pct. Movie Length", 'movie_minutes', 'p90', "min"),
+                ("Median TV Seasons", 'tv_seasons', 'p50', "seasons"),
+                ("Median Years to Platform", 'lag_years', 'p50', "years")]):
+            value, rank_error = quantiles[metric][name]
+            col.metric(label=label, value="N/A" if pd.isna(value) else f"{'≈ ' if summary['approximate'] else ''}{value:.0f} {unit}",
+                       help=f"Within ± {rank_error * 100:.1f} percentile points" if summary['approximate'] else None)
+        if summary['approximate']:
+            st.caption("⚡ Approximate: bars show the guaranteed title count; error bars reach the most it could be.")
+        st.markdown('</div>', unsafe_allow_html=True)
+
     # --- SEARCH & TRENDING (FULLY IMPLEMENTED WITH REVIEWS) ---
     with st.container(border=True):
         st.subheader("Title Intelligence Terminal")
@@ -104,31 +150,34 @@ def show_home_page(set_page_callback):
         with c1:
             st.write("**Search for a Movie or TV Show**")
             query = st.text_input("Enter title:", "", key="search_box", placeholder="e.g., The Haunting of Hill House")
-            if st.button("Search", use_container_width=True, key="search_btn"):
-                if query:
-                    with st.spinner("Accessing TMDb Archives..."):
-                        details = api_utils.get_movie_details(query)
-                    
-                    if details and details.get('poster_path'):
-                        st.image(f"https://image.tmdb.org/t/p/w200{details.get('poster_path')}")
-                        st.subheader(f"{details.get('title') or details.get('name')}")
-                        st.write(f"**Rating:** {details.get('vote_average'):.1f}/10 ⭐")
-                        st.write(f"**Overview:** {details.get('overview')}")
-
-                        # Fetch and display reviews
-                        reviews = api_utils.get_movie_reviews(details.get('id'))
-                        if reviews:
-                            with st.expander("See Top Reviews"):
-                                for review in reviews[:2]: # Show top 2 reviews
-                                    st.markdown(f"**Author:** {review.get('author')}")
-                                    st.markdown(f"> {review.get('content')}")
-                                    st.markdown("---")
-                    else:
-                        st.error("Title not found in the archives.")
+            if st.button("Search", use_container_width=True, key="search_btn") and query:
+                with st.spinner("Accessing TMDb Archives..."):
+                    details = api_utils.get_movie_details(query)
+                    reviews = api_utils.get_movie_reviews(details.get('id')) if details else None
+                # Kept for this session so the result survives reruns, within its memory budget
+                keep_session_artefact("tmdb_search", {'details': details, 'reviews': (reviews or [])[:2]}, key=query)
+
+            result = session_artefact("tmdb_search", key=query) if query else None
+            if result is not None:
+                details = result['details']
+                if details and details.get('poster_path'):
+                    st.image(f"https://image.tmdb.org/t/p/w200{details.get('poster_path')}")
+                    st.subheader(f"{details.get('title') or details.get('name')}")
+                    st.write(f"**Rating:** {details.get('vote_average'):.1f}/10 ⭐")
+                    st.write(f"**Overview:** {details.get('overview')}")
+
+                    if result['reviews']:
+                        with st.expander("See Top Reviews"):
+                            for review in result['reviews']: # Show top 2 reviews
+                                st.markdown(f"**Author:** {review.get('author')}")
+                                st.markdown(f"> {review.get('content')}")
+                                st.markdown("---")
+                else:
+                    st.error("Title not found in the archives.")
         
         with c2:
             st.write("**🔥 Trending Transmissions Today**")
-            trending = api_utils.get_trending_movies()
+            trending = get_scheduler().get_trending()
             if trending:
                 with st.container(height=400):
                     trending_cols = st.columns(2)
@@ -136,6 +185,8 @@ def show_home_page(set_page_callback):
                         if movie.get('poster_path'):
                             with trending_cols[i % 2]:
                                 st.image(f"https://image.tmdb.org/t/p/w200{movie.get('poster_path')}", caption=movie.get('title'), use_container_width=True)
+            elif get_scheduler().status()['jobs']['trending']['runs'] == 0:
+                st.info("Fetching today's trending titles in the background...")
             else:
                 st.warning("Could not connect to TMDb. Please check API key or network connection.")
         st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,216 @@
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+import pandas as pd
+from utils.data_loader import load_data, data_version, PLATFORM_FILES
+from utils.geography import unmatched_countries
+from utils.bitmap_index import selection_key
+from utils.dashboard_spec import DASHBOARDS
+from utils.page_planner import plan_page, page_aggregates
+from utils.insights import INSIGHTS
+from utils.tmdb_enrichment import enrichment_version
+from components.cross_filters import render_cross_filters
+from components.description_insights import show_description_insights
+from components.churn_view import show_catalog_churn
+
+def _style(fig, theme, **layout):
+    fig.update_layout(template=theme['template'], paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)', **layout)
+    return fig
+
+def _type_pie(data, chart, theme):
+    type_colors = theme.get('type_colors', dict(zip(['Movie', 'TV Show'], theme['colors'])))
+    return _style(px.pie(data, values=data.values, names=data.index, color=data.index,
+                         color_discrete_map=type_colors), theme)
+
+def _duration_histogram(data, chart, theme):
+    fig = go.Figure()
+    fig.add_trace(go.Histogram(x=data['Movie'], name='Movies (mins)', marker_color=theme['colors'][0]))
+    fig.add_trace(go.Histogram(x=data['TV Show'], name='TV Shows (seasons)', marker_color=theme['colors'][1]))
+    fig.update_traces(opacity=0.75)
+    return _style(fig, theme, barmode='overlay')
+
+def _hbar(data, chart, theme):
+    top = data.nlargest(chart.get('n', 10))
+    x_label, y_label = chart.get('labels', ('x', 'y'))
+    fig = px.bar(top, x=top.values, y=top.index, orientation='h', color=top.values,
+                 color_continuous_scale=chart.get('scale', theme['scale']), labels={'x': x_label, 'y': y_label})
+    return _style(fig, theme, yaxis={'categoryorder': 'total ascending'})
+
+def _vbar(data, chart, theme):
+    top = data.nlargest(chart.get('n', 10))
+    return _style(px.bar(top, y=top.values, x=top.index, color=top.values,
+                         color_continuous_scale=chart.get('scale', theme['scale'])), theme)
+
+def _sequential(theme):
+    return getattr(px.colors.sequential, f"{theme['scale']}_r")
+
+def _donut(data, chart, theme):
+    top = data.nlargest(chart.get('n', 10))
+    return _style(px.pie(top, values=top.values, names=top.index, hole=chart.get('hole', 0.5),
+                         color_discrete_sequence=_sequential(theme)), theme)
+
+def _funnel(data, chart, theme):
+    top = data.nlargest(chart.get('n', 10))
+    return _style(px.funnel(top, x=top.values, y=top.index, color_discrete_sequence=_sequential(theme)), theme)
+
+def _treemap(data, chart, theme):
+    top = data.nlargest(chart.get('n', 10))
+    return _style(px.treemap(top, path=[top.index], values=top.values, color=top.values,
+                             color_continuous_scale=theme['scale']), theme)
+
+def _series_chart(plot, line_width):
+    def render(data, chart, theme):
+        x_label, y_label = chart.get('labels', ('x', 'y'))
+        fig = plot(data, x=data.index, y=data.values, markers=True, labels={'x': x_label, 'y': y_label})
+        fig.update_traces(line_color=theme['colors'][chart.get('color', 0)], line_width=line_width)
+        return _style(fig, theme)
+    return render
+
+def _column(data, chart, theme):
+    x_label, y_label = chart.get('labels', ('x', 'y'))
+    fig = px.bar(data, x=data.index, y=data.values, labels={'x': x_label, 'y': y_label})
+    fig.update_traces(marker_color=theme['colors'][chart.get('color', 0)])
+    return _style(fig, theme)
+
+def _polar(data, chart, theme):
+    fig = px.line_polar(data, r=data.values, theta=data.index, line_close=True,
+                        color_discrete_sequence=[theme['colors'][chart.get('color', 0)]])
+    fig.update_traces(fill='toself')
+    return _style(fig, theme)
+
+def _histogram(data, chart, theme):
+    if 'max' in chart:
+        data = data[data <= chart['max']]
+    fig = px.histogram(x=data, nbins=chart.get('nbins', 20), title=chart.get('figure_title'),
+                       labels={'x': chart.get('x_label', 'x')},
+                       color_discrete_sequence=[theme['colors'][chart.get('color', 0)]])
+    return _style(fig, theme)
+
+# Chart kind -> renderer of (aggregate, chart spec, theme) returning a figure
+CHARTS = {
+    'type_pie': _type_pie,
+    'duration_histogram': _duration_histogram,
+    'hbar': _hbar,
+    'vbar': _vbar,
+    'donut': _donut,
+    'funnel': _funnel,
+    'treemap': _treemap,
+    'area': _series_chart(px.area, 2),
+    'line': _series_chart(px.line, 3),
+    'column': _column,
+    'polar': _polar,
+    'histogram': _histogram,
+}
+
+def _is_empty(data):
+    if isinstance(data, dict):
+        return all(len(values) == 0 for values in data.values())
+    if isinstance(data, pd.Series):
+        return data.sum() == 0
+    return len(data) == 0
+
+def _show_geography(platform, geo_counts, chart, theme):
+    if geo_counts.empty:
+        st.info("No titles with a known country match the current filters.")
+        return
+    if chart['chart'] == 'country_bar':
+        geo_counts = geo_counts.head(chart.get('n', 15))
+        fig = px.bar(geo_counts, y=geo_counts['titles'].to_numpy(), x=geo_counts['country'].to_numpy(),
+                     color=geo_counts['titles'].to_numpy(), color_continuous_scale=theme['scale'],
+                     labels={'y': 'Number of Titles', 'x': 'Country'})
+        st.plotly_chart(_style(fig, theme), use_container_width=True)
+        return
+
+    fig_map = px.choropleth(locations=geo_counts['iso3'].to_numpy(),
+                            locationmode='ISO-3',
+                            color=geo_counts['titles'].to_numpy(),
+                            hover_name=geo_counts['country'].to_numpy(),
+                            color_continuous_scale=getattr(px.colors.sequential, theme['scale']),
+                            title="Global Content Production Hotspots")
+    _style(fig_map, theme, geo=dict(showframe=False, showcoastlines=False, projection_type='equirectangular'))
+    st.plotly_chart(fig_map, use_container_width=True)
+    unmatched = unmatched_countries(platform)
+    if not unmatched.empty:
+        st.caption(f"Not shown on the map (no ISO-3 code): {', '.join(unmatched.index)}")
+
+def _show_chart(platform, aggregates, chart, theme):
+    st.markdown(f"##### {chart['title']}")
+    data = aggregates[chart['measure']]
+    if chart['chart'] in ('choropleth', 'country_bar'):
+        _show_geography(platform, data, chart, theme)
+        return
+    if _is_empty(data):
+        st.info("No titles match the current filters.")
+        return
+    if 'mean_label' in chart:
+        st.metric(label=chart['mean_label'], value=f"{data.mean():.1f}")
+    fig = CHARTS[chart['chart']](data, chart, theme)
+    st.plotly_chart(fig, use_container_width=True)
+
+def _kpi_value(aggregates, kpi):
+    data = aggregates[kpi['measure']]
+    if kpi['pick'] == 'total':
+        return f"{data:,}" if isinstance(data, int) else f"{int(data.sum()):,}"
+    if kpi['pick'] in ('top', 'last'):
+        data = data[data > 0]
+        if data.empty:
+            return "N/A"
+        return str(data.index[0] if kpi['pick'] == 'top' else data.index.max())
+    return f"{int(data.get(kpi['pick'], 0)):,}"
+
+def show_platform_dashboard(platform):
+    """Renders a platform's dashboard from its `DASHBOARDS` spec."""
+    spec = DASHBOARDS[platform]
+    theme = spec['theme']
+    st.markdown(f"## {spec['title']}")
+
+    # Read the served versions once, so every chart of this rerun comes from the same ones
+    version, enrichment = data_version(), enrichment_version()
+    if load_data(platform, version) is None:
+        st.error(f"{platform} dataset not found. Please ensure `{PLATFORM_FILES[platform]}` is in the `data` folder.")
+        return
+
+    # --- Filters ---
+    _, selection = render_cross_filters(platform, key_prefix=spec['key_prefix'], apply=False, version=version)
+    insights, insight_measures = INSIGHTS.get(spec.get('insights'), (None, ()))
+    aggregates = page_aggregates(platform, selection_key(selection), plan_page(spec, insight_measures),
+                                 version, enrichment)
+    # KPIs scoped to the whole catalog read the unfiltered aggregates, which the scheduler keeps warm
+    unfiltered = (page_aggregates(platform, (), plan_page(spec, insight_measures), version, enrichment)
+                  if any(kpi.get('scope') == 'catalog' for kpi in spec['kpis']) else aggregates)
+
+    # --- KPI Section ---
+    with st.container(border=True):
+        kpi_cols = st.columns(len(spec['kpis']))
+        for col, kpi in zip(kpi_cols, spec['kpis']):
+            kpi_aggregates = unfiltered if kpi.get('scope') == 'catalog' else aggregates
+            col.metric(label=kpi['label'], value=_kpi_value(kpi_aggregates, kpi))
+
+    # --- Main Dashboard with Tabs ---
+    for tab, tab_spec in zip(st.tabs([tab['label'] for tab in spec['tabs']]), spec['tabs']):
+        with tab:
+            panel = tab_spec.get('panel')
+            if panel == 'descriptions':
+                show_description_insights(platform, selection, colormap=theme['colormap'], template=theme['template'])
+                continue
+            if panel == 'churn':
+                show_catalog_churn(platform, key_prefix=spec['key_prefix'], template=theme['template'])
+                continue
+
+            st.subheader(tab_spec['subheader'])
+            required = tab_spec.get('requires')
+            if required:
+                if not aggregates[required]:
+                    st.info(tab_spec['missing'] if not enrichment
+                            else f"No titles matching the current filters are {tab_spec['coverage']}.")
+                    continue
+                st.caption(f"{aggregates[required]:,} of {aggregates['titles']:,} titles {tab_spec['coverage']}.")
+            charts = tab_spec['charts']
+            cols = st.columns(tab_spec.get('widths', len(charts))) if len(charts) > 1 else [st.container()]
+            for col, chart in zip(cols, charts):
+                with col:
+                    _show_chart(platform, aggregates, chart, theme)
+
+    # --- BI Insights Section ---
+    if insights:
+        insights(aggregates)
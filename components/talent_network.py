@@ -0,0 +1,108 @@
+import streamlit as st
+import plotly.express as px
+import plotly.graph_objects as go
+import numpy as np
+from utils.data_loader import PLATFORM_FILES
+from utils.people_graph import get_collaboration_stats
+
+ROLE_OPTIONS = {"Everyone": None, "Cast": 'cast', "Directors": 'director'}
+RANK_OPTIONS = {"Centrality": 'centrality', "Collaborators": 'collaborators', "Titles": 'titles'}
+
+def _ego_network_figure(stats, person_id, collaborators):
+    """Circular layout of a person and their top collaborators, with the links among them."""
+    ids = np.concatenate([[person_id], collaborators['person_id'].to_numpy()])
+    angles = np.linspace(0, 2 * np.pi, len(ids) - 1, endpoint=False)
+    x = np.concatenate([[0.0], np.cos(angles)])
+    y = np.concatenate([[0.0], np.sin(angles)])
+
+    links = stats.cooccurrence[ids][:, ids].tocoo()
+    upper = links.row < links.col
+    edge_x, edge_y = [], []
+    for a, b in zip(links.row[upper], links.col[upper]):
+        edge_x += [x[a], x[b], None]
+        edge_y += [y[a], y[b], None]
+
+    titles = stats.title_counts[ids]
+    fig = go.Figure()
+    fig.add_trace(go.Scatter(x=edge_x, y=edge_y, mode='lines', hoverinfo='skip',
+                             line=dict(width=0.6, color='rgba(180,180,180,0.4)')))
+    fig.add_trace(go.Scatter(x=x, y=y, mode='markers+text', text=stats.graph.people[ids], textposition='top center',
+                             hovertext=[f"{name}: {count} titles" for name, count in zip(stats.graph.people[ids], titles)],
+                             hoverinfo='text',
+                             marker=dict(size=10 + 30 * titles / titles.max(), color=stats.centrality[ids],
+                                         colorscale='Purples', line=dict(width=1, color='white'))))
+    fig.update_layout(template='plotly_dark', paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                      showlegend=False, height=550, xaxis=dict(visible=False), yaxis=dict(visible=False))
+    return fig
+
+def show_talent_network():
+    st.markdown("## 🎭 Talent Network")
+    st.markdown("Who works with whom across every platform, from the `cast` and `director` credits.")
+
+    platforms = st.multiselect("Platforms", list(PLATFORM_FILES), placeholder="All", key="talent_platform")
+    stats = get_collaboration_stats(platforms)
+    if stats is None:
+        st.error("Catalog data not found. Please ensure the platform CSVs are in the `data` folder.")
+        return
+
+    credited = int((stats.title_counts > 0).sum())
+    if credited == 0:
+        st.info("No cast or director credits for the selected platforms.")
+        return
+
+    kpi_cols = st.columns(4)
+    kpi_cols[0].metric(label="People", value=f"{credited:,}")
+    kpi_cols[1].metric(label="Credits", value=f"{int(stats.title_counts.sum()):,}")
+    kpi_cols[2].metric(label="Collaborating Pairs", value=f"{stats.cooccurrence.nnz // 2:,}")
+    kpi_cols[3].metric(label="Avg. Collaborators", value=f"{stats.degree[stats.title_counts > 0].mean():.1f}")
+
+    tab1, tab2, tab3 = st.tabs(["⭐ Most Connected", "🤝 Collaborators", "🎬 Director–Actor Partnerships"])
+
+    with tab1:
+        col1, col2 = st.columns(2)
+        role = col1.radio("Credited as", list(ROLE_OPTIONS), horizontal=True, key="talent_role")
+        rank_by = col2.radio("Rank by", list(RANK_OPTIONS), horizontal=True, key="talent_rank")
+        top = stats.top_people(20, by=RANK_OPTIONS[rank_by], role=ROLE_OPTIONS[role])
+        fig_top = px.bar(top, x=RANK_OPTIONS[rank_by], y='person', orientation='h',
+                         color='collaborators', color_continuous_scale='Purples',
+                         hover_data=['titles', 'collaborators', 'platforms'],
+                         labels={'person': 'Person', RANK_OPTIONS[rank_by]: rank_by})
+        fig_top.update_layout(template='plotly_dark', paper_bgcolor='rgba(0,0,0,0)', plot_bgcolor='rgba(0,0,0,0)',
+                              yaxis={'categoryorder': 'total ascending'}, height=600)
+        st.plotly_chart(fig_top, use_container_width=True)
+        st.caption("Centrality is weighted PageRank over shared titles, scaled so the most central person scores 1.")
+
+    with tab2:
+        query = st.text_input("Find a person", placeholder="e.g. Shah Rukh Khan", key="talent_search")
+        matches = stats.find_people(query) if query else stats.top_people(50, by='titles')['person_id'].to_numpy()
+        if len(matches) == 0:
+            st.warning(f"No one named like '{query}' in the selected catalogs.")
+        else:
+            person_id = st.selectbox("Person", matches, format_func=lambda i: stats.graph.people[i],
+                                     key="talent_person")
+            collaborators = stats.top_collaborators(person_id, 15)
+            if collaborators.empty:
+                st.info(f"{stats.graph.people[person_id]} shares no titles with anyone else here.")
+            else:
+                col1, col2 = st.columns([3, 2])
+                with col1:
+                    st.markdown("##### Collaboration Circle")
+                    st.plotly_chart(_ego_network_figure(stats, person_id, collaborators), use_container_width=True)
+                with col2:
+                    st.markdown("##### Top Collaborators")
+                    st.dataframe(collaborators[['person', 'shared_titles', 'titles', 'platforms']],
+                                 use_container_width=True, hide_index=True)
+
+    with tab3:
+        partnerships = stats.top_partnerships(20)
+        if partnerships.empty:
+            st.info("No director–actor pairs in the selected catalogs.")
+        else:
+            partnerships['pair'] = partnerships['director'] + " × " + partnerships['actor']
+            fig_pairs = px.bar(partnerships, x='titles', y='pair', orientation='h',
+                               color='titles', color_continuous_scale='Purples',
+                               labels={'titles': 'Titles Together', 'pair': 'Director × Actor'})
+            fig_pairs.update_layout(template='plotly_dark', paper_bgcolor='rgba(0,0,0,0)',
+                                    plot_bgcolor='rgba(0,0,0,0)', yaxis={'categoryorder': 'total ascending'},
+                                    height=600)
+            st.plotly_chart(fig_pairs, use_container_width=True)
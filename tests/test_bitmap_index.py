@@ -0,0 +1,86 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.bitmap_index import BitmapIndex, month_ordinal
+from utils.data_loader import compact_frame
+
+
+@pytest.fixture
+def catalog():
+    rng = np.random.default_rng(7)
+    n = 500
+    genres = ["Dramas", "Comedies", "Documentaries", "Action & Adventure", "Kids' TV"]
+    countries = ["United States", "India", "United Kingdom", "France", None]
+
+    def listed(options):
+        picked = rng.choice([o for o in options if o], size=rng.integers(1, 3), replace=False)
+        return ", ".join(picked)
+
+    df = pd.DataFrame({
+        'type': rng.choice(["Movie", "TV Show"], n),
+        'rating': rng.choice(["TV-MA", "PG-13", "R", None], n),
+        'listed_in': [listed(genres) for _ in range(n)],
+        'country': [listed(countries) if rng.random() > 0.1 else None for _ in range(n)],
+        'release_year': rng.integers(1990, 2022, n),
+        'date_added': pd.to_datetime("2015-01-01") + pd.to_timedelta(rng.integers(0, 2500, n), unit='D'),
+    })
+    df.loc[::17, 'date_added'] = pd.NaT
+    return compact_frame(df)
+
+
+def _tokens(column):
+    return column.astype('string').fillna('').str.split(',').apply(lambda values: {v.strip() for v in values})
+
+
+def _reference(df, selection):
+    mask = pd.Series(True, index=df.index)
+    for dim, selected in selection.items():
+        if dim == 'type':
+            mask &= df['type'].isin(selected)
+        elif dim == 'rating':
+            mask &= df['rating'].isin(selected)
+        elif dim in ('genre', 'country'):
+            tokens = _tokens(df['listed_in' if dim == 'genre' else 'country'])
+            mask &= tokens.apply(lambda values: bool(values & set(selected)))
+        elif dim == 'release_year':
+            mask &= df['release_year'].between(*selected)
+        elif dim == 'date_added':
+            months = pd.Series(month_ordinal(df['date_added']), index=df.index)
+            mask &= (months >= 0) & months.between(*selected)
+    return mask.to_numpy()
+
+
+@pytest.mark.parametrize('selection', [
+    {'type': ("Movie",)},
+    {'genre': ("Dramas", "Comedies")},
+    {'country': ("India",), 'rating': ("TV-MA", "R")},
+    {'release_year': (2000, 2010)},
+    {'release_year': (1850, 1995)},
+    {'release_year': (2030, 2040)},
+    {'date_added': (2016 * 12, 2017 * 12 + 5)},
+    {'genre': ("Documentaries",), 'release_year': (2005, 2021), 'type': ("TV Show",)},
+])
+def test_selection_matches_pandas(catalog, selection):
+    index = BitmapIndex(catalog)
+    bitset = index.evaluate(selection)
+    expected = _reference(catalog, selection)
+    np.testing.assert_array_equal(index.to_mask(bitset), expected)
+    assert index.count(bitset) == expected.sum()
+
+
+def test_empty_selection_keeps_every_row(catalog):
+    index = BitmapIndex(catalog)
+    assert index.to_mask(index.evaluate({'genre': (), 'type': None})).all()
+
+
+def test_unknown_values_match_nothing(catalog):
+    index = BitmapIndex(catalog)
+    assert index.count(index.evaluate({'genre': ("Not A Genre",)})) == 0
+
+
+def test_multi_value_counts_match_pandas(catalog):
+    index = BitmapIndex(catalog)
+    expected = _tokens(catalog['listed_in']).explode().value_counts()
+    counts = dict(zip(index.values['genre'], index.counts['genre']))
+    assert counts == expected.to_dict()
@@ -0,0 +1,70 @@
+import os
+
+import pandas as pd
+import pytest
+
+from utils import data_loader as dl
+
+
+def _write(path, rows):
+    pd.DataFrame(rows).to_csv(path, index=False)
+
+
+def _titles(prefix, n):
+    return [{'show_id': f"{prefix}{i}", 'type': "Movie", 'title': f"{prefix} title {i}", 'director': None,
+             'cast': f"Actor {i}", 'country': "India", 'date_added': "January 1, 2020", 'release_year': 2019,
+             'rating': "PG", 'duration': "90 min", 'listed_in': "Dramas", 'description': f"About {prefix} {i}."}
+            for i in range(n)]
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(dl, 'data_path', lambda filename: os.path.join(tmp_path, filename))
+    _write(tmp_path / dl.PLATFORM_FILES["Netflix"], _titles("n", 3))
+    _write(tmp_path / dl.PLATFORM_FILES["Hulu"], _titles("h", 2))
+    return tmp_path
+
+
+def test_snapshot_holds_compact_frames_without_text(data_dir):
+    snapshot = dl._read_snapshot()
+    assert set(snapshot.frames) == {"Netflix", "Hulu"}
+    assert snapshot.frame("Disney+") is None
+    for df in snapshot.frames.values():
+        assert not set(dl.TEXT_COLUMNS) & set(df.columns)
+
+    combined = snapshot.frame()
+    assert combined['platform'].tolist() == ["Netflix"] * 3 + ["Hulu"] * 2
+    assert combined['show_id'].tolist() == ["n0", "n1", "n2", "h0", "h1"]
+
+
+def test_text_is_read_on_demand_and_aligned(data_dir):
+    snapshot = dl._read_snapshot()
+    text = dl.load_text_columns("Hulu", snapshot)
+    assert text.index.equals(snapshot.frame("Hulu").index)
+    assert text['description'].tolist() == ["About h 0.", "About h 1."]
+    assert dl.load_text_columns(None, snapshot)['cast'].tolist() == [f"Actor {i}" for i in (0, 1, 2, 0, 1)]
+
+
+def test_text_of_a_replaced_file_is_blank_not_misaligned(data_dir):
+    snapshot = dl._read_snapshot()
+    _write(data_dir / dl.PLATFORM_FILES["Netflix"], _titles("x", 3))
+    text = dl.load_text_columns("Netflix", snapshot)
+    assert len(text) == 3
+    assert text['description'].isna().all()
+
+
+def test_compact_frame_dtypes():
+    raw = pd.DataFrame(_titles("n", 4)).drop(columns=dl.TEXT_COLUMNS).assign(platform="Netflix")
+    raw.loc[1, 'date_added'] = " March 5, 2021"
+    df = dl.compact_frame(raw)
+
+    for col in dl.CATEGORICAL_COLUMNS:
+        assert isinstance(df[col].dtype, pd.CategoricalDtype), col
+    for col in dl.STRING_COLUMNS:
+        assert isinstance(df[col].dtype, pd.StringDtype) and df[col].dtype.storage == 'pyarrow', col
+    assert df['release_year'].dtype == 'int16'
+    assert pd.api.types.is_datetime64_any_dtype(df['date_added'])
+    assert df['date_added'].iloc[1] == pd.Timestamp("2021-03-05")
+    assert (df.dtypes != object).all()
+    # The input frame is left as it was
+    assert raw['type'].dtype != 'category'
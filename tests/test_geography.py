@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_loader import data_path
+from utils.geography import COUNTRY_CODES_FILE, CountryIndex
+
+
+@pytest.fixture(scope='module')
+def codes():
+    df = pd.read_csv(data_path(COUNTRY_CODES_FILE), keep_default_na=False)
+    return dict(zip(df['name'].str.lower(), df['iso3'])), df.drop_duplicates('iso3').set_index('iso3')['name'].to_dict()
+
+
+COUNTRIES = pd.Series([
+    "United States",
+    "West Germany",
+    "West Germany, Germany",          # two aliases of one code count once
+    ", South Korea",                  # leading comma from a scraped list
+    "France,",                        # trailing comma
+    "united kingdom, Atlantis",       # case-insensitive, plus an unknown name
+    None,
+    "Atlantis",
+    "India, United States",
+], dtype='category', name='country')
+
+
+def _counts(index, mask=None):
+    return index.counts(mask).set_index('iso3')['titles'].to_dict()
+
+
+def test_aliases_and_stray_commas_resolve(codes):
+    index = CountryIndex(COUNTRIES, *codes)
+    assert _counts(index) == {'USA': 2, 'DEU': 2, 'KOR': 1, 'FRA': 1, 'GBR': 1, 'IND': 1}
+    names = index.counts().set_index('iso3')['country']
+    assert names['DEU'] == "Germany" and names['KOR'] == "South Korea"
+
+
+def test_unmatched_names_are_reported_with_title_counts(codes):
+    index = CountryIndex(COUNTRIES, *codes)
+    assert index.unmatched.to_dict() == {"Atlantis": 2}
+
+
+@pytest.mark.parametrize('rows', [[0, 8], [1, 2, 3], [6, 7], []])
+def test_masked_counts_match_explode_reference(codes, rows):
+    index = CountryIndex(COUNTRIES, *codes)
+    aliases, _ = codes
+    mask = np.isin(np.arange(len(COUNTRIES)), rows)
+    exploded = (COUNTRIES[mask].astype(object).str.split(',').explode().str.strip().str.lower()
+                .map(aliases).dropna().reset_index().drop_duplicates())
+    expected = exploded['country'].value_counts().to_dict() if not exploded.empty else {}
+    assert _counts(index, mask) == expected
+
+
+def test_label_counts_take_per_label_totals(codes):
+    index = CountryIndex(COUNTRIES, *codes)
+    per_label = np.bincount(index.row_codes[index.row_codes >= 0], minlength=index.n_labels) * 3
+    assert index.label_counts(per_label).set_index('iso3')['titles'].to_dict() == {
+        code: 3 * titles for code, titles in _counts(index).items()}
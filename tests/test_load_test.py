@@ -0,0 +1,76 @@
+import math
+
+from streamlit.runtime.runtime import Runtime
+from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+
+from tools.load_test import DEFAULT_SLOS, check_slos, concurrent_app_tests, format_report, summarize
+
+
+def _result(latencies, errors=(), state_bytes=100):
+    return {'session': 0, 'journey': 'browse_all', 'latencies_ms': list(latencies),
+            'errors': list(errors), 'state_bytes': state_bytes}
+
+
+def _report(**overrides):
+    report = summarize([_result([100, 200, 300]), _result([400, 500])], concurrency=2, wall_time=2.0,
+                       rss_growth_mb=4.0)
+    report.update(overrides)
+    return report
+
+
+def test_summarize_percentiles_and_rates():
+    report = _report()
+    assert report['sessions'] == 2
+    assert report['reruns'] == 5
+    assert report['p50_ms'] == 300
+    assert report['max_ms'] == 500
+    assert report['throughput'] == 2.5
+    assert report['error_rate'] == 0
+    assert report['session_mb'] == 2.0
+
+
+def test_shrinking_rss_is_not_negative_memory_per_session():
+    report = summarize([_result([100])], concurrency=1, wall_time=1.0, rss_growth_mb=-3.1)
+    assert report['rss_growth_mb'] == -3.1
+    assert report['session_mb'] == 0.0
+    memory_line = next(line for line in format_report(report, DEFAULT_SLOS) if line.startswith("Memory"))
+    assert "RSS -3.1 MB" in memory_line
+    assert "+-" not in memory_line
+
+
+def test_default_slos_flag_a_slow_run():
+    slow = summarize([_result([800] * 90 + [4000] * 10)], concurrency=50, wall_time=60.0, rss_growth_mb=0.0)
+    assert [v.split()[0] for v in check_slos(slow, DEFAULT_SLOS)] == ['p95_ms']
+    assert check_slos(_report(), DEFAULT_SLOS) == []
+
+
+def test_check_slos_passes_within_objectives():
+    slos = dict(DEFAULT_SLOS, p95_ms=1000, p99_ms=1000, session_mb=10)
+    assert check_slos(_report(), slos) == []
+
+
+def test_check_slos_reports_each_violation():
+    slos = {'p95_ms': 100, 'p99_ms': None, 'error_rate': 0.0, 'session_mb': 1.0, 'min_throughput': 10}
+    report = _report(errors=1, error_rate=0.2)
+    violations = check_slos(report, slos)
+    assert [v.split()[0] for v in violations] == ['p95_ms', 'error_rate', 'session_mb', 'throughput']
+
+
+def test_a_run_without_completed_reruns_fails():
+    report = summarize([_result([], errors=["no widget"])], concurrency=1, wall_time=1.0, rss_growth_mb=0.0)
+    assert math.isnan(report['p95_ms'])
+    assert any(v.startswith('p95_ms') for v in check_slos(report, DEFAULT_SLOS))
+
+
+def test_format_report_lists_objectives_and_failures():
+    report = _report(slo_violations=["p95_ms = 400.000 exceeds 100"])
+    lines = format_report(report, {'p95_ms': 100, 'error_rate': 0.0, 'min_throughput': 0.0})
+    assert "SLOs: p95_ms <= 100, error_rate <= 0" in lines
+    assert lines[-1] == "SLO FAILED: p95_ms = 400.000 exceeds 100"
+
+
+def test_concurrent_app_tests_restores_patches():
+    originals = Runtime.__dict__['instance'], Runtime.__dict__['exists'], ScriptCache.get_bytecode
+    with concurrent_app_tests():
+        assert ScriptCache.get_bytecode is not originals[2]
+    assert (Runtime.__dict__['instance'], Runtime.__dict__['exists'], ScriptCache.get_bytecode) == originals
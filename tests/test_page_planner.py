@@ -0,0 +1,49 @@
+import pandas as pd
+import pytest
+
+from utils.geography import CountryIndex
+from utils.page_planner import MEASURES, ColumnStore
+
+ALIASES = {'united states': 'USA', 'usa': 'USA', 'india': 'IND', 'west germany': 'DEU', 'germany': 'DEU'}
+NAMES = {'USA': "United States", 'IND': "India", 'DEU': "Germany"}
+
+
+@pytest.fixture
+def catalog():
+    return pd.DataFrame({
+        'title': ["A", "B", "C", "D", "E"],
+        'type': ["Movie", "TV Show", None, "Movie", "TV Show"],
+        'rating': ["R", "TV-MA", "PG", None, "TV-MA"],
+        'listed_in': ["Dramas", "Comedies, Dramas", "Dramas", None, "Comedies"],
+        'country': ["United States", "India, United States", "West Germany, Germany", "Atlantis", None],
+        'director': ["X", "X, Y", None, "Y", "Z"],
+        'duration': ["90 min", "2 Seasons", "100 min", None, "1 Season"],
+        'release_year': [2019, 2020, 2018, 2021, 2015],
+        'date_added': pd.to_datetime(["2020-01-05", "2021-03-01", None, "2021-07-09", "2019-12-31"]),
+    })
+
+
+def _store(df):
+    return ColumnStore(df, geo=CountryIndex(df['country'], ALIASES, NAMES))
+
+
+def test_untyped_titles_are_in_neither_duration_histogram(catalog):
+    durations = MEASURES['durations'](_store(catalog))
+    assert durations['Movie'].tolist() == [90.0]
+    assert sorted(durations['TV Show'].tolist()) == [1.0, 2.0]
+
+
+def test_country_geo_matches_the_country_index(catalog):
+    store = _store(catalog)
+    geo = CountryIndex(catalog['country'], ALIASES, NAMES)
+    mask = catalog['type'].eq("TV Show").to_numpy()
+    pd.testing.assert_frame_equal(MEASURES['country_geo'](store), geo.counts())
+    pd.testing.assert_frame_equal(MEASURES['country_geo'](store.select(mask)), geo.counts(mask))
+    # "West Germany, Germany" is one title for Germany
+    assert dict(zip(geo.counts()['iso3'], geo.counts()['titles'])) == {'USA': 2, 'IND': 1, 'DEU': 1}
+
+
+def test_list_columns_count_each_listed_value(catalog):
+    store = _store(catalog)
+    assert MEASURES['director_counts'](store).to_dict() == {'X': 2, 'Y': 2, 'Z': 1}
+    assert MEASURES['genre_counts'](store).to_dict() == {'Dramas': 3, 'Comedies': 2}
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.people_graph import CollaborationStats, PeopleGraph
+
+
+@pytest.fixture
+def graph():
+    rng = np.random.default_rng(3)
+    people = [f"Person {i}" for i in range(40)]
+    n = 200
+    catalog = pd.DataFrame({
+        'platform': rng.choice(["Netflix", "Hulu", "Disney+"], n),
+        'director': [", ".join(rng.choice(people, rng.integers(1, 3), replace=False)) if rng.random() > 0.2
+                     else None for _ in range(n)],
+    })
+    text = pd.DataFrame({'cast': [", ".join(rng.choice(people, rng.integers(1, 6), replace=False)) for _ in range(n)]})
+    return PeopleGraph(catalog, text)
+
+
+def test_combined_platforms_match_the_filtered_graph(graph):
+    platforms = graph.platforms[graph.platform_codes]
+    parts = [graph.subgraph(platforms == platform) for platform in ["Netflix", "Hulu"]]
+    combined = CollaborationStats.combine(parts)
+    expected = graph.subgraph(np.isin(platforms, ["Netflix", "Hulu"]))
+
+    assert (combined.cooccurrence != expected.cooccurrence).nnz == 0
+    assert (combined.partnerships != expected.partnerships).nnz == 0
+    np.testing.assert_array_equal(combined.title_counts, expected.title_counts)
+    np.testing.assert_array_equal(combined.degree, expected.degree)
+    np.testing.assert_array_equal(combined.platform_counts, expected.platform_counts)
+    for role in expected.role_counts:
+        np.testing.assert_array_equal(combined.role_counts[role], expected.role_counts[role])
+    np.testing.assert_allclose(combined.centrality, expected.centrality)
+
+
+def test_every_platform_combined_is_the_whole_graph(graph):
+    platforms = graph.platforms[graph.platform_codes]
+    combined = CollaborationStats.combine([graph.subgraph(platforms == p) for p in graph.platforms])
+    whole = graph.subgraph()
+    np.testing.assert_array_equal(combined.title_counts, whole.title_counts)
+    pd.testing.assert_frame_equal(combined.top_people(10), whole.top_people(10))
@@ -0,0 +1,159 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from utils import scheduler
+from utils.scheduler import BackgroundScheduler, JITTER_FRACTION, single_flight
+
+
+@pytest.fixture(autouse=True)
+def shared_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(scheduler, 'SHARED_DIR', str(tmp_path))
+    return tmp_path
+
+
+def _hold_lock(name, acquired, release):
+    with single_flight(name):
+        acquired.set()
+        release.wait(5)
+
+
+def test_single_flight_follower_times_out_then_acquires():
+    acquired, release = threading.Event(), threading.Event()
+    leader = threading.Thread(target=_hold_lock, args=('job', acquired, release))
+    leader.start()
+    assert acquired.wait(5)
+    try:
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            with single_flight('job', timeout=0.3):
+                pass
+        assert time.monotonic() - started >= 0.3
+        with single_flight('other', timeout=0.3):  # locks are per name
+            pass
+    finally:
+        release.set()
+        leader.join()
+    with single_flight('job', timeout=0.3):
+        pass
+
+
+def test_single_flight_serializes_leaders():
+    inside, overlaps = [], []
+
+    def work():
+        with single_flight('job', timeout=5):
+            if inside:
+                overlaps.append(True)
+            inside.append(True)
+            time.sleep(0.05)
+            inside.pop()
+
+    threads = [threading.Thread(target=work) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not overlaps
+
+
+def _scheduler_with(job, interval=10):
+    background = BackgroundScheduler()
+    background._jobs = {'trending': {'interval': interval, 'run': job}}
+    background._status = {'trending': background._status['trending']}
+    return background
+
+
+def test_run_job_records_success_and_jittered_next_run():
+    calls = []
+    background = _scheduler_with(lambda: calls.append(1), interval=100)
+    before = time.time()
+    background._run_job('trending')
+    status = background._status['trending']
+    assert calls == [1] and status['runs'] == 1 and not status['running']
+    assert status['last_success'] >= before and status['last_error'] is None
+    delay = status['next_run'] - time.time()
+    assert 100 * (1 - JITTER_FRACTION) - 1 <= delay <= 100 * (1 + JITTER_FRACTION)
+
+
+def test_run_job_keeps_going_after_a_failure():
+    outcomes = iter([RuntimeError("TMDb down"), None])
+
+    def job():
+        error = next(outcomes)
+        if error:
+            raise error
+
+    background = _scheduler_with(job)
+    background._run_job('trending')
+    status = background._status['trending']
+    assert status['last_error'] == "RuntimeError: TMDb down" and status['last_success'] is None
+    background._run_job('trending')
+    assert status['runs'] == 2 and status['last_error'] is None and status['last_success'] is not None
+
+
+def test_job_loop_reruns_on_its_interval_until_stopped():
+    ran = threading.Event()
+    calls = []
+
+    def job():
+        calls.append(time.monotonic())
+        if len(calls) == 3:
+            ran.set()
+
+    background = _scheduler_with(job, interval=0.05)
+    thread = threading.Thread(target=background._run, args=('trending',), daemon=True)
+    thread.start()
+    assert ran.wait(5)
+    background.stop()
+    thread.join(5)
+    assert not thread.is_alive()
+    gaps = [later - earlier for earlier, later in zip(calls, calls[1:])]
+    assert all(gap >= 0.05 * (1 - JITTER_FRACTION) - 0.01 for gap in gaps)
+
+
+@pytest.fixture
+def catalog_calls(monkeypatch):
+    """Replaces the catalog steps of check_catalog with recorders."""
+    calls = []
+    state = {'version': 'v1', 'snapshot_error': None}
+    monkeypatch.setattr(scheduler, 'catalog_fingerprint', lambda: state['version'])
+    monkeypatch.setattr(scheduler, 'catalog_snapshot', lambda version: SimpleNamespace(version=version))
+    monkeypatch.setattr(scheduler, 'enrichment_fingerprint', lambda: 'e1')
+    monkeypatch.setattr(scheduler, 'publish_data_version', lambda version: calls.append(('publish', version)))
+    monkeypatch.setattr(scheduler, 'publish_enrichment_version', lambda version: calls.append(('enrichment', version)))
+
+    def snapshot_all(source):
+        calls.append(('snapshots', source))
+        if state['snapshot_error']:
+            raise state['snapshot_error']
+
+    monkeypatch.setattr(scheduler, 'snapshot_all', snapshot_all)
+    monkeypatch.setattr(BackgroundScheduler, 'warm_catalog',
+                        lambda self, snapshot, enrichment: calls.append(('warm', snapshot.version)))
+    return calls, state
+
+
+def test_check_catalog_warms_before_publishing(catalog_calls):
+    calls, state = catalog_calls
+    background = BackgroundScheduler()
+    background.check_catalog()
+    assert calls == [('warm', 'v1'), ('publish', 'v1'), ('enrichment', 'e1'), ('snapshots', 'v1')]
+    background.check_catalog()  # nothing changed
+    assert len(calls) == 4
+    state['version'] = 'v2'
+    background.check_catalog()
+    assert calls[4:] == [('warm', 'v2'), ('publish', 'v2'), ('enrichment', 'e1'), ('snapshots', 'v2')]
+
+
+def test_failed_snapshot_does_not_rewarm(catalog_calls):
+    calls, state = catalog_calls
+    state['snapshot_error'] = RuntimeError("snapshot failed for Hulu: missing CSV")
+    background = BackgroundScheduler()
+    background._run_job('catalog')
+    assert background._status['catalog']['last_error'].startswith("RuntimeError: snapshot failed")
+    assert background._warmed == ('v1', 'e1')
+    background._run_job('catalog')
+    assert [name for name, _ in calls] == ['warm', 'publish', 'enrichment', 'snapshots']
@@ -0,0 +1,35 @@
+import numpy as np
+
+from utils import session_resources
+from utils.session_resources import SessionResourceManager
+
+
+def test_shared_caches_are_sized_on_reap_not_per_metrics_call(monkeypatch):
+    calls = []
+    monkeypatch.setattr(session_resources, 'shared_cache_bytes', lambda: calls.append(1) or 1234)
+    manager = SessionResourceManager()
+    for _ in range(3):
+        assert manager.metrics()['shared_cache_bytes'] is None
+    assert calls == []
+
+    manager.reap()
+    assert manager.metrics()['shared_cache_bytes'] == 1234
+    assert len(calls) == 1
+
+
+def test_session_budget_evicts_oldest_artefact():
+    manager = SessionResourceManager(session_budget=2000, process_budget=10_000)
+    manager.put('s1', 'a', np.zeros(100))
+    manager.put('s1', 'b', np.zeros(100))
+    manager.put('s1', 'c', np.zeros(100))
+    assert manager.get('s1', 'a') is None
+    assert manager.get('s1', 'c') is not None
+    assert manager.metrics()['evictions'] == 1
+
+
+def test_idle_sessions_are_reaped():
+    manager = SessionResourceManager(idle_seconds=10)
+    manager.put('s1', 'a', np.zeros(10))
+    manager.reap(now=manager._sessions['s1']['last_seen'] + 11)
+    metrics = manager.metrics()
+    assert (metrics['sessions'], metrics['bytes'], metrics['reaped_sessions']) == (0, 0, 1)
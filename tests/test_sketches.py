@@ -0,0 +1,136 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.data_loader import compact_frame
+from utils.sketches import (HyperLogLog, SketchStore, TDigest, TOP_K_CAPACITY, exact_summary, sketchable,
+                            _hash_strings, _quantile_values)
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    rng = np.random.default_rng(11)
+    n = 6000
+    # Zipf-ish weights so the top-k summaries overflow their capacity and carry error bounds
+    genres = [f"Genre {i}" for i in range(80)]
+    genre_weights = 1 / np.arange(1, 81)
+    directors = [f"Director {i}" for i in range(3000)]
+
+    def listed(options, weights, k):
+        return ", ".join(rng.choice(options, size=k, replace=False, p=weights / weights.sum()))
+
+    is_movie = rng.random(n) < 0.7
+    df = pd.DataFrame({
+        'platform': rng.choice(["Netflix", "Hulu", "Disney+"], n),
+        'type': np.where(is_movie, "Movie", "TV Show"),
+        'title': [f"Title {i}" for i in rng.integers(0, 5000, n)],
+        'director': [listed(directors, np.ones(3000), rng.integers(1, 3)) if rng.random() > 0.2 else None
+                     for _ in range(n)],
+        'listed_in': [listed(genres, genre_weights, rng.integers(1, 4)) for _ in range(n)],
+        'country': rng.choice(["United States", "India", "France", None], n),
+        'rating': rng.choice(["TV-MA", "PG-13", "R", "TV-14"], n),
+        'release_year': rng.integers(1990, 2022, n),
+        'date_added': pd.to_datetime("2015-01-01") + pd.to_timedelta(rng.integers(0, 2500, n), unit='D'),
+        'duration': np.where(is_movie, [f"{m} min" for m in rng.integers(60, 180, n)],
+                             [f"{s} Seasons" for s in rng.integers(1, 9, n)]),
+    })
+    return compact_frame(df)
+
+
+@pytest.fixture(scope='module')
+def store(catalog):
+    return SketchStore(catalog)
+
+
+SELECTIONS = [{}, {'platform': ('Netflix',)}, {'type': ('TV Show',), 'release_year': (2000, 2015)},
+              {'platform': ('Hulu', 'Disney+'), 'type': ('Movie',)}]
+
+
+def _selected(df, selection):
+    mask = pd.Series(True, index=df.index)
+    for dim, selected in selection.items():
+        mask &= df[dim].between(*selected) if dim == 'release_year' else df[dim].isin(selected)
+    return df[mask]
+
+
+@pytest.mark.parametrize('cardinality', [100, 5_000, 200_000])
+def test_hll_estimate_within_stated_error(cardinality):
+    values = np.array([f"key {i}" for i in range(cardinality)], dtype=object)
+    index, rank = HyperLogLog.register_updates(_hash_strings(values))
+    sketch = HyperLogLog()
+    np.maximum.at(sketch.registers, index, rank)
+    assert abs(sketch.estimate() - cardinality) <= 3 * sketch.relative_error * cardinality
+
+
+def test_hll_merge_matches_union():
+    left, right = HyperLogLog(), HyperLogLog()
+    union = HyperLogLog()
+    for sketch, keys in [(left, range(0, 3000)), (right, range(2000, 6000)), (union, range(0, 6000))]:
+        index, rank = HyperLogLog.register_updates(_hash_strings([f"key {i}" for i in keys]))
+        np.maximum.at(sketch.registers, index, rank)
+    assert np.array_equal(left.merge(right).registers, union.registers)
+
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+def test_distinct_counts_within_stated_error(catalog, store, selection):
+    partitions = store.select(selection)
+    exact = exact_summary(_selected(catalog, selection))
+    assert store.rows(partitions) == exact['titles']
+    for metric, (true_count, _) in exact['distinct'].items():
+        sketch = store.distinct(metric, partitions)
+        assert abs(sketch.estimate() - true_count) <= 3 * sketch.relative_error * true_count
+
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+def test_top_k_bounds_contain_true_counts(catalog, store, selection):
+    partitions = store.select(selection)
+    exact = exact_summary(_selected(catalog, selection), n=None)
+    for metric, reference in exact['top'].items():
+        true_counts = reference.set_index('key')['estimate']
+        top = store.top_k(metric, partitions).top(TOP_K_CAPACITY)
+        truth = true_counts.reindex(top['key']).fillna(0).to_numpy()
+        assert (top['lower'].to_numpy() <= truth).all(), metric
+        assert (truth <= top['upper'].to_numpy()).all(), metric
+
+
+def test_top_k_overflow_keeps_heaviest_keys(catalog, store):
+    partitions = store.select({})
+    summary = store.top_k('genre', partitions)
+    assert summary.bound > 0  # partitions overflowed, so the bounds are non-trivial
+    exact_top = exact_summary(catalog, n=3)['top']['genre']['key'].tolist()
+    assert summary.top(3)['key'].tolist() == exact_top
+
+
+@pytest.mark.parametrize('selection', SELECTIONS)
+@pytest.mark.parametrize('metric', ['movie_minutes', 'tv_seasons', 'lag_years'])
+def test_digest_rank_error_within_bound(catalog, store, selection, metric):
+    values = _quantile_values(_selected(catalog, selection))[metric]
+    values = np.sort(values[~np.isnan(values)])
+    digest = store.digest(metric, store.select(selection))
+    assert digest.count == len(values)
+    if not len(values):
+        assert np.isnan(digest.quantile(0.5))
+        return
+    for q in [0.1, 0.5, 0.9, 0.99]:
+        estimate, bound = digest.quantile(q), digest.rank_error(q)
+        # Interpolation lands between integer data values; judge the nearest one, whose ties span a rank range
+        distinct = np.unique(values)
+        nearest = distinct[np.argmin(np.abs(distinct - estimate))]
+        below = np.searchsorted(values, nearest, side='left') / len(values)
+        at_or_below = np.searchsorted(values, nearest, side='right') / len(values)
+        assert below - bound <= q <= at_or_below + bound, (q, estimate, bound)
+
+
+def test_digest_merge_keeps_count_and_extremes():
+    rng = np.random.default_rng(3)
+    parts = [rng.normal(loc, 1, 2000) for loc in (0, 5, 10)]
+    merged = TDigest.merge_all([TDigest.from_values(part) for part in parts])
+    values = np.concatenate(parts)
+    assert merged.count == len(values)
+    assert merged.quantile(0) == values.min() and merged.quantile(1) == values.max()
+    assert abs(np.mean(values <= merged.quantile(0.5)) - 0.5) <= merged.rank_error(0.5) + 1e-3
+
+
+def test_sketchable_dimensions():
+    assert sketchable({'platform': ('Netflix',), 'release_year': (2000, 2010)})
+    assert not sketchable({'platform': ('Netflix',), 'genre': ('Dramas',)})
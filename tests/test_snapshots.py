@@ -0,0 +1,118 @@
+import pandas as pd
+import pytest
+
+from utils import snapshots
+
+
+@pytest.fixture(autouse=True)
+def snapshot_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshots, 'SNAPSHOT_DIR', str(tmp_path))
+    snapshots._diff_snapshots.clear()
+    return tmp_path
+
+
+def _catalog(n, prefix='s'):
+    return pd.DataFrame({'show_id': [f"{prefix}{i}" for i in range(n)], 'title': [f"Title {i}" for i in range(n)],
+                         'release_year': [2000 + i % 20 for i in range(n)]})
+
+
+def _take(df, day):
+    return snapshots.take_snapshot('Netflix', df=df, taken_at=f"2021-01-{day:02d}T00:00:00+00:00")
+
+
+def _titles(frame, op=None):
+    rows = frame if op is None else frame[frame['_op'] == op]
+    return sorted(rows['title'])
+
+
+def test_first_snapshot_is_a_keyframe_and_unchanged_is_skipped():
+    entry = _take(_catalog(10), 1)
+    assert entry['keyframe'] and entry['added'] == 10 and entry['rows'] == 10
+    assert _take(_catalog(10), 2) is None
+    assert len(snapshots.list_snapshots('Netflix')) == 1
+
+
+def test_delta_records_added_changed_and_removed():
+    _take(_catalog(10), 1)
+    df = _catalog(10)
+    df = df[df['show_id'] != 's3']
+    df.loc[df['show_id'] == 's5', 'title'] = "Renamed"
+    df = pd.concat([df, _catalog(1, prefix='new')], ignore_index=True)
+    entry = _take(df, 2)
+    assert not entry['keyframe']
+    assert (entry['added'], entry['changed'], entry['removed'], entry['rows']) == (1, 1, 1, 10)
+
+    diff = snapshots.diff_snapshots('Netflix', 1, 2)
+    assert _titles(diff, 'added') == ["Title 0"]  # the new row's title
+    assert _titles(diff, 'changed') == ["Renamed"]
+    assert _titles(diff, 'removed') == ["Title 3"]  # removed rows keep their content
+
+
+def test_materialize_replays_deltas():
+    _take(_catalog(100), 1)
+    current = _catalog(100)
+    for day in range(2, 6):
+        current = pd.concat([current.iloc[1:], _catalog(1, prefix=f"d{day}-")], ignore_index=True)
+        current.loc[0, 'title'] = f"Edited {day}"
+        _take(current, day)
+    manifest = snapshots.list_snapshots('Netflix')
+    assert [entry['keyframe'] for entry in manifest] == [True, False, False, False, False]
+    rebuilt = snapshots._materialize('Netflix', manifest, len(manifest))
+    assert sorted(rebuilt['show_id']) == sorted(current['show_id'])
+    assert _titles(rebuilt) == sorted(current['title'])
+
+
+def test_keyframe_after_max_deltas(monkeypatch):
+    monkeypatch.setattr(snapshots, 'MAX_DELTAS', 3)
+    current = _catalog(100)
+    _take(current, 1)
+    for day in range(2, 10):
+        current.loc[day, 'title'] = f"Edited {day}"  # tiny churn, far below KEYFRAME_CHURN
+        _take(current, day)
+    manifest = snapshots.list_snapshots('Netflix')
+    assert [entry['keyframe'] for entry in manifest] == [True, False, False, False, True, False, False, False, True]
+    assert manifest[4]['file'].endswith('-full.parquet')
+    rebuilt = snapshots._materialize('Netflix', manifest, len(manifest))
+    assert _titles(rebuilt) == sorted(current['title'])
+
+
+def test_keyframe_after_churn_threshold():
+    _take(_catalog(10), 1)
+    entry = _take(_catalog(10, prefix='other'), 2)  # every row replaced
+    assert entry['keyframe'] and entry['added'] == 10 and entry['removed'] == 10
+
+
+def test_diff_across_several_snapshots():
+    first = _catalog(10)
+    _take(first, 1)
+    current = first.copy()
+    current.loc[current['show_id'] == 's1', 'title'] = "Changed once"
+    _take(current, 2)
+    current = current[current['show_id'] != 's2']
+    _take(current, 3)
+    current = pd.concat([current, _catalog(1, prefix='late')], ignore_index=True)
+    current.loc[current['show_id'] == 's1', 'title'] = "Changed twice"
+    _take(current, 4)
+
+    diff = snapshots.diff_snapshots('Netflix', 1, 4)
+    assert _titles(diff, 'added') == ["Title 0"]
+    assert _titles(diff, 'changed') == ["Changed twice"]
+    assert _titles(diff, 'removed') == ["Title 2"]
+    # The joined diff over 1 -> 4 nets out to the same rows as comparing the two catalogs directly
+    added, changed, removed = snapshots.diff_indexes(snapshots.fingerprint_rows(first),
+                                                     snapshots.fingerprint_rows(current.reset_index(drop=True)))
+    assert (len(added), len(changed), len(removed)) == (1, 1, 1)
+
+
+def test_snapshot_all_tries_every_platform(monkeypatch):
+    taken = []
+
+    def take_snapshot(platform, taken_at=None, source=None):
+        taken.append(platform)
+        if platform == 'Hulu':
+            raise FileNotFoundError("hulu_titles.csv")
+
+    monkeypatch.setattr(snapshots, 'take_snapshot', take_snapshot)
+    with pytest.raises(RuntimeError, match="Hulu"):
+        snapshots.snapshot_all()
+    assert taken == list(snapshots.PLATFORM_FILES)
@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from utils.text_analytics import STOP_TERMS, TOKEN_PATTERN, TermIndex
+
+
+@pytest.fixture(scope='module')
+def catalog():
+    rng = np.random.default_rng(5)
+    n = 400
+    vocabulary = ["detective", "family", "coming-of-age", "heist", "romance", "zombies", "teen", "war"]
+    years = rng.integers(2014, 2022, n)
+    descriptions = []
+    for year in years:
+        words = list(rng.choice(vocabulary, size=rng.integers(2, 6)))
+        if year >= 2020 and rng.random() < 0.6:
+            words.append("pandemic")  # rises in the two latest years
+        descriptions.append(" ".join(["The", "detective's"] + words + ["in", "1999", "a", "film"]))
+    df = pd.DataFrame({'description': descriptions,
+                       'date_added': pd.to_datetime([f"{year}-06-01" for year in years])})
+    df.loc[::23, 'date_added'] = pd.NaT
+    df.loc[::31, 'description'] = None
+    return df
+
+
+def _title_terms(descriptions):
+    """Reference tokenizer: one row per (title, term) occurrence."""
+    tokens = (descriptions.str.lower().str.replace(r"['’]s\b", "", regex=True)
+              .str.findall(TOKEN_PATTERN).explode().dropna())
+    tokens = tokens[~tokens.isin(STOP_TERMS)]
+    return tokens.rename('term').rename_axis('title').reset_index()
+
+
+def _index(catalog):
+    return TermIndex(catalog['description'], catalog['date_added'])
+
+
+@pytest.mark.parametrize('masked', [False, True])
+def test_term_counts_match_pandas_reference(catalog, masked):
+    mask = (np.arange(len(catalog)) % 3 == 0) if masked else None
+    index = _index(catalog)
+    pairs = _title_terms(catalog['description'])
+    if masked:
+        pairs = pairs[mask[pairs['title']]]
+    expected = pairs['term'].value_counts()
+    counts = pd.Series(index.term_counts(mask), index=index.terms)
+    assert counts[counts > 0].sort_index().equals(expected.sort_index().rename(None).astype(counts.dtype))
+    assert 'detective' in expected and 'film' not in counts.index and 'the' not in counts.index
+    assert 'coming-of-age' in counts.index
+
+
+def test_top_terms_are_the_most_frequent(catalog):
+    top = _index(catalog).top_terms(n=3)
+    expected = _title_terms(catalog['description'])['term'].value_counts().head(3)
+    assert top == expected.to_dict()
+
+
+def _reference_rising(catalog, mask, recent_years=2, min_titles=5):
+    titles = catalog[mask].dropna(subset=['date_added']).assign(year=lambda df: df['date_added'].dt.year)
+    recent_cutoff = sorted(titles['year'].unique())[-recent_years]
+    titles['recent'] = titles['year'] >= recent_cutoff
+    presence = (_title_terms(titles['description']).drop_duplicates()
+                .merge(titles[['recent']], left_on='title', right_index=True))
+    n_recent, n_earlier = titles['recent'].sum(), (~titles['recent']).sum()
+    recent_df = presence[presence['recent']]['term'].value_counts()
+    earlier_df = presence[~presence['recent']]['term'].value_counts()
+    stats = pd.DataFrame({'recent': recent_df, 'earlier': earlier_df}).fillna(0)
+    recent_share, earlier_share = stats['recent'] / n_recent, stats['earlier'] / n_earlier
+    pooled = (stats['recent'] + stats['earlier']) / (n_recent + n_earlier)
+    stats['z'] = (recent_share - earlier_share) / np.sqrt(pooled * (1 - pooled) * (1 / n_recent + 1 / n_earlier))
+    stats = stats[(stats['recent'] >= min_titles) & (stats['z'] > 0)]
+    return stats.sort_values('z', ascending=False)
+
+
+@pytest.mark.parametrize('masked', [False, True])
+def test_rising_terms_rank_by_z_score(catalog, masked):
+    mask = (np.arange(len(catalog)) % 2 == 0) if masked else np.ones(len(catalog), dtype=bool)
+    rising = _index(catalog).rising_terms(mask if masked else None, n=5)
+    expected = _reference_rising(catalog, mask).head(5)
+    assert rising['term'].iloc[0] == 'pandemic'
+    assert rising['term'].tolist() == expected.index.tolist()
+    np.testing.assert_allclose(rising['z_score'], expected['z'])
+    np.testing.assert_array_equal(rising['recent_titles'], expected['recent'])
+
+
+def test_rising_terms_need_more_years_than_the_recent_window(catalog):
+    one_year = catalog['date_added'].dt.year == 2021
+    rising = _index(catalog).rising_terms(one_year.to_numpy())
+    assert rising.empty and 'z_score' in rising.columns
+
+
+def test_term_trend_is_yearly_share_of_titles(catalog):
+    mask = (np.arange(len(catalog)) % 2 == 1)
+    trend = _index(catalog).term_trend(['pandemic', 'heist'], mask)
+    titles = catalog[mask].dropna(subset=['date_added']).assign(year=lambda df: df['date_added'].dt.year)
+    presence = _title_terms(titles['description']).drop_duplicates().merge(titles[['year']], left_on='title',
+                                                                           right_index=True)
+    expected = (presence[presence['term'].isin(['pandemic', 'heist'])]
+                .pivot_table(index='year', columns='term', values='title', aggfunc='count', fill_value=0)
+                .reindex(sorted(titles['year'].unique()), fill_value=0)
+                .div(titles['year'].value_counts().sort_index(), axis=0))
+    assert trend.index.tolist() == expected.index.tolist()
+    np.testing.assert_allclose(trend[['pandemic', 'heist']].to_numpy(), expected[['pandemic', 'heist']].to_numpy())
+    assert (trend.loc[:2019, 'pandemic'] == 0).all()
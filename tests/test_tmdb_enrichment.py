@@ -0,0 +1,107 @@
+import asyncio
+import json
+import time
+
+import pandas as pd
+import pytest
+
+from tools.tmdb_stub import start_stub_server
+from utils import tmdb_enrichment as te
+from utils.data_loader import load_data
+
+PLATFORM = 'Hulu'
+
+
+@pytest.fixture
+def enrichment_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(te, 'ENRICHMENT_DIR', str(tmp_path))
+    return tmp_path
+
+
+@pytest.fixture
+def stub():
+    servers = []
+
+    def start(rate_limit=0):
+        server, base_url = start_stub_server(rate_limit=rate_limit)
+        servers.append(server)
+        return base_url
+
+    yield start
+    for server in servers:
+        server.shutdown()
+
+
+def _enrich(base_url, limit, rate=200):
+    return te.enrich_catalog(base_url=base_url, api_key='test', concurrency=4, rate=rate, limit=limit,
+                             platforms=[PLATFORM])
+
+
+def _checkpoint_keys(enrichment_dir):
+    with open(enrichment_dir / te.CHECKPOINT_FILE) as f:
+        return [json.loads(line)['key'] for line in f]
+
+
+def test_resume_skips_checkpointed_titles(enrichment_dir, stub):
+    base_url = stub()
+    first = _enrich(base_url, limit=20)
+    assert (first['looked_up'], first['cached'], first['failed']) == (20, 0, 0)
+
+    second = _enrich(base_url, limit=20)
+    assert (second['looked_up'], second['cached']) == (20, 20)
+    # Two genre lists, then one search per new title only
+    assert second['requests'] == 2 + 20
+    keys = _checkpoint_keys(enrichment_dir)
+    assert len(keys) == len(set(keys)) == 40
+
+
+def test_interrupted_line_is_ignored_on_resume(enrichment_dir, stub):
+    base_url = stub()
+    _enrich(base_url, limit=5)
+    with open(enrichment_dir / te.CHECKPOINT_FILE, 'a') as f:
+        f.write('{"key": "Movie|cut sh')
+    assert len(te.read_checkpoint()) == 5
+    assert _enrich(base_url, limit=5)['cached'] == 5
+
+
+def test_rate_limited_requests_are_retried(enrichment_dir, stub):
+    stats = _enrich(stub(rate_limit=5), limit=12, rate=50)
+    assert stats['retries'] > 0
+    assert stats['failed'] == 0
+    assert stats['matched'] + stats['not_found'] == 12
+    assert stats['requests'] == 2 + 12 + stats['retries']
+
+
+def test_table_is_typed_and_joins_onto_catalog_rows(enrichment_dir, stub):
+    stats = _enrich(stub(), limit=30)
+    table = pd.read_parquet(enrichment_dir / te.TABLE_FILE)
+    assert len(table) == stats['titles_matched'] == stats['matched']
+    assert table.set_index('title_key').dtypes.astype(str).to_dict() == te.ENRICHMENT_COLUMNS
+
+    catalog = load_data(PLATFORM)
+    enriched = te.load_enrichment(PLATFORM, enrichment=te.enrichment_fingerprint())
+    assert enriched.index.equals(catalog.index)
+    matched_keys = set(table['title_key'])
+    expected = te.title_keys(catalog).isin(matched_keys).to_numpy()
+    assert (enriched['tmdb_id'].notna().to_numpy() == expected).all()
+    row = enriched[enriched['tmdb_id'].notna()].iloc[0]
+    assert row['tmdb_title'] and row['tmdb_genres']
+
+
+def test_missing_table_joins_as_nulls(enrichment_dir):
+    enriched = te.load_enrichment(PLATFORM, enrichment='')
+    assert len(enriched) == len(load_data(PLATFORM))
+    assert enriched['tmdb_id'].isna().all()
+
+
+def test_pause_does_not_refill_during_the_pause():
+    async def scenario():
+        bucket = te.TokenBucket(rate=10, capacity=10)
+        bucket.pause(0.2)
+        started = time.monotonic()
+        for _ in range(3):
+            await bucket.acquire()
+        return time.monotonic() - started
+
+    # Paused 0.2 s, then refills at 10/s from empty: about 0.1 s per token
+    assert asyncio.run(scenario()) >= 0.45
@@ -0,0 +1,296 @@
+"""Concurrent-session load test for the DataFlix Streamlit app, against a local TMDb stub."""
+import argparse
+import json
+import os
+import pickle
+import resource
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+import numpy as np
+
+APP_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "app.py")
+
+# Each step is one user interaction, i.e. one rerun:
+#   ('page', name)          click a sidebar page button
+#   ('select', key, n)      pick the n most common options of a multiselect
+#   ('clear', key)          clear a multiselect
+#   ('range', key, share)   narrow a slider to the most recent `share` of its range
+#   ('search', text)        search the Title Intelligence Terminal
+JOURNEYS = {
+    'browse_all': [
+        ('page', "Home"), ('page', "Netflix"), ('page', "Prime Video"),
+        ('page', "Disney+"), ('page', "Hulu"), ('page', "Talent Network"), ('page', "Home"),
+    ],
+    'netflix_analyst': [
+        ('page', "Netflix"), ('select', "netflix_type", 1), ('select', "netflix_genre", 2),
+        ('range', "netflix_release_year", 0.3), ('select', "netflix_country", 1),
+        ('clear', "netflix_genre"), ('page', "Prime Video"), ('select', "prime_rating", 2),
+    ],
+    'hulu_disney_analyst': [
+        ('page', "Hulu"), ('range', "hulu_release_year", 0.5), ('select', "hulu_genre", 1),
+        ('page', "Disney+"), ('select', "disney_type", 1), ('select', "disney_rating", 3),
+        ('clear', "disney_rating"),
+    ],
+    'market_overview': [
+        ('page', "Home"), ('select', "home_platform", 2), ('select', "home_genre", 1),
+        ('search', "Inception"), ('range', "home_release_year", 0.2), ('clear', "home_platform"),
+    ],
+}
+
+# The release scenario: 50 sessions at once, each rerun answered within 3 s
+# at p95. Every session shares one Python process, so latency grows about
+# linearly with concurrency; a machine that can't hold these fails the run.
+DEFAULT_SESSIONS = 50
+DEFAULT_SLOS = {
+    'p95_ms': 3000.0,
+    'p99_ms': 5000.0,
+    'error_rate': 0.0,
+    'min_throughput': 0.0,
+    'session_mb': 50.0,
+}
+
+
+def _rss_mb():
+    """Current resident set size of this process in MB."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE') / 2**20
+    except (OSError, ValueError):
+        # Peak RSS is the best we get without /proc (KB on Linux, bytes on macOS)
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return peak / 2**20 if sys.platform == 'darwin' else peak / 2**10
+
+
+def _session_state_bytes(at):
+    total = 0
+    for value in at.session_state.values():
+        try:
+            total += len(pickle.dumps(value))
+        except Exception:
+            pass
+    return total
+
+
+@contextmanager
+def concurrent_app_tests():
+    """Makes AppTest safe to run from several threads, for the duration of the context only."""
+    from streamlit.runtime.runtime import Runtime
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1.util import patch_config_options
+
+    last_instance = {}
+    original = Runtime.__dict__['instance'], Runtime.__dict__['exists'], ScriptCache.get_bytecode
+    compile_lock = threading.Lock()
+
+    # AppTest resets the Runtime singleton after every run; the mocks are interchangeable
+    def instance(cls):
+        if cls._instance is not None:
+            last_instance['runtime'] = cls._instance
+        runtime = cls._instance or last_instance.get('runtime')
+        if runtime is None:
+            raise RuntimeError("Runtime hasn't been created!")
+        return runtime
+
+    def exists(cls):
+        return cls._instance is not None or 'runtime' in last_instance
+
+    # ast.parse is not thread-safe on every Python version
+    def get_bytecode(self, script_path):
+        with compile_lock:
+            return original[2](self, script_path)
+
+    Runtime.instance = classmethod(instance)
+    Runtime.exists = classmethod(exists)
+    ScriptCache.get_bytecode = get_bytecode
+    try:
+        # Each run turns global.appTest on and back off; hold it on for all of them
+        with patch_config_options({'global.appTest': True}):
+            yield
+    finally:
+        Runtime.instance, Runtime.exists, ScriptCache.get_bytecode = original
+
+
+def _apply_step(at, step):
+    kind, *args = step
+    if kind == 'page':
+        buttons = [b for b in at.sidebar.button if b.label.endswith(args[0])]
+        return buttons[0].click() if buttons else None
+    if kind == 'search':
+        at.text_input(key="search_box").input(args[0])
+        return at.button(key="search_btn").click()
+    widgets = {w.key: w for w in list(at.multiselect) + list(at.slider) + list(at.select_slider)}
+    widget = widgets.get(args[0])
+    if widget is None:
+        return None
+    if kind == 'select':
+        return widget.set_value(list(widget.options[:args[1]]))
+    if kind == 'clear':
+        return widget.set_value([])
+    if kind == 'range':
+        lo, hi = widget.min, widget.max
+        return widget.set_range(int(hi - (hi - lo) * args[1]), hi)
+    raise ValueError(f"Unknown journey step: {kind}")
+
+
+def run_session(session_id, journey_name, timeout, think_time):
+    """Replays one journey in a fresh session. Returns its measurements."""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP_PATH, default_timeout=timeout)
+    at.session_state['app_loaded'] = True  # skip the one-off loading animation
+    latencies, errors = [], []
+    for step in [('start',)] + JOURNEYS[journey_name]:
+        if step != ('start',) and _apply_step(at, step) is None:
+            errors.append(f"{journey_name}: step {step} found no widget")
+            continue
+        started = time.perf_counter()
+        try:
+            at.run()
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors.extend(f"{journey_name} {step}: {e.value}" for e in at.exception)
+        except Exception as exc:
+            latencies.append((time.perf_counter() - started) * 1000)
+            errors.append(f"{journey_name} {step}: {type(exc).__name__}: {exc}")
+        if think_time:
+            time.sleep(think_time)
+    return {'session': session_id, 'journey': journey_name, 'latencies_ms': latencies,
+            'errors': errors, 'state_bytes': _session_state_bytes(at)}
+
+
+def _ledger_session_mb():
+    """The largest session in the app's session-resources ledger, in MB."""
+    from utils.session_resources import get_session_resources
+    return get_session_resources().metrics()['largest_session_bytes'] / 2**20
+
+
+def run_load_test(sessions, concurrency, journeys=None, timeout=60.0, think_time=0.0, warmup=True):
+    journeys = journeys or list(JOURNEYS)
+    with concurrent_app_tests():
+        if warmup:
+            # Fill the process-wide data caches so they aren't charged to the first sessions
+            for name in journeys:
+                run_session(-1, name, timeout, 0.0)
+
+        rss_before = _rss_mb()
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            futures = [pool.submit(run_session, i, journeys[i % len(journeys)], timeout, think_time)
+                       for i in range(sessions)]
+            results = [future.result() for future in futures]
+        wall_time = time.perf_counter() - started
+        rss_after = _rss_mb()
+    return summarize(results, concurrency, wall_time, rss_after - rss_before, _ledger_session_mb())
+
+
+def summarize(results, concurrency, wall_time, rss_growth_mb, ledger_session_mb=0.0):
+    """
+    The report of a run from its per-session results. RSS can shrink while
+    sessions run (the allocator returns memory), so the per-session figure is
+    the growth clamped at zero.
+    """
+    sessions = len(results)
+    latencies = np.array([ms for result in results for ms in result['latencies_ms']])
+    errors = [error for result in results for error in result['errors']]
+    if not latencies.size:
+        latencies = np.array([np.nan])
+    return {
+        'sessions': sessions,
+        'concurrency': concurrency,
+        'reruns': int(np.count_nonzero(~np.isnan(latencies))),
+        'errors': len(errors),
+        'error_rate': len(errors) / max(np.count_nonzero(~np.isnan(latencies)), 1),
+        'error_samples': errors[:5],
+        'p50_ms': float(np.percentile(latencies, 50)),
+        'p90_ms': float(np.percentile(latencies, 90)),
+        'p95_ms': float(np.percentile(latencies, 95)),
+        'p99_ms': float(np.percentile(latencies, 99)),
+        'max_ms': float(np.max(latencies)),
+        'throughput': np.count_nonzero(~np.isnan(latencies)) / wall_time if wall_time else 0.0,
+        'wall_time_s': wall_time,
+        'rss_growth_mb': rss_growth_mb,
+        'session_mb': max(rss_growth_mb, 0.0) / max(sessions, 1),
+        'ledger_session_mb_max': ledger_session_mb,
+        'session_state_kb_max': max((result['state_bytes'] for result in results), default=0) / 1024,
+    }
+
+
+def check_slos(report, slos):
+    """Returns the list of violated objectives (a NaN latency, i.e. no rerun completed, is a violation)."""
+    violations = []
+    for name in ('p95_ms', 'p99_ms', 'error_rate', 'session_mb'):
+        if slos.get(name) is not None and not report[name] <= slos[name]:
+            violations.append(f"{name} = {report[name]:.3f} exceeds {slos[name]}")
+    if slos.get('min_throughput') and report['throughput'] < slos['min_throughput']:
+        violations.append(f"throughput = {report['throughput']:.2f}/s is below {slos['min_throughput']}")
+    return violations
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--sessions', type=int, default=DEFAULT_SESSIONS, help="total sessions to replay")
+    parser.add_argument('--concurrency', type=int, help="simultaneous sessions (default: all of them)")
+    parser.add_argument('--journey', action='append', choices=sorted(JOURNEYS), help="journeys to replay (default: all)")
+    parser.add_argument('--think-time', type=float, default=0.0, help="seconds between a session's interactions")
+    parser.add_argument('--timeout', type=float, default=60.0, help="seconds allowed per rerun")
+    parser.add_argument('--stub-latency', type=float, default=0.05, help="seconds added to every TMDb stub response")
+    parser.add_argument('--no-warmup', action='store_true')
+    parser.add_argument('--json', help="also write the report to this file")
+    for name, default in DEFAULT_SLOS.items():
+        parser.add_argument(f"--slo-{name.replace('_', '-')}", type=float, default=default, dest=f"slo_{name}")
+    args = parser.parse_args(argv)
+
+    from tools.tmdb_stub import start_stub_server
+    server, base_url = start_stub_server(latency=args.stub_latency)
+    # Must be set before app.py first imports utils.api_utils / utils.scheduler
+    os.environ['TMDB_BASE_URL'] = base_url
+    # The app's scheduler records snapshots and enrichment results; keep the run out of data/
+    scratch = tempfile.mkdtemp(prefix='dataflix-loadtest-')
+    for variable, name in [('DATAFLIX_SHARED_DIR', 'shared'), ('DATAFLIX_SNAPSHOT_DIR', 'snapshots'),
+                           ('DATAFLIX_ENRICHMENT_DIR', 'enrichment')]:
+        os.environ.setdefault(variable, os.path.join(scratch, name))
+
+    report = run_load_test(args.sessions, args.concurrency or args.sessions, args.journey,
+                           args.timeout, args.think_time, warmup=not args.no_warmup)
+    server.shutdown()
+
+    slos = {name: getattr(args, f"slo_{name}") for name in DEFAULT_SLOS}
+    violations = check_slos(report, slos)
+    report['slo_violations'] = violations
+    if args.json:
+        with open(args.json, 'w') as f:
+            json.dump(report, f, indent=2)
+    print("\n".join(format_report(report, slos)))
+    return 1 if violations else 0
+
+
+def format_report(report, slos):
+    """The console report: measurements, the objectives checked and any violations."""
+    lines = [
+        f"Sessions: {report['sessions']} ({report['concurrency']} concurrent), reruns: {report['reruns']}, "
+        f"errors: {report['errors']}",
+        f"Rerun latency ms  p50 {report['p50_ms']:.0f}  p90 {report['p90_ms']:.0f}  "
+        f"p95 {report['p95_ms']:.0f}  p99 {report['p99_ms']:.0f}  max {report['max_ms']:.0f}",
+        f"Throughput: {report['throughput']:.2f} reruns/s over {report['wall_time_s']:.1f}s",
+        f"Memory: RSS {report['rss_growth_mb']:+.1f} MB ({report['session_mb']:.2f} MB/session), "
+        f"largest session ledger {report['ledger_session_mb_max']:.2f} MB, "
+        f"max session state {report['session_state_kb_max']:.1f} KB",
+    ]
+    lines += [f"  error: {error}" for error in report['error_samples']]
+    checked = [f"{name} <= {value:g}" for name, value in slos.items() if value is not None and name != 'min_throughput']
+    if slos.get('min_throughput'):
+        checked.append(f"throughput >= {slos['min_throughput']:g}/s")
+    lines.append(f"SLOs: {', '.join(checked)}")
+    lines += [f"SLO FAILED: {violation}" for violation in report.get('slo_violations', [])]
+    return lines
+
+
+if __name__ == "__main__":
+    # Streamlit warns about the missing ScriptRunContext on every cache hit outside `streamlit run`
+    from streamlit.logger import set_log_level
+    set_log_level('error')
+    sys.exit(main())
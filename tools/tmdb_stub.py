@@ -0,0 +1,138 @@
+"""A local stand-in for the TMDb v3 API, for load tests and offline runs."""
+import argparse
+import json
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+POSTER_PATH = "/stub-poster.jpg"
+MOVIE_GENRES = {28: "Action", 12: "Adventure", 16: "Animation", 35: "Comedy", 80: "Crime", 99: "Documentary",
+                18: "Drama", 10751: "Family", 14: "Fantasy", 27: "Horror", 10749: "Romance", 878: "Science Fiction",
+                53: "Thriller"}
+TV_GENRES = {10759: "Action & Adventure", 16: "Animation", 35: "Comedy", 80: "Crime", 99: "Documentary",
+             18: "Drama", 10751: "Family", 10762: "Kids", 9648: "Mystery", 10764: "Reality",
+             10765: "Sci-Fi & Fantasy", 10768: "War & Politics"}
+
+
+def _genre_ids(item_id, genres):
+    ids = sorted(genres)
+    return [ids[item_id % len(ids)], ids[(item_id // len(ids)) % len(ids)]][:1 + item_id % 2]
+
+
+def _fake_movie(movie_id, title, year=None):
+    return {
+        'id': movie_id,
+        'title': title,
+        'overview': f"Stub overview for {title}.",
+        'poster_path': POSTER_PATH,
+        'release_date': f"{year}-01-01" if year else "",
+        'genre_ids': _genre_ids(movie_id, MOVIE_GENRES),
+        'vote_average': round(5 + (movie_id % 50) / 10, 1),
+        'vote_count': 100 + movie_id % 900,
+        'popularity': round(10 + (movie_id % 1000) / 7, 3),
+    }
+
+
+def _fake_show(show_id, name, year=None):
+    return {
+        'id': show_id,
+        'name': name,
+        'overview': f"Stub overview for {name}.",
+        'poster_path': POSTER_PATH,
+        'first_air_date': f"{year}-01-01" if year else "",
+        'genre_ids': _genre_ids(show_id, TV_GENRES),
+        'vote_average': round(5 + (show_id % 50) / 10, 1),
+        'vote_count': 50 + show_id % 500,
+        'popularity': round(5 + (show_id % 1000) / 9, 3),
+    }
+
+
+def _stable_id(text):
+    return zlib.crc32(text.lower().encode()) % 1_000_000 + 1
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    latency = 0.0
+    # Requests allowed per second before answering 429, like TMDb; 0 for no limit
+    rate_limit = 0
+    _window = [0, 0]
+    _window_lock = threading.Lock()
+
+    def _over_limit(self):
+        if not self.rate_limit:
+            return False
+        with self._window_lock:
+            second = int(time.time())
+            if self._window[0] != second:
+                self._window[:] = [second, 0]
+            self._window[1] += 1
+            return self._window[1] > self.rate_limit
+
+    def do_GET(self):
+        if self.latency:
+            time.sleep(self.latency)
+        if self._over_limit():
+            self.send_response(429)
+            self.send_header('Retry-After', '1')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        url = urlparse(self.path)
+        query = {key: values[0] for key, values in parse_qs(url.query).items()}
+        parts = [part for part in url.path.split('/') if part]
+        if parts[:1] == ['3']:
+            parts = parts[1:]
+
+        if parts == ['trending', 'movie', 'day']:
+            payload = {'results': [_fake_movie(i, f"Trending Movie {i}") for i in range(1, 21)]}
+        elif parts == ['search', 'movie']:
+            title = query.get('query', '')
+            year = query.get('year') or query.get('primary_release_year')
+            payload = {'results': [_fake_movie(_stable_id(title), title, year)] if title else []}
+        elif parts == ['search', 'tv']:
+            name = query.get('query', '')
+            year = query.get('first_air_date_year')
+            payload = {'results': [_fake_show(_stable_id(name), name, year)] if name else []}
+        elif parts[:1] == ['genre'] and parts[2:] == ['list'] and parts[1] in ('movie', 'tv'):
+            genres = MOVIE_GENRES if parts[1] == 'movie' else TV_GENRES
+            payload = {'genres': [{'id': genre_id, 'name': name} for genre_id, name in genres.items()]}
+        elif len(parts) == 3 and parts[0] == 'movie' and parts[2] == 'reviews':
+            payload = {'results': [{'author': 'stub', 'content': f"Review of movie {parts[1]}."}]}
+        else:
+            self.send_error(404)
+            return
+
+        body = json.dumps(payload).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_stub_server(port=0, latency=0.0, rate_limit=0):
+    """Starts the stub on a daemon thread. Returns (server, base_url)."""
+    handler = type('ConfiguredStubHandler', (StubHandler,), {'latency': latency, 'rate_limit': rate_limit,
+                                                             '_window': [0, 0]})
+    server = ThreadingHTTPServer(('127.0.0.1', port), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/3"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', type=float, default=0.0, help="seconds added to every response")
+    parser.add_argument('--rate-limit', type=int, default=0, help="requests per second before answering 429")
+    args = parser.parse_args()
+    server, base_url = start_stub_server(args.port, args.latency, args.rate_limit)
+    print(f"TMDb stub serving at {base_url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
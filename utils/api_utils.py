@@ -1,5 +1,6 @@
 import streamlit as st
 import requests
+import os
 
 # Fetch the API key from Streamlit secrets
 try:
@@ -7,14 +8,15 @@ try:
 except (KeyError, FileNotFoundError):
     API_KEY = None
 
-BASE_URL = "https://api.themoviedb.org/3"
+BASE_URL = os.environ.get("TMDB_BASE_URL", "https://api.themoviedb.org/3")
+REQUEST_TIMEOUT = 10  # seconds
 
 def get_trending_movies():
     """Fetches a list of trending movies from TMDb."""
     if not API_KEY:
         return None
     try:
-        response = requests.get(f"{BASE_URL}/trending/movie/day?api_key={API_KEY}")
+        response = requests.get(f"{BASE_URL}/trending/movie/day?api_key={API_KEY}", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json().get('results', [])
     except requests.RequestException:
@@ -25,7 +27,7 @@ def get_movie_details(query):
     if not API_KEY:
         return None
     try:
-        response = requests.get(f"{BASE_URL}/search/movie?api_key={API_KEY}&query={query}")
+        response = requests.get(f"{BASE_URL}/search/movie?api_key={API_KEY}&query={query}", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         results = response.json().get('results', [])
         return results[0] if results else None
@@ -37,7 +39,7 @@ def get_movie_reviews(movie_id):
     if not API_KEY or not movie_id:
         return None
     try:
-        response = requests.get(f"{BASE_URL}/movie/{movie_id}/reviews?api_key={API_KEY}")
+        response = requests.get(f"{BASE_URL}/movie/{movie_id}/reviews?api_key={API_KEY}", timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         return response.json().get('results', [])
     except requests.RequestException:
@@ -0,0 +1,194 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.data_loader import catalog_snapshot, PLATFORM_FILES, VERSIONS_KEPT
+
+# Filter dimension -> (source column, kind). 'multi' columns hold ", "-separated
+# lists, 'range' columns are ordinal and filtered by an inclusive [lo, hi] range.
+FILTER_DIMENSIONS = {
+    'platform': ('platform', 'single'),
+    'type': ('type', 'single'),
+    'genre': ('listed_in', 'multi'),
+    'country': ('country', 'multi'),
+    'rating': ('rating', 'single'),
+    'release_year': ('release_year', 'range'),
+    'date_added': ('date_added', 'range'),
+}
+
+
+def _pack(mask):
+    """Packs a boolean row mask into little-endian uint64 words."""
+    packed = np.packbits(mask, bitorder='little')
+    pad = (-packed.size) % 8
+    if pad:
+        packed = np.concatenate([packed, np.zeros(pad, dtype=np.uint8)])
+    return packed.view(np.uint64)
+
+
+def category_codes(series):
+    """Returns (row codes, category labels) for a column, -1 marking missing rows."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.codes.to_numpy(), series.cat.categories.astype(str)
+    codes, labels = pd.factorize(series)
+    return codes, pd.Index(labels).astype(str)
+
+
+def selection_key(selection):
+    """Returns a hashable, order-independent key for a filter selection."""
+    return tuple(sorted((dim, tuple(values)) for dim, values in selection.items()))
+
+
+def month_ordinal(dates):
+    """Maps datetimes to months since year 0 (NaT -> -1)."""
+    dates = pd.DatetimeIndex(dates)
+    ordinal = dates.year * 12 + dates.month - 1
+    return np.where(dates.isna(), -1, ordinal).astype(np.int64)
+
+
+class BitmapIndex:
+    """
+    Precomputed per-value bitsets over a catalog frame.
+
+    Categorical dimensions keep one bitset per value, so a selection is an OR
+    over the chosen values. Range dimensions keep cumulative bitsets
+    (value <= v), so any [lo, hi] range is a single AND-NOT. A full filter
+    combination is an AND across dimensions.
+    """
+
+    def __init__(self, df, dimensions=None):
+        self.n_rows = len(df)
+        self.n_words = (self.n_rows + 63) // 64
+        self.values = {}
+        self.counts = {}
+        self.kinds = {}
+        self._bitsets = {}
+        self._positions = {}
+
+        all_rows = np.ones(self.n_rows, dtype=bool)
+        self._all = _pack(all_rows)
+
+        for dim in dimensions or FILTER_DIMENSIONS:
+            column, kind = FILTER_DIMENSIONS[dim]
+            if column not in df.columns:
+                continue
+            self.kinds[dim] = kind
+            if kind == 'range':
+                self._build_range(dim, df[column])
+            else:
+                self._build_categorical(dim, df[column], multi=(kind == 'multi'))
+
+    def _build_categorical(self, dim, series, multi):
+        codes, labels = category_codes(series)
+        if multi:
+            # Split the (small) dictionary instead of every row
+            tokens = pd.Series(labels).str.split(',').explode().str.strip()
+            tokens = tokens[tokens != '']
+            values = tokens.value_counts().index
+            membership = {value: np.zeros(len(labels) + 1, dtype=bool) for value in values}
+            for cat_code, token in tokens.items():
+                membership[token][cat_code] = True
+        else:
+            values = labels
+            membership = {}
+            for cat_code, value in enumerate(labels):
+                lookup = np.zeros(len(labels) + 1, dtype=bool)
+                lookup[cat_code] = True
+                membership[value] = lookup
+
+        # Missing rows have code -1, which hits the trailing always-False slot
+        bitsets = np.empty((len(membership), self.n_words), dtype=np.uint64)
+        for i, value in enumerate(membership):
+            bitsets[i] = _pack(membership[value][codes])
+        counts = np.array([self._popcount(b) for b in bitsets], dtype=np.int64)
+        order = np.argsort(-counts, kind='stable')
+
+        self.values[dim] = [list(membership)[i] for i in order]
+        self.counts[dim] = counts[order]
+        self._bitsets[dim] = bitsets[order]
+        self._positions[dim] = {value: i for i, value in enumerate(self.values[dim])}
+
+    def _build_range(self, dim, series):
+        if pd.api.types.is_datetime64_any_dtype(series):
+            keys = month_ordinal(series)
+        else:
+            keys = pd.to_numeric(series, errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+        valid = keys >= 0
+        values, inverse = np.unique(keys[valid], return_inverse=True)
+        codes = np.full(self.n_rows, len(values), dtype=np.int64)
+        codes[valid] = inverse
+
+        cumulative = np.empty((len(values), self.n_words), dtype=np.uint64)
+        for i in range(len(values)):
+            cumulative[i] = _pack(codes <= i)
+        self.values[dim] = values
+        self.counts[dim] = np.bincount(inverse, minlength=len(values))
+        self._bitsets[dim] = cumulative
+
+    @staticmethod
+    def _popcount(words):
+        if hasattr(np, 'bitwise_count'):
+            return int(np.bitwise_count(words).sum())
+        return int(np.unpackbits(words.view(np.uint8)).sum())
+
+    def extent(self, dim):
+        """Returns the (min, max) indexed value of a range dimension."""
+        values = self.values[dim]
+        return (int(values[0]), int(values[-1])) if len(values) else (None, None)
+
+    def _dimension_bitset(self, dim, selected):
+        bitsets = self._bitsets[dim]
+        if self.kinds[dim] == 'range':
+            values = self.values[dim]
+            lo, hi = selected
+            hi_idx = np.searchsorted(values, hi, side='right') - 1
+            lo_idx = np.searchsorted(values, lo, side='left') - 1
+            if hi_idx < 0:
+                return np.zeros(self.n_words, dtype=np.uint64)
+            result = bitsets[hi_idx].copy()
+            if lo_idx >= 0:
+                np.bitwise_and(result, ~bitsets[lo_idx], out=result)
+            return result
+
+        positions = self._positions[dim]
+        rows = [positions[value] for value in selected if value in positions]
+        if not rows:
+            return np.zeros(self.n_words, dtype=np.uint64)
+        result = bitsets[rows[0]].copy()
+        for row in rows[1:]:
+            np.bitwise_or(result, bitsets[row], out=result)
+        return result
+
+    def evaluate(self, selection):
+        """
+        Evaluates a selection {dimension: values} to a packed bitset.
+
+        Categorical dimensions take an iterable of values (OR-ed together),
+        range dimensions a (lo, hi) tuple. Empty or unknown dimensions are
+        ignored.
+        """
+        result = self._all.copy()
+        for dim, selected in selection.items():
+            if dim not in self.kinds or selected is None or len(selected) == 0:
+                continue
+            np.bitwise_and(result, self._dimension_bitset(dim, selected), out=result)
+        return result
+
+    def count(self, bitset):
+        return self._popcount(bitset)
+
+    def to_mask(self, bitset):
+        """Unpacks a bitset to a boolean row mask."""
+        return np.unpackbits(bitset.view(np.uint8), count=self.n_rows, bitorder='little').view(bool)
+
+
+def get_bitmap_index(platform=None, version=None):
+    """Returns the bitmap index for one platform, or the combined catalog when `platform` is None."""
+    snapshot = catalog_snapshot(version)
+    return _build_bitmap_index(platform, snapshot.version, snapshot)
+
+@st.cache_resource(max_entries=VERSIONS_KEPT * (len(PLATFORM_FILES) + 1), show_spinner=False)
+def _build_bitmap_index(platform, version, _snapshot):
+    df = _snapshot.frame(platform)
+    if df is None:
+        return None
+    return BitmapIndex(df)
@@ -0,0 +1,184 @@
+# Declarative platform dashboards. Each page is generated from its entry here
+# by `components.platform_dashboard`; a new platform needs a `PLATFORM_FILES`
+# entry and a spec, not a new page module.
+#
+# brand_color, logo  the platform's colour and logo on the Home page
+# theme   template, the two series colours, the sequential colour scale, the
+#         word cloud colormap and optionally per-type pie colours
+# kpis    {'label', 'measure', 'pick'}: 'total' sums the measure, 'top' takes
+#         its most common value, 'last' its latest index, any other pick the
+#         count of that value. 'scope': 'catalog' ignores the filters
+# tabs    {'label', 'subheader', 'widths', 'charts'} or {'label', 'panel'};
+#         charts are laid out side by side, each names its chart kind and the
+#         `page_planner.MEASURES` aggregate it draws; 'mean_label' adds a
+#         metric with the aggregate's mean above the chart. 'requires' names
+#         a count aggregate the tab depends on: while no enrichment exists the
+#         tab shows its 'missing' message, otherwise a caption of how many
+#         titles are 'coverage'
+# insights key into `utils.insights.INSIGHTS`
+
+# Audience reception from the offline TMDb enrichment (`utils.tmdb_enrichment`)
+TMDB_TAB = {
+    'subheader': "Audience Reception on TMDb",
+    'requires': 'tmdb_matched',
+    'missing': "No TMDb data yet. Run `python -m utils.tmdb_enrichment` to fetch ratings and popularity "
+               "for the catalog.",
+    'coverage': "matched on TMDb",
+    'charts': [
+        {'chart': 'histogram', 'measure': 'tmdb_ratings', 'title': "TMDb Rating Distribution",
+         'mean_label': "Average TMDb Rating", 'x_label': 'TMDb rating'},
+        {'chart': 'hbar', 'measure': 'tmdb_genre_ratings', 'title': "Best-Rated Genres",
+         'labels': ("Average TMDb Rating", "Genre")},
+        {'chart': 'hbar', 'measure': 'tmdb_popular_titles', 'title': "Most Popular on TMDb",
+         'labels': ("Popularity", "Title")},
+    ],
+}
+
+DASHBOARDS = {
+    "Netflix": {
+        'title': "🔴 Netflix Content Intelligence",
+        'icon': "🔴",
+        'key_prefix': "netflix",
+        'brand_color': "#E50914",
+        'logo': "https://image.tmdb.org/t/p/original/wwemzKWzjKYJFfCeiB57q3r4Bcm.svg",
+        'theme': {'template': 'plotly_dark', 'colors': ['#E50914', '#B20710'], 'scale': 'Reds', 'colormap': 'Reds'},
+        'kpis': [
+            {'label': "Total Titles", 'measure': 'titles', 'pick': 'total'},
+            {'label': "Movies", 'measure': 'type_counts', 'pick': 'Movie'},
+            {'label': "TV Shows", 'measure': 'type_counts', 'pick': 'TV Show'},
+            {'label': "Top Content Country", 'measure': 'country_counts', 'pick': 'top'},
+        ],
+        'tabs': [
+            {'label': "📚 Content Library", 'subheader': "Library Composition", 'widths': [1, 2], 'charts': [
+                {'chart': 'type_pie', 'measure': 'type_counts', 'title': "Content Type Distribution"},
+                {'chart': 'duration_histogram', 'measure': 'durations', 'title': "Movie Duration vs. TV Show Seasons"},
+            ]},
+            {'label': "📊 Genre & Audience", 'subheader': "Genre and Rating Deep Dive", 'charts': [
+                {'chart': 'hbar', 'measure': 'genre_counts', 'title': "Top 10 Genres"},
+                {'chart': 'donut', 'measure': 'rating_counts', 'title': "Content by Maturity Rating", 'hole': 0.5},
+            ]},
+            {'label': "📈 Temporal Analysis", 'subheader': "Content Release and Addition Trends", 'charts': [
+                {'chart': 'area', 'measure': 'added_quarterly', 'title': "Content Added to Netflix (Quarterly)",
+                 'labels': ("Date", "Titles Added")},
+                {'chart': 'column', 'measure': 'release_year_counts', 'title': "Content by Original Release Year",
+                 'labels': ("Release Year", "Number of Titles"), 'color': 1},
+            ]},
+            {'label': "🌍 Geographic Footprint", 'subheader': "Global Content Distribution", 'charts': [
+                {'chart': 'choropleth', 'measure': 'country_geo', 'title': "Content Production by Country"},
+            ]},
+            {'label': "⭐ TMDb Reception", **TMDB_TAB},
+            {'label': "💬 Descriptions", 'panel': 'descriptions'},
+            {'label': "🔄 Catalog Churn", 'panel': 'churn'},
+        ],
+        'insights': 'netflix',
+    },
+    "Prime Video": {
+        'title': "🔵 Prime Video Strategic Analysis",
+        'icon': "🔵",
+        'key_prefix': "prime",
+        'brand_color': "#00A8E1",
+        'logo': "https://upload.wikimedia.org/wikipedia/commons/thumb/1/11/Amazon_Prime_Video_logo.svg/1280px-Amazon_Prime_Video_logo.svg.png",
+        'theme': {'template': 'plotly_dark', 'colors': ['#00A8E1', '#1E3A8A'], 'scale': 'Blues', 'colormap': 'Blues'},
+        'kpis': [
+            {'label': "Total Titles", 'measure': 'titles', 'pick': 'total'},
+            {'label': "Movies", 'measure': 'type_counts', 'pick': 'Movie'},
+            {'label': "TV Shows", 'measure': 'type_counts', 'pick': 'TV Show'},
+            {'label': "Top Director", 'measure': 'director_counts', 'pick': 'top'},
+        ],
+        'tabs': [
+            {'label': "📚 Content Library", 'subheader': "Library Composition", 'widths': [1, 2], 'charts': [
+                {'chart': 'type_pie', 'measure': 'type_counts', 'title': "Content Type Distribution"},
+                {'chart': 'duration_histogram', 'measure': 'durations', 'title': "Movie Duration vs. TV Show Seasons"},
+            ]},
+            {'label': "📊 Genre & Audience", 'subheader': "Audience Targeting Analysis", 'charts': [
+                {'chart': 'donut', 'measure': 'genre_counts', 'title': "Top 10 Genres", 'hole': 0.6},
+                {'chart': 'funnel', 'measure': 'rating_counts', 'title': "Top Content Ratings"},
+            ]},
+            {'label': "📈 Temporal & Creator", 'subheader': "Content Release & Creator Strategy", 'charts': [
+                {'chart': 'area', 'measure': 'release_year_counts', 'title': "Titles Released by Year",
+                 'labels': ("Year", "Titles Released")},
+                {'chart': 'hbar', 'measure': 'director_counts', 'title': "Top 10 Directors"},
+            ]},
+            {'label': "🌍 Geographic Footprint", 'subheader': "Global Content Distribution", 'charts': [
+                {'chart': 'choropleth', 'measure': 'country_geo', 'title': "Content Production by Country"},
+            ]},
+            {'label': "⭐ TMDb Reception", **TMDB_TAB},
+            {'label': "💬 Descriptions", 'panel': 'descriptions'},
+            {'label': "🔄 Catalog Churn", 'panel': 'churn'},
+        ],
+        'insights': 'prime',
+    },
+    "Disney+": {
+        'title': "✨ Disney+ Universe Analytics",
+        'icon': "⚪",
+        'key_prefix': "disney",
+        'brand_color': "#3E82FC",
+        'logo': "https://upload.wikimedia.org/wikipedia/commons/3/3e/Disney%2B_logo.svg",
+        'theme': {'template': 'plotly_dark', 'colors': ['#3E82FC', '#1DA1F2'], 'scale': 'Blues', 'colormap': 'PuBu',
+                  'type_colors': {'Movie': '#3E82FC', 'TV Show': '#CFCF5A'}},
+        'kpis': [
+            {'label': "Total Titles", 'measure': 'titles', 'pick': 'total'},
+            {'label': "Movies", 'measure': 'type_counts', 'pick': 'Movie'},
+            {'label': "TV Shows", 'measure': 'type_counts', 'pick': 'TV Show'},
+            {'label': "Latest Content Year", 'measure': 'added_yearly', 'pick': 'last', 'scope': 'catalog'},
+        ],
+        'tabs': [
+            {'label': "📚 Content Overview", 'subheader': "Library Composition", 'widths': [1, 2], 'charts': [
+                {'chart': 'type_pie', 'measure': 'type_counts', 'title': "Content Type Distribution"},
+                {'chart': 'duration_histogram', 'measure': 'durations', 'title': "Movie Duration vs. TV Show Seasons"},
+            ]},
+            {'label': "📊 Genre & Rating Analysis", 'subheader': "Genre and Audience Analysis", 'charts': [
+                {'chart': 'vbar', 'measure': 'genre_counts', 'title': "Top 10 Genres"},
+                {'chart': 'treemap', 'measure': 'rating_counts', 'title': "Content by Maturity Rating"},
+            ]},
+            {'label': "📈 Temporal Trends", 'subheader': "Content Growth & Seasonality", 'charts': [
+                {'chart': 'line', 'measure': 'added_yearly', 'title': "Content Added Per Year",
+                 'labels': ("Year", "Titles Added")},
+                {'chart': 'polar', 'measure': 'added_by_month', 'title': "Content Added by Month", 'color': 1},
+            ]},
+            {'label': "🌍 Geographic Insights", 'subheader': "Geographic Production Insights", 'charts': [
+                {'chart': 'country_bar', 'measure': 'country_geo', 'title': "Top 15 Content Producing Countries", 'n': 15},
+            ]},
+            {'label': "⭐ TMDb Reception", **TMDB_TAB},
+            {'label': "💬 Descriptions", 'panel': 'descriptions'},
+            {'label': "🔄 Catalog Churn", 'panel': 'churn'},
+        ],
+        'insights': 'disney',
+    },
+    "Hulu": {
+        'title': "🟢 Hulu Content Landscape",
+        'icon': "🟢",
+        'key_prefix': "hulu",
+        'brand_color': "#3DBB3D",
+        'logo': "https://upload.wikimedia.org/wikipedia/commons/thumb/0/03/Hulu_logo_%282014%29.svg/2560px-Hulu_logo_%282014%29.svg.png",
+        'theme': {'template': 'seaborn', 'colors': ['#1CE783', '#3DBB3D'], 'scale': 'Greens', 'colormap': 'Greens'},
+        'kpis': [
+            {'label': "Total Titles (Filtered)", 'measure': 'titles', 'pick': 'total'},
+            {'label': "Movies", 'measure': 'type_counts', 'pick': 'Movie'},
+            {'label': "TV Shows", 'measure': 'type_counts', 'pick': 'TV Show'},
+            {'label': "Dominant Genre", 'measure': 'genre_counts', 'pick': 'top'},
+        ],
+        'tabs': [
+            {'label': "📚 Library Overview", 'subheader': "Content Acquisition Strategy", 'charts': [
+                {'chart': 'area', 'measure': 'added_monthly', 'title': "Content Added to Hulu Over Time",
+                 'labels': ("Month", "Titles Added")},
+                {'chart': 'histogram', 'measure': 'lag_years', 'title': "Lag Between Release and Addition",
+                 'mean_label': "Average Lag (Years)", 'figure_title': "Distribution of Content Lag",
+                 'x_label': 'lag_years', 'max': 20, 'color': 1},
+            ]},
+            {'label': "📊 Genre & Rating Insights", 'subheader': "Genre and Rating Breakdown", 'charts': [
+                {'chart': 'hbar', 'measure': 'genre_counts', 'title': "Top 10 Genres"},
+                {'chart': 'donut', 'measure': 'rating_counts', 'title': "Content by Rating", 'hole': 0.5},
+            ]},
+            {'label': "📈 Creator & Content Analysis", 'subheader': "Creator and Content Length Analysis", 'charts': [
+                {'chart': 'hbar', 'measure': 'director_counts', 'title': "Top 10 Directors by Content Volume",
+                 'labels': ("Number of Titles", "Director"), 'scale': 'Greens_r'},
+                {'chart': 'duration_histogram', 'measure': 'durations', 'title': "Content Duration Analysis"},
+            ]},
+            {'label': "⭐ TMDb Reception", **TMDB_TAB},
+            {'label': "💬 Descriptions", 'panel': 'descriptions'},
+            {'label': "🔄 Catalog Churn", 'panel': 'churn'},
+        ],
+        'insights': 'hulu',
+    },
+}
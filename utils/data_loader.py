@@ -1,6 +1,9 @@
 import streamlit as st
 import pandas as pd
 import os
+import hashlib
+import threading
+from collections import OrderedDict
 
 PLATFORM_FILES = {
     "Netflix": "netflix_titles.csv",
@@ -9,49 +12,215 @@ PLATFORM_FILES = {
     "Hulu": "hulu_titles.csv",
 }
 
-@st.cache_data
-def load_data(platform):
-    """Loads data for a single specified platform."""
-    filename = PLATFORM_FILES.get(platform)
-    if not filename:
-        st.error(f"Internal error: No filepath defined for '{platform}'.")
-        return None
-    
+# Wide free-text columns kept out of the main frames (see `load_text_columns`)
+TEXT_COLUMNS = ['cast', 'description']
+# Low-cardinality columns stored as pandas categoricals (dictionary encoded)
+CATEGORICAL_COLUMNS = ['type', 'rating', 'country', 'duration', 'listed_in', 'platform']
+# High-cardinality strings kept as Arrow-backed strings instead of Python objects
+STRING_COLUMNS = ['show_id', 'title', 'director']
+
+
+# Cached entries are keyed by catalog version; keep the served one and the one being warmed
+VERSIONS_KEPT = 2
+# Reads retried while the files keep changing under them
+SNAPSHOT_READ_ATTEMPTS = 3
+
+_served_version = None
+_snapshots = OrderedDict()
+_snapshots_lock = threading.Lock()
+_read_lock = threading.Lock()
+
+
+def data_path(filename):
     script_dir = os.path.dirname(os.path.abspath(__file__))
-    data_dir = os.path.join(script_dir, '..', 'data')
-    filepath = os.path.join(data_dir, filename)
-    
+    return os.path.join(script_dir, '..', 'data', filename)
+
+
+def catalog_fingerprint():
+    """Returns a short hash of the name, size and mtime of every CSV in `data/`."""
+    data_dir = data_path('')
+    digest = hashlib.sha1()
+    for filename in sorted(os.listdir(data_dir)):
+        if filename.endswith('.csv'):
+            stat = os.stat(os.path.join(data_dir, filename))
+            digest.update(f"{filename}:{stat.st_size}:{stat.st_mtime_ns};".encode())
+    return digest.hexdigest()[:12]
+
+
+def data_version():
+    """Returns the catalog version currently served to users."""
+    global _served_version
+    if _served_version is None:
+        _served_version = catalog_snapshot(catalog_fingerprint()).version
+    return _served_version
+
+
+def publish_data_version(version):
+    """Atomically switches users to a catalog version whose caches are already warm."""
+    global _served_version
+    _served_version = version
+
+
+def compact_frame(df):
+    """Converts a raw catalog frame to its compact in-memory representation."""
+    df = df.copy()
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    for col in STRING_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('string[pyarrow]')
+    if 'release_year' in df.columns:
+        df['release_year'] = pd.to_numeric(df['release_year'], downcast='integer')
+    if 'date_added' in df.columns and not pd.api.types.is_datetime64_any_dtype(df['date_added']):
+        df['date_added'] = pd.to_datetime(df['date_added'].astype('string').str.strip(), format='mixed', errors='coerce')
+    return df
+
+
+class CatalogSnapshot:
+    """
+    The catalog files of one version, read in a single pass. Every
+    version-keyed cache is built from a snapshot and keyed by its `version`,
+    so no cache entry mixes the contents of two versions of the files. Only
+    the compact per-platform frames are held; the text side store and the
+    combined catalog are built on demand.
+    """
+
+    def __init__(self, version, frames):
+        self.version = version
+        self.frames = {platform: compact_frame(df) for platform, df in frames.items() if df is not None}
+
+    def frame(self, platform=None):
+        """One platform's compact frame (None if its file is missing), or the combined catalog."""
+        if platform:
+            return self.frames.get(platform)
+        if not self.frames:
+            return pd.DataFrame()
+        # Categoricals are re-applied after the concat so all platforms share one dictionary
+        return compact_frame(pd.concat([df.assign(platform=platform) for platform, df in self.frames.items()],
+                                       ignore_index=True))
+
+    def text(self, platform=None):
+        """The free-text columns, rows aligned with `frame(platform)`."""
+        return load_text_columns(platform, self)
+
+
+def _read_snapshot():
+    """Reads every catalog file, retrying until the fingerprint is the same before and after the read."""
+    for _ in range(SNAPSHOT_READ_ATTEMPTS):
+        version = catalog_fingerprint()
+        frames = {}
+        for platform, filename in PLATFORM_FILES.items():
+            try:
+                frames[platform] = pd.read_csv(data_path(filename), usecols=lambda col: col not in TEXT_COLUMNS)
+            except FileNotFoundError:
+                frames[platform] = None
+        if catalog_fingerprint() == version:
+            break
+    return CatalogSnapshot(version, frames)
+
+
+def _hold(snapshot):
+    _snapshots[snapshot.version] = snapshot
+    for version in list(_snapshots):
+        if len(_snapshots) <= VERSIONS_KEPT:
+            break
+        if version not in (_served_version, snapshot.version):
+            del _snapshots[version]
+
+
+def catalog_snapshot(version=None):
+    """
+    The snapshot of a catalog version (default: the served one); a snapshot
+    is passed through. A version no longer held resolves to the files on disk
+    now, so callers must key what they build by the returned `version`.
+    """
+    if isinstance(version, CatalogSnapshot):
+        return version
+    version = version or data_version()
+    with _snapshots_lock:
+        snapshot = _snapshots.get(version)
+    if snapshot is not None:
+        return snapshot
+    # Readers of held versions never wait on this lock
+    with _read_lock:
+        with _snapshots_lock:
+            snapshot = _snapshots.get(version) or _snapshots.get(catalog_fingerprint())
+        if snapshot is None:
+            snapshot = _read_snapshot()
+            with _snapshots_lock:
+                _hold(snapshot)
+    return snapshot
+
+
+def load_data(platform, version=None):
+    """
+    The compact frame of a single platform (None if its file is missing).
+    The snapshot's own frame is returned, not a copy, so treat it as read-only.
+    """
+    snapshot = catalog_snapshot(version)
+    return snapshot.frame(platform) if platform in PLATFORM_FILES else None
+
+def load_all_data(version=None):
+    """Combines the compact frames of all platforms (empty if no file could be read)."""
+    return catalog_snapshot(version).frame()
+
+
+def load_text_columns(platform=None, version=None):
+    """
+    Loads the free-text side store (`cast`, `description`) on demand.
+
+    Rows line up with `load_data(platform)`, or with `load_all_data()` when
+    `platform` is None, so the result can be joined on the index.
+    """
+    snapshot = catalog_snapshot(version)
+    if platform is None:
+        parts = [_load_text_columns(name, snapshot.version, snapshot) for name in snapshot.frames]
+        return (pd.concat(parts, ignore_index=True) if parts
+                else pd.DataFrame(columns=TEXT_COLUMNS, dtype='string[pyarrow]'))
+    return _load_text_columns(platform, snapshot.version, snapshot)
+
+@st.cache_data(max_entries=VERSIONS_KEPT * len(PLATFORM_FILES), show_spinner=False)
+def _load_text_columns(platform, version, _snapshot):
+    df = _snapshot.frame(platform)
+    if df is None:
+        return pd.DataFrame(columns=TEXT_COLUMNS, dtype='string[pyarrow]')
     try:
-        df = pd.read_csv(filepath)
-        return df
+        text = pd.read_csv(data_path(PLATFORM_FILES[platform]), usecols=lambda col: col in TEXT_COLUMNS + ['show_id'])
     except FileNotFoundError:
-        st.error(f"Dataset for {platform} not found. Please check the `data` folder for `{filename}`.")
-        return None
-
-@st.cache_data
-def load_all_data():
-    """Loads and combines data from all platforms."""
-    all_dfs = []
-    for platform, filename in PLATFORM_FILES.items():
-        # Re-use the single load_data logic but suppress errors for combo view
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        data_dir = os.path.join(script_dir, '..', 'data')
-        filepath = os.path.join(data_dir, filename)
-        
-        try:
-            df = pd.read_csv(filepath)
-            df['platform'] = platform
-            all_dfs.append(df)
-        except FileNotFoundError:
-            # Silently skip if a file is missing for the combined view
-            pass
-            
-    if not all_dfs:
-        st.error("No datasets could be loaded. Please check the `data` folder.")
-        return pd.DataFrame()
-        
-    combined_df = pd.concat(all_dfs, ignore_index=True)
-    # Basic cleaning
-    combined_df['date_added'] = pd.to_datetime(combined_df['date_added'], errors='coerce')
-    return combined_df
+        text = pd.DataFrame()
+    aligned = len(text) == len(df) and ('show_id' not in df.columns
+                                        or text['show_id'].astype('string').equals(df['show_id'].astype('string')))
+    if not aligned:
+        # The file changed since this version was read; blanks rather than another version's rows
+        text = pd.DataFrame(index=range(len(df)))
+    return text.reindex(columns=TEXT_COLUMNS).set_axis(df.index).astype('string[pyarrow]')
+
+
+def memory_report(platform=None):
+    """
+    Bytes per column of the raw CSV load versus what a worker holds: the
+    compact frames of a catalog snapshot, and the text side store once a
+    text feature has loaded it.
+    """
+    platforms = [platform] if platform else list(PLATFORM_FILES)
+    snapshot = catalog_snapshot()
+    raw_df = pd.concat([pd.read_csv(data_path(PLATFORM_FILES[name])) for name in platforms if name in snapshot.frames],
+                       ignore_index=True)
+    held = [snapshot.frame(name) for name in platforms if name in snapshot.frames]
+    text = [load_text_columns(name, snapshot) for name in platforms if name in snapshot.frames]
+
+    before = raw_df.memory_usage(deep=True, index=False)
+    main_after = sum(df.memory_usage(deep=True, index=False) for df in held)
+    text_after = sum(df.memory_usage(deep=True, index=False) for df in text)
+    after = pd.concat([main_after, text_after])
+    report = pd.DataFrame({'bytes_before': before, 'bytes_after': after.reindex(before.index)})
+    report['stored_in'] = ['side store' if col in TEXT_COLUMNS else 'snapshot' for col in report.index]
+    report.loc['TOTAL'] = [before.sum(), after.sum(), '']
+    report.loc['TOTAL (snapshot, per version held)'] = [before.sum(), main_after.sum(), 'snapshot']
+    report.loc['TOTAL (side store, once loaded)'] = [0, text_after.sum(), 'side store']
+    return report
+
 
+if __name__ == "__main__":
+    print(memory_report().to_string())
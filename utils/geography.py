@@ -0,0 +1,84 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.data_loader import catalog_snapshot, data_path, PLATFORM_FILES, VERSIONS_KEPT
+from utils.bitmap_index import category_codes
+
+COUNTRY_CODES_FILE = "country_codes.csv"
+
+
+@st.cache_data(show_spinner=False)
+def load_country_codes():
+    """
+    Loads the country alias table.
+
+    Returns ({lowercase name or alias: ISO-3 code}, {ISO-3 code: display name}).
+    The first name listed for a code in `data/country_codes.csv` is its display name.
+    """
+    df = pd.read_csv(data_path(COUNTRY_CODES_FILE), keep_default_na=False)
+    aliases = dict(zip(df['name'].str.lower(), df['iso3']))
+    display_names = df.drop_duplicates('iso3').set_index('iso3')['name'].to_dict()
+    return aliases, display_names
+
+
+class CountryIndex:
+    """
+    Resolves a catalog's `country` column to ISO-3 codes once.
+
+    Only the unique country strings are split and looked up. Each title is
+    linked to its codes through its categorical code, so counting titles per
+    country for any row mask is two `np.bincount` calls, not an explode.
+    """
+
+    def __init__(self, country, aliases, display_names):
+        self.row_codes, labels = category_codes(country)
+        self.n_labels = len(labels)
+
+        tokens = pd.Series(labels).str.split(',').explode().str.strip()
+        tokens = tokens[tokens.notna() & (tokens != '')]
+        iso = tokens.str.lower().map(aliases)
+
+        titles_per_label = np.bincount(self.row_codes[self.row_codes >= 0], minlength=self.n_labels)
+        unmatched = tokens[iso.isna()]
+        self.unmatched = (pd.Series(titles_per_label[unmatched.index.to_numpy()], index=unmatched.to_numpy())
+                          .groupby(level=0).sum().sort_values(ascending=False))
+
+        # A title lists e.g. "West Germany, Germany" once per code, not twice
+        pairs = pd.DataFrame({'label': iso.dropna().index, 'iso3': iso.dropna().to_numpy()}).drop_duplicates()
+        pair_codes, self.codes = pd.factorize(pairs['iso3'], sort=True)
+        self.pair_labels = pairs['label'].to_numpy()
+        self.pair_codes = pair_codes
+        self.names = np.array([display_names.get(code, code) for code in self.codes], dtype=object)
+
+    def counts(self, mask=None):
+        """Titles per ISO-3 code for the rows selected by `mask` (all rows if None)."""
+        row_codes = self.row_codes if mask is None else self.row_codes[mask]
+        return self.label_counts(np.bincount(row_codes[row_codes >= 0], minlength=self.n_labels))
+
+    def label_counts(self, per_label):
+        """Titles per ISO-3 code from titles per `country` label, e.g. counted in `page_planner`'s fused pass."""
+        per_code = np.bincount(self.pair_codes, weights=per_label[self.pair_labels], minlength=len(self.codes))
+        counts = pd.DataFrame({'iso3': np.asarray(self.codes), 'country': self.names,
+                               'titles': per_code.astype(np.int64)})
+        counts = counts[counts['titles'] > 0]
+        return counts.sort_values('titles', ascending=False, kind='stable').reset_index(drop=True)
+
+
+def get_country_index(platform=None, version=None):
+    """Returns the ISO-3 country index for one platform, or the combined catalog when `platform` is None."""
+    snapshot = catalog_snapshot(version)
+    return _build_country_index(platform, snapshot.version, snapshot)
+
+@st.cache_resource(max_entries=VERSIONS_KEPT * (len(PLATFORM_FILES) + 1), show_spinner=False)
+def _build_country_index(platform, version, _snapshot):
+    df = _snapshot.frame(platform)
+    if df is None or 'country' not in df.columns:
+        return None
+    aliases, display_names = load_country_codes()
+    return CountryIndex(df['country'], aliases, display_names)
+
+
+def unmatched_countries(platform=None):
+    """Country names with no ISO-3 code in the alias table, with their title counts."""
+    geo = get_country_index(platform)
+    return geo.unmatched if geo is not None else pd.Series(dtype=np.int64)
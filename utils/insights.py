@@ -1,28 +1,29 @@
 import streamlit as st
 import pandas as pd
+import numpy as np
 
-def generate_netflix_insights(df):
+def generate_netflix_insights(aggregates):
     st.subheader("BI-Powered Recommendations 🧠")
     with st.expander("Show Strategic Insights", expanded=True):
         
         # Insight 1: Content Mix
-        movie_percent = (df[df['type'] == 'Movie'].shape[0] / df.shape[0]) * 100
+        movie_percent = (aggregates['type_counts'].get('Movie', 0) / max(aggregates['titles'], 1)) * 100
         st.markdown(f"""
         - **Content Mix Analysis:** Movies constitute **{movie_percent:.1f}%** of the selected content. A balanced portfolio is key.
           - _Recommendation:_ If heavily skewed, consider diversifying acquisitions to cater to varied audience preferences.
         """)
 
         # Insight 2: Genre Dominance
-        if not df['listed_in'].dropna().empty:
-            top_genre = df['listed_in'].str.split(', ').explode().mode()[0]
+        if not aggregates['genre_counts'].empty:
+            top_genre = aggregates['genre_counts'].index[0]
             st.markdown(f"""
         - **Genre Focus:** **'{top_genre}'** is the most frequent genre. This indicates a strong brand identity in this category.
           - _Recommendation:_ While leveraging this strength, explore niche, high-growth genres to capture new market segments.
         """)
 
         # Insight 3: Content Freshness
-        df['release_year'] = pd.to_numeric(df['release_year'], errors='coerce')
-        avg_age = pd.Timestamp.now().year - df['release_year'].mean()
+        release_years = aggregates['release_year_counts']
+        avg_age = pd.Timestamp.now().year - np.average(release_years.index, weights=release_years.values) if not release_years.empty else np.nan
         st.markdown(f"""
         - **Library Age:** The average age of content is **{avg_age:.1f} years**. A mix of classic and recent titles is crucial.
           - _Recommendation:_ A high average age may suggest a need to invest in more recent, trending content to stay competitive.
@@ -31,7 +32,7 @@ def generate_netflix_insights(df):
         st.markdown('</div>', unsafe_allow_html=True)
 
 
-def generate_prime_insights(df):
+def generate_prime_insights(aggregates):
     st.subheader("BI-Powered Recommendations 🧠")
     with st.expander("Show Strategic Insights", expanded=True):
         
@@ -44,7 +45,7 @@ def generate_prime_insights(df):
         st.markdown('</div>', unsafe_allow_html=True)
 
 
-def generate_disney_insights(df):
+def generate_disney_insights(aggregates):
     st.subheader("BI-Powered Recommendations 🧠")
     with st.expander("Show Strategic Insights", expanded=True):
 
@@ -58,15 +59,12 @@ def generate_disney_insights(df):
         st.markdown('</div>', unsafe_allow_html=True)
 
 
-def generate_hulu_insights(df):
+def generate_hulu_insights(aggregates):
     st.subheader("BI-Powered Recommendations 🧠")
     with st.expander("Show Strategic Insights"):
         
         # Insight 1: Content Lag
-        df['date_added'] = pd.to_datetime(df['date_added'], errors='coerce')
-        df['year_added'] = df['date_added'].dt.year
-        df['lag_years'] = df['year_added'] - df['release_year']
-        avg_lag = df[df['lag_years'] >= 0]['lag_years'].mean()
+        avg_lag = aggregates['lag_years'].mean() if len(aggregates['lag_years']) else np.nan
         st.markdown(f"""
         - **Licensed Content Focus:** With an average content lag of **{avg_lag:.1f} years**, Hulu's strategy relies heavily on a deep back-catalog of licensed shows and movies. This is a cost-effective model for content volume.
         - **TV Show Powerhouse:** Hulu's strength lies in its vast and timely TV Show library, often featuring episodes shortly after they air. This is a major competitive advantage for retaining subscribers who follow current broadcast schedules.
@@ -75,3 +73,11 @@ def generate_hulu_insights(df):
 
         st.markdown('</div>', unsafe_allow_html=True)
 
+
+# Dashboard spec name -> (renderer, the `page_planner` aggregates it reads)
+INSIGHTS = {
+    'netflix': (generate_netflix_insights, ('titles', 'type_counts', 'genre_counts', 'release_year_counts')),
+    'prime': (generate_prime_insights, ()),
+    'disney': (generate_disney_insights, ()),
+    'hulu': (generate_hulu_insights, ('lag_years',)),
+}
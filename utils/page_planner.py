@@ -0,0 +1,230 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import copy
+from utils.data_loader import catalog_snapshot, PLATFORM_FILES, VERSIONS_KEPT
+from utils.bitmap_index import category_codes, month_ordinal, get_bitmap_index
+from utils.geography import get_country_index
+from utils.tmdb_enrichment import load_enrichment, enrichment_version
+
+# Columns whose values are ", "-separated lists, counted per listed value
+MULTI_COLUMNS = {'genre': 'listed_in', 'country': 'country', 'director': 'director'}
+# Single-valued columns counted per value
+SINGLE_COLUMNS = {'type': 'type', 'rating': 'rating'}
+MONTH_NAMES = ["January", "February", "March", "April", "May", "June", "July",
+               "August", "September", "October", "November", "December"]
+# TMDb ratings from fewer votes are left out of rating charts
+MIN_TMDB_VOTES = 10
+# Genres with fewer rated titles are left out of the genre rating chart
+MIN_GENRE_TITLES = 5
+
+
+class ColumnStore:
+    """
+    The per-row inputs every dashboard aggregate is built from, derived once
+    per catalog version.
+
+    Categorical columns are kept as integer codes; list columns are split on
+    their (small) label dictionary only, with a label -> value pair table, so
+    counting values for any row mask is two `np.bincount` calls instead of a
+    split and explode per chart. Durations are parsed and dates turned into
+    month numbers once. TMDb columns from `tmdb_enrichment` are carried as
+    plain arrays (NaN where a title has no match), and the platform's
+    `CountryIndex` maps country label counts to ISO-3 codes for the maps.
+    """
+
+    def __init__(self, df, enrichment=None, geo=None):
+        self.n_rows = len(df)
+        self.geo = geo
+        self.codes = {}
+        self.labels = {}
+        self.n_labels = {}
+        self.pairs = {}
+        for name, column in {**SINGLE_COLUMNS, **MULTI_COLUMNS}.items():
+            if column not in df.columns:
+                continue
+            self.codes[name], labels = category_codes(df[column])
+            self.n_labels[name] = len(labels)
+            if name in MULTI_COLUMNS:
+                tokens = pd.Series(labels, dtype=object).str.split(',').explode().str.strip()
+                tokens = tokens[tokens.notna() & (tokens != '')]
+                # A label listing a value twice still counts its titles once
+                pairs = pd.DataFrame({'label': tokens.index, 'value': tokens.to_numpy()}).drop_duplicates()
+                token_codes, self.labels[name] = pd.factorize(pairs['value'])
+                self.pairs[name] = (pairs['label'].to_numpy(), token_codes)
+            else:
+                self.labels[name] = labels
+
+        codes, labels = category_codes(df['duration'])
+        numbers = pd.Series(labels).str.extract(r'(\d+)')[0].astype(float).to_numpy()
+        self.duration = np.where(codes >= 0, numbers[codes], np.nan) if len(labels) else np.full(len(df), np.nan)
+        self.release_year = pd.to_numeric(df['release_year'], errors='coerce').fillna(-1).to_numpy(dtype=np.int64)
+        self.month_added = month_ordinal(df['date_added'])
+
+        self.title = df['title'].to_numpy(dtype=object)
+        for name in ('vote_average', 'vote_count', 'popularity'):
+            values = enrichment[f"tmdb_{name}"] if enrichment is not None else pd.Series(index=df.index, dtype=float)
+            setattr(self, f"tmdb_{name}", values.to_numpy(dtype=float, na_value=np.nan))
+
+    def select(self, mask):
+        """The same columns restricted to the rows of a boolean mask, filtered in one pass."""
+        selected = copy.copy(self)
+        selected.n_rows = int(mask.sum())
+        selected.codes = {name: codes[mask] for name, codes in self.codes.items()}
+        selected.duration = self.duration[mask]
+        selected.release_year = self.release_year[mask]
+        selected.month_added = self.month_added[mask]
+        selected.title = self.title[mask]
+        selected.tmdb_vote_average = self.tmdb_vote_average[mask]
+        selected.tmdb_vote_count = self.tmdb_vote_count[mask]
+        selected.tmdb_popularity = self.tmdb_popularity[mask]
+        return selected
+
+    def value_totals(self, name, rows=None, weights=None):
+        """Per value of a column, the rows (or the sum of `weights`) listing it, for the rows of an optional mask."""
+        codes = self.codes[name]
+        keep = codes >= 0 if rows is None else (codes >= 0) & rows
+        per_label = np.bincount(codes[keep], weights=None if weights is None else weights[keep],
+                                minlength=self.n_labels[name])
+        if name in self.pairs:
+            label_ids, token_codes = self.pairs[name]
+            totals = np.bincount(token_codes, weights=per_label[label_ids], minlength=len(self.labels[name]))
+        else:
+            totals = per_label
+        return pd.Series(totals, index=pd.Index(np.asarray(self.labels[name]), name=name))
+
+    def value_counts(self, name):
+        """Titles per value of a column, most common first."""
+        counts = self.value_totals(name).astype(np.int64)
+        return counts[counts > 0].sort_values(ascending=False, kind='stable')
+
+
+def _months(columns):
+    return columns.month_added[columns.month_added >= 0]
+
+def _series(periods, step, freq):
+    """Titles per period (months // step) as a gap-free, period-end indexed series."""
+    if not len(periods):
+        return pd.Series(dtype=np.int64)
+    first = periods.min()
+    counts = np.bincount(periods - first)
+    start = pd.Timestamp(year=int(first * step // 12), month=int(first * step % 12) + 1, day=1)
+    return pd.Series(counts, index=pd.date_range(start, periods=len(counts), freq=freq))
+
+def _added_yearly(columns):
+    years, counts = np.unique(_months(columns) // 12, return_counts=True)
+    return pd.Series(counts, index=years)
+
+def _added_by_month(columns):
+    return pd.Series(np.bincount(_months(columns) % 12, minlength=12), index=MONTH_NAMES)
+
+def _release_years(columns):
+    years, counts = np.unique(columns.release_year[columns.release_year >= 0], return_counts=True)
+    return pd.Series(counts, index=years)
+
+def _durations(columns):
+    labels = np.asarray(columns.labels['type'])
+    known = ~np.isnan(columns.duration)
+    # Titles without a type are in neither histogram
+    return {content_type: columns.duration[np.isin(columns.codes['type'], np.flatnonzero(labels == content_type))
+                                           & known]
+            for content_type in ('Movie', 'TV Show')}
+
+def _country_geo(columns):
+    if columns.geo is None or 'country' not in columns.codes:
+        return pd.DataFrame(columns=['iso3', 'country', 'titles'])
+    codes = columns.codes['country']
+    # Same column, same `category_codes` labels as the CountryIndex
+    return columns.geo.label_counts(np.bincount(codes[codes >= 0], minlength=columns.n_labels['country']))
+
+def _lag_years(columns):
+    lag = columns.month_added // 12 - columns.release_year
+    return lag[(columns.month_added >= 0) & (columns.release_year >= 0) & (lag >= 0)]
+
+def _tmdb_rated(columns):
+    return (columns.tmdb_vote_count >= MIN_TMDB_VOTES) & ~np.isnan(columns.tmdb_vote_average)
+
+def _tmdb_genre_ratings(columns):
+    rated = _tmdb_rated(columns)
+    titles = columns.value_totals('genre', rows=rated)
+    ratings = columns.value_totals('genre', rows=rated, weights=columns.tmdb_vote_average)
+    enough = titles >= MIN_GENRE_TITLES
+    return (ratings[enough] / titles[enough]).round(2).sort_values(ascending=False, kind='stable')
+
+def _tmdb_popular_titles(columns, n=10):
+    known = np.flatnonzero(~np.isnan(columns.tmdb_popularity))
+    top = known[np.argsort(-columns.tmdb_popularity[known], kind='stable')[:n]]
+    return pd.Series(columns.tmdb_popularity[top], index=pd.Index(columns.title[top], name='title'))
+
+
+# Aggregate name -> function of the selected columns. Pages name the
+# aggregates they need; `plan_page` collects them and `page_aggregates`
+# evaluates each once over a single filtered copy of the columns.
+MEASURES = {
+    'titles': lambda columns: columns.n_rows,
+    'type_counts': lambda columns: columns.value_counts('type'),
+    'rating_counts': lambda columns: columns.value_counts('rating'),
+    'genre_counts': lambda columns: columns.value_counts('genre'),
+    'country_counts': lambda columns: columns.value_counts('country'),
+    'director_counts': lambda columns: columns.value_counts('director'),
+    'country_geo': _country_geo,
+    'durations': _durations,
+    'release_year_counts': _release_years,
+    'added_monthly': lambda columns: _series(_months(columns), 1, 'ME'),
+    'added_quarterly': lambda columns: _series(_months(columns) // 3, 3, 'QE'),
+    'added_yearly': _added_yearly,
+    'added_by_month': _added_by_month,
+    'lag_years': _lag_years,
+    'tmdb_matched': lambda columns: int((~np.isnan(columns.tmdb_popularity)).sum()),
+    'tmdb_ratings': lambda columns: columns.tmdb_vote_average[_tmdb_rated(columns)],
+    'tmdb_genre_ratings': _tmdb_genre_ratings,
+    'tmdb_popular_titles': _tmdb_popular_titles,
+}
+
+
+def plan_page(spec, insight_measures=()):
+    """The sorted, de-duplicated aggregates a dashboard spec needs for its KPIs, charts and insights."""
+    measures = {kpi['measure'] for kpi in spec['kpis']}
+    for tab in spec['tabs']:
+        measures.update(chart['measure'] for chart in tab.get('charts', ()) if chart.get('measure'))
+        if tab.get('requires'):
+            measures.add(tab['requires'])
+    measures.update(insight_measures)
+    return tuple(sorted(measures))
+
+
+def get_column_store(platform, version=None, enrichment=None):
+    """Returns the dashboard column store of one platform's catalog and its TMDb enrichment."""
+    snapshot = catalog_snapshot(version)
+    enrichment = enrichment if enrichment is not None else enrichment_version()
+    return _build_column_store(platform, snapshot.version, enrichment, snapshot)
+
+@st.cache_resource(max_entries=VERSIONS_KEPT * len(PLATFORM_FILES), show_spinner=False)
+def _build_column_store(platform, version, enrichment, _snapshot):
+    df = _snapshot.frame(platform)
+    if df is None:
+        return None
+    return ColumnStore(df, load_enrichment(platform, _snapshot, enrichment) if enrichment else None,
+                       get_country_index(platform, _snapshot))
+
+
+def page_aggregates(platform, selection=(), measures=(), version=None, enrichment=None):
+    """
+    Evaluates `measures` for a platform and a filter selection key (see
+    `bitmap_index.selection_key`) in one pass: the selection filters the
+    pre-derived columns once and every aggregate reads that filtered copy.
+    Returns {measure: result}, cached per selection, data version and
+    enrichment version (the served ones by default).
+    """
+    snapshot = catalog_snapshot(version)
+    enrichment = enrichment if enrichment is not None else enrichment_version()
+    return _page_aggregates(platform, selection, tuple(measures), snapshot.version, enrichment, snapshot)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _page_aggregates(platform, selection, measures, version, enrichment, _snapshot):
+    store = get_column_store(platform, _snapshot, enrichment)
+    if store is None:
+        return None
+    index = get_bitmap_index(platform, _snapshot)
+    columns = store.select(index.to_mask(index.evaluate(dict(selection)))) if selection else store
+    return {measure: MEASURES[measure](columns) for measure in measures}
@@ -0,0 +1,191 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import scipy.sparse as sp
+from utils.data_loader import catalog_snapshot, PLATFORM_FILES, VERSIONS_KEPT
+
+ROLES = ['cast', 'director']
+PAGERANK_DAMPING = 0.85
+PAGERANK_ITERATIONS = 50
+
+
+def _person_title_pairs(column):
+    """Splits a comma-separated people column into (row position, name) pairs."""
+    names = column.str.split(',').explode().str.strip()
+    # Drops blanks and stray tokens such as "1" that carry no letters
+    names = names[names.notna() & names.str.contains(r'[^\W\d_]', regex=True).fillna(False)]
+    return names.index.to_numpy(), names.to_numpy(dtype=object)
+
+
+def _binary(matrix):
+    matrix = matrix.tocsr()
+    matrix.sum_duplicates()
+    matrix.data[:] = 1
+    return matrix
+
+
+class PeopleGraph:
+    """
+    Cast and crew collaboration graph over the combined catalog.
+
+    `incidence[role]` is a sparse titles × people matrix; everything else is a
+    sparse product of those. Two people are linked by the number of titles
+    they share (`B.T @ B`), and a person's collaborators, degree and
+    centrality all come from that co-occurrence matrix.
+    """
+
+    def __init__(self, catalog, text):
+        positions = {'cast': _person_title_pairs(text['cast']),
+                     'director': _person_title_pairs(catalog['director'])}
+        codes, people = pd.factorize(np.concatenate([names for _, names in positions.values()]))
+        self.people = np.asarray(people, dtype=object)
+        self.n_titles = len(catalog)
+        shape = (self.n_titles, len(self.people))
+
+        self.incidence = {}
+        offset = 0
+        for role in ROLES:
+            rows, names = positions[role]
+            cols = codes[offset:offset + len(names)]
+            offset += len(names)
+            self.incidence[role] = _binary(sp.coo_matrix((np.ones(len(rows), np.int32), (rows, cols)), shape=shape))
+        self.titles = _binary(self.incidence['cast'] + self.incidence['director'])
+        self.platform_codes, self.platforms = pd.factorize(catalog['platform'].astype(str))
+
+    def subgraph(self, mask=None):
+        """Co-occurrence statistics for the titles selected by a boolean row mask (all titles if None)."""
+        rows = np.arange(self.n_titles) if mask is None else np.flatnonzero(mask)
+        titles = self.titles[rows]
+        incidence = {role: matrix[rows] for role, matrix in self.incidence.items()}
+
+        cooccurrence = (titles.T @ titles).tocsr()
+        title_counts = cooccurrence.diagonal()
+        cooccurrence.setdiag(0)
+        cooccurrence.eliminate_zeros()
+        role_counts = {role: np.asarray(matrix.sum(axis=0)).ravel() for role, matrix in incidence.items()}
+        # Director × actor title counts, for the partnerships table
+        partnerships = (incidence['director'].T @ incidence['cast']).tocsr()
+        partnerships.setdiag(0)
+        partnerships.eliminate_zeros()
+        platform_onehot = sp.csr_matrix((np.ones(len(rows)), (np.arange(len(rows)), self.platform_codes[rows])),
+                                        shape=(len(rows), len(self.platforms)))
+        platform_counts = (titles.T @ platform_onehot).toarray()
+        return CollaborationStats(self, cooccurrence, title_counts, role_counts, partnerships, platform_counts)
+
+
+class CollaborationStats:
+    """Co-occurrence, degree and centrality of a PeopleGraph restricted to a set of titles."""
+
+    def __init__(self, graph, cooccurrence, title_counts, role_counts, partnerships, platform_counts):
+        self.graph = graph
+        self.cooccurrence = cooccurrence
+        self.title_counts = title_counts
+        self.role_counts = role_counts
+        self.partnerships = partnerships
+        self.platform_counts = platform_counts
+        self.degree = np.diff(cooccurrence.indptr)
+        self.weighted_degree = np.asarray(cooccurrence.sum(axis=1)).ravel()
+        self.centrality = self._pagerank()
+
+    @classmethod
+    def combine(cls, parts):
+        """Statistics over the union of disjoint title sets, e.g. several platforms, from each set's statistics."""
+        return cls(parts[0].graph, sum(part.cooccurrence for part in parts).tocsr(),
+                   sum(part.title_counts for part in parts),
+                   {role: sum(part.role_counts[role] for part in parts) for role in ROLES},
+                   sum(part.partnerships for part in parts).tocsr(), sum(part.platform_counts for part in parts))
+
+    def _pagerank(self):
+        """
+        Weighted PageRank by power iteration, scaled so the most central person
+        scores 1. Unlike eigenvector centrality it doesn't collapse onto the
+        single densest clique (e.g. a long-running show's regular cast).
+        """
+        n = self.cooccurrence.shape[0]
+        if n == 0:
+            return np.zeros(0)
+        out_weight = self.weighted_degree.astype(np.float64)
+        dangling = out_weight == 0
+        inv_weight = np.divide(1.0, out_weight, out=np.zeros(n), where=~dangling)
+        transition = (sp.diags(inv_weight) @ self.cooccurrence).T.tocsr()
+        rank = np.full(n, 1.0 / n)
+        for _ in range(PAGERANK_ITERATIONS):
+            rank = (PAGERANK_DAMPING * (transition @ rank + rank[dangling].sum() / n)
+                    + (1 - PAGERANK_DAMPING) / n)
+        return rank / rank.max()
+
+    def _people_frame(self, ids):
+        platforms = self.platform_counts[ids]
+        return pd.DataFrame({
+            'person_id': ids,
+            'person': self.graph.people[ids],
+            'titles': self.title_counts[ids],
+            'as_cast': self.role_counts['cast'][ids],
+            'as_director': self.role_counts['director'][ids],
+            'collaborators': self.degree[ids],
+            'centrality': self.centrality[ids],
+            'platforms': [', '.join(self.graph.platforms[row > 0]) for row in platforms],
+        })
+
+    def top_people(self, n=20, by='centrality', role=None):
+        """The `n` highest-ranked people, optionally only those credited in `role`."""
+        scores = {'centrality': self.centrality, 'collaborators': self.degree, 'titles': self.title_counts}[by]
+        candidates = np.flatnonzero(self.role_counts[role] > 0) if role else np.flatnonzero(self.title_counts > 0)
+        top = candidates[np.argsort(-scores[candidates], kind='stable')[:n]]
+        return self._people_frame(top).reset_index(drop=True)
+
+    def top_collaborators(self, person_id, n=15):
+        """The people who share the most titles with `person_id`."""
+        start, end = self.cooccurrence.indptr[person_id], self.cooccurrence.indptr[person_id + 1]
+        ids, shared = self.cooccurrence.indices[start:end], self.cooccurrence.data[start:end]
+        order = np.argsort(-shared, kind='stable')[:n]
+        collaborators = self._people_frame(ids[order])
+        collaborators.insert(2, 'shared_titles', shared[order])
+        return collaborators
+
+    def top_partnerships(self, n=20):
+        """Director–actor pairs with the most titles together."""
+        pairs = self.partnerships.tocoo()
+        top = np.argsort(-pairs.data, kind='stable')[:n]
+        return pd.DataFrame({'director': self.graph.people[pairs.row[top]],
+                             'actor': self.graph.people[pairs.col[top]],
+                             'titles': pairs.data[top]})
+
+    def find_people(self, query, n=50):
+        """Ids of people whose name contains `query`, most credited first."""
+        names = pd.Series(self.graph.people)
+        ids = np.flatnonzero(names.str.contains(query, case=False, regex=False).to_numpy() & (self.title_counts > 0))
+        return ids[np.argsort(-self.title_counts[ids], kind='stable')[:n]]
+
+
+def get_people_graph(version=None):
+    """Returns the cast and crew graph of the combined catalog."""
+    snapshot = catalog_snapshot(version)
+    return _build_people_graph(snapshot.version, snapshot)
+
+@st.cache_resource(max_entries=VERSIONS_KEPT, show_spinner=False)
+def _build_people_graph(version, _snapshot):
+    catalog = _snapshot.frame()
+    if catalog.empty:
+        return None
+    return PeopleGraph(catalog, _snapshot.text())
+
+
+def get_collaboration_stats(platforms=(), version=None):
+    """Collaboration statistics for titles on the given platforms (every platform if empty)."""
+    snapshot = catalog_snapshot(version)
+    platforms = sorted(platforms) if set(PLATFORM_FILES) - set(platforms) else []
+    if len(platforms) <= 1:
+        return _collaboration_stats(platforms[0] if platforms else None, snapshot.version, snapshot)
+    # Platforms hold disjoint titles, so a mix is the sum of the cached single-platform counts
+    parts = [_collaboration_stats(platform, snapshot.version, snapshot) for platform in platforms]
+    return CollaborationStats.combine(parts) if parts[0] is not None else None
+
+@st.cache_resource(max_entries=VERSIONS_KEPT * (len(PLATFORM_FILES) + 1), show_spinner=False)
+def _collaboration_stats(platform, version, _snapshot):
+    graph = get_people_graph(_snapshot)
+    if graph is None:
+        return None
+    if platform is None:
+        return graph.subgraph()
+    return graph.subgraph(graph.platforms[graph.platform_codes] == platform)
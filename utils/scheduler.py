@@ -0,0 +1,256 @@
+import streamlit as st
+import os
+import json
+import time
+import random
+import tempfile
+import threading
+from contextlib import contextmanager
+
+from utils import api_utils
+from utils.data_loader import (PLATFORM_FILES, catalog_fingerprint, catalog_snapshot, data_version,
+                               publish_data_version, load_text_columns)
+from utils.bitmap_index import get_bitmap_index, selection_key
+from utils.geography import get_country_index
+from utils.snapshots import snapshot_all
+from utils.people_graph import get_people_graph, get_collaboration_stats
+from utils.text_analytics import get_term_index, word_cloud_image, rising_terms
+from utils.page_planner import get_column_store, page_aggregates, plan_page
+from utils.sketches import get_sketch_store, catalog_summary
+from utils.tmdb_enrichment import load_enrichment, enrichment_fingerprint, enrichment_version, publish_enrichment_version
+from utils.dashboard_spec import DASHBOARDS
+from utils.insights import INSIGHTS
+from utils.session_resources import get_session_resources
+
+try:
+    import fcntl
+except ImportError:  # Windows: single-flight only covers this process
+    fcntl = None
+
+TRENDING_INTERVAL_SECONDS = int(os.environ.get("DATAFLIX_TRENDING_INTERVAL", 15 * 60))
+CATALOG_POLL_SECONDS = int(os.environ.get("DATAFLIX_CATALOG_POLL_INTERVAL", 30))
+SESSION_REAP_SECONDS = int(os.environ.get("DATAFLIX_SESSION_REAP_INTERVAL", 60))
+# How long a refresh waits for another worker holding its lock before giving up until the next run
+LOCK_TIMEOUT_SECONDS = int(os.environ.get("DATAFLIX_LOCK_TIMEOUT", 30))
+JITTER_FRACTION = 0.1
+# Shared between the worker processes of one host
+SHARED_DIR = os.environ.get("DATAFLIX_SHARED_DIR", os.path.join(tempfile.gettempdir(), "dataflix"))
+
+
+def _jittered(interval):
+    return interval * (1 + random.uniform(-JITTER_FRACTION, JITTER_FRACTION))
+
+
+_local_flight = threading.Lock()
+
+
+@contextmanager
+def single_flight(name, timeout=None):
+    """
+    Exclusive lock shared by every worker process on the host. Followers wait
+    for the leader (at most `timeout` seconds, then TimeoutError) and should
+    re-check the shared result before doing the work.
+    """
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    with open(os.path.join(SHARED_DIR, f"{name}.lock"), "w") as lock_file:
+        if fcntl is None:
+            if not _local_flight.acquire(timeout=-1 if timeout is None else timeout):
+                raise TimeoutError(f"lock '{name}' still held after {timeout}s")
+            try:
+                yield
+            finally:
+                _local_flight.release()
+            return
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | (fcntl.LOCK_NB if deadline else 0))
+                break
+            except BlockingIOError:
+                if time.monotonic() >= deadline:
+                    raise TimeoutError(f"lock '{name}' still held after {timeout}s")
+                time.sleep(0.1)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _write_shared(name, payload):
+    """Writes a JSON payload to the shared directory with an atomic rename."""
+    os.makedirs(SHARED_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=SHARED_DIR, prefix=f".{name}-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, os.path.join(SHARED_DIR, f"{name}.json"))
+
+
+def _read_shared(name):
+    try:
+        with open(os.path.join(SHARED_DIR, f"{name}.json")) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _read_trending():
+    """The shared trending payload, or None if it is missing, partial or malformed."""
+    shared = _read_shared('trending')
+    if (not isinstance(shared, dict) or not isinstance(shared.get('fetched_at'), (int, float))
+            or not isinstance(shared.get('results'), list)):
+        return None
+    return shared
+
+
+class BackgroundScheduler:
+    """
+    Refreshes slow or external data on daemon threads, off the request path.
+
+    Each job runs on its own thread, so a slow TMDb call or a held lock only
+    delays that job. Readers always get the last published value. A refresh
+    builds its result completely before swapping it in with a single
+    reference assignment, so a rerun never waits for a refresh and never sees
+    a half-built version. Jobs make no Streamlit UI calls.
+    """
+
+    def __init__(self):
+        self._trending = None
+        self._warmed = (None, None)
+        self._stop = threading.Event()
+        self._catalog_lock = threading.Lock()
+        self._jobs = {
+            'trending': {'interval': TRENDING_INTERVAL_SECONDS, 'run': self.refresh_trending},
+            'catalog': {'interval': CATALOG_POLL_SECONDS, 'run': self.check_catalog},
+            'sessions': {'interval': SESSION_REAP_SECONDS, 'run': self.reap_sessions},
+        }
+        self._status = {name: {'runs': 0, 'last_run': None, 'last_success': None, 'last_error': None,
+                               'next_run': None, 'running': False} for name in self._jobs}
+        self._threads = {name: threading.Thread(target=self._run, args=(name,), name=f"dataflix-{name}", daemon=True)
+                         for name in self._jobs}
+
+    def start(self):
+        for thread in self._threads.values():
+            if not thread.is_alive():
+                thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+
+    def _run(self, name):
+        status = self._status[name]
+        status['next_run'] = time.time()
+        while not self._stop.is_set():
+            delay = status['next_run'] - time.time()
+            if delay > 0 and self._stop.wait(delay):
+                break
+            self._run_job(name)
+
+    def _run_job(self, name):
+        status = self._status[name]
+        status['running'] = True
+        status['last_run'] = time.time()
+        try:
+            self._jobs[name]['run']()
+            status['last_success'] = time.time()
+            status['last_error'] = None
+        except Exception as exc:  # keep serving the previous version
+            status['last_error'] = f"{type(exc).__name__}: {exc}"
+        finally:
+            status['runs'] += 1
+            status['running'] = False
+            status['next_run'] = time.time() + _jittered(self._jobs[name]['interval'])
+
+    # --- Trending movies ---
+
+    def refresh_trending(self):
+        """Fetches trending movies once per host and shares the result with the other workers."""
+        with single_flight('trending', timeout=LOCK_TIMEOUT_SECONDS):
+            # Another worker may have refreshed while we waited for the lock
+            shared = _read_trending()
+            if not shared or time.time() - shared['fetched_at'] >= TRENDING_INTERVAL_SECONDS * (1 - JITTER_FRACTION):
+                results = api_utils.get_trending_movies()
+                if results is None:
+                    raise RuntimeError("TMDb trending request failed")
+                shared = {'fetched_at': time.time(), 'results': results}
+                _write_shared('trending', shared)
+        if self._trending is None or shared['fetched_at'] > self._trending['fetched_at']:
+            self._trending = shared
+
+    def get_trending(self):
+        """Returns the last fetched trending movies, or None before the first refresh."""
+        snapshot = self._trending
+        return snapshot['results'] if snapshot else None
+
+    # --- Catalog files ---
+
+    def check_catalog(self):
+        """
+        Warms every version-keyed cache for the files currently in `data/` and
+        the current TMDb enrichment table, then publishes both versions, and
+        records a churn snapshot of every changed catalog. Users keep getting
+        the previously published versions until the warm is done. The first
+        run warms the version being served. A failed snapshot is reported
+        but doesn't undo the publish, so the next poll won't warm again.
+        """
+        snapshot = catalog_snapshot(catalog_fingerprint())
+        enrichment = enrichment_fingerprint()
+        if (snapshot.version, enrichment) == self._warmed:
+            return
+        with self._catalog_lock:
+            self.warm_catalog(snapshot, enrichment)
+            publish_data_version(snapshot.version)
+            publish_enrichment_version(enrichment)
+            catalog_changed = snapshot.version != self._warmed[0]
+            self._warmed = (snapshot.version, enrichment)
+            if catalog_changed:
+                self.record_snapshots(snapshot.version)
+
+    def warm_catalog(self, snapshot, enrichment=None):
+        """Builds the caches behind each page's default (unfiltered) view for a catalog snapshot."""
+        enrichment = enrichment if enrichment is not None else enrichment_version()
+        for platform in PLATFORM_FILES:
+            load_text_columns(platform, snapshot)
+            get_bitmap_index(platform, snapshot)
+            get_country_index(platform, snapshot)
+            get_collaboration_stats((platform,), snapshot)
+            get_term_index(platform, snapshot)
+            load_enrichment(platform, snapshot, enrichment)
+            get_column_store(platform, snapshot, enrichment)
+            spec = DASHBOARDS.get(platform)
+            if spec:
+                _, insight_measures = INSIGHTS.get(spec.get('insights'), (None, ()))
+                page_aggregates(platform, (), plan_page(spec, insight_measures), snapshot, enrichment)
+                word_cloud_image(platform, (), spec['theme']['colormap'], snapshot)
+                rising_terms(platform, (), version=snapshot)
+            catalog_summary(selection_key({'platform': (platform,)}), version=snapshot)
+        load_text_columns(None, snapshot)
+        get_bitmap_index(None, snapshot)
+        get_country_index(None, snapshot)
+        get_people_graph(snapshot)
+        get_collaboration_stats((), snapshot)
+        get_sketch_store(snapshot)
+        catalog_summary((), version=snapshot)
+
+    def record_snapshots(self, version):
+        """Snapshots the catalogs once per host; unchanged catalogs are skipped."""
+        with single_flight('snapshots', timeout=LOCK_TIMEOUT_SECONDS):
+            snapshot_all(source=version)
+
+    # --- Session resources ---
+
+    def reap_sessions(self):
+        """Frees the artefacts of sessions that disconnected or went idle."""
+        get_session_resources().reap()
+
+    def status(self):
+        """Job status and the served catalog version, for the instrumentation panel."""
+        jobs = {name: dict(status) for name, status in self._status.items()}
+        return {'catalog_version': data_version(), 'enrichment_version': enrichment_version(),
+                'trending_loaded': self._trending is not None, 'jobs': jobs}
+
+
+@st.cache_resource
+def get_scheduler():
+    """Starts the process-wide background scheduler on first use."""
+    return BackgroundScheduler().start()
@@ -0,0 +1,213 @@
+import streamlit as st
+import os
+import sys
+import time
+import threading
+from collections import OrderedDict
+import numpy as np
+import pandas as pd
+from streamlit.runtime import Runtime
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from streamlit.runtime.stats import CacheStat, CACHE_MEMORY_FAMILY
+
+SESSION_BUDGET_BYTES = int(float(os.environ.get("DATAFLIX_SESSION_BUDGET_MB", 32)) * 2**20)
+PROCESS_BUDGET_BYTES = int(float(os.environ.get("DATAFLIX_PROCESS_BUDGET_MB", 256)) * 2**20)
+SESSION_IDLE_SECONDS = int(os.environ.get("DATAFLIX_SESSION_IDLE_SECONDS", 30 * 60))
+
+
+def estimate_bytes(value, _seen=None):
+    """Approximate memory footprint of a frame, array, figure or nested JSON-like payload."""
+    if isinstance(value, (pd.DataFrame, pd.Series, pd.Index)):
+        usage = value.memory_usage(deep=True)
+        return int(usage.sum() if hasattr(usage, 'sum') else usage)
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if hasattr(value, 'to_plotly_json'):
+        value = value.to_plotly_json()
+    if isinstance(value, (dict, list, tuple, set)):
+        _seen = _seen if _seen is not None else set()
+        if id(value) in _seen:
+            return 0
+        _seen.add(id(value))
+        items = value.items() if isinstance(value, dict) else ((None, item) for item in value)
+        return sys.getsizeof(value) + sum(estimate_bytes(k, _seen) + estimate_bytes(v, _seen) for k, v in items)
+    return sys.getsizeof(value)
+
+
+class SessionResourceManager:
+    """
+    Process-wide ledger of the artefacts each browser session keeps between
+    reruns (filtered frames, figures, API payloads), with their approximate
+    sizes.
+
+    A session's artefacts are kept in least-recently-used order. Storing one
+    first evicts that session's oldest artefacts past the per-session budget,
+    then the oldest artefacts of any session past the per-process budget.
+    Sessions that disconnect or sit idle are reaped by `reap`. The ledger is
+    registered with Streamlit's stats manager, so the numbers also appear on
+    its `/_stcore/metrics` endpoint. Values a page puts in `st.session_state`
+    directly are not in the ledger, so they are neither counted nor bounded.
+    """
+
+    def __init__(self, session_budget=SESSION_BUDGET_BYTES, process_budget=PROCESS_BUDGET_BYTES,
+                 idle_seconds=SESSION_IDLE_SECONDS):
+        self.session_budget = session_budget
+        self.process_budget = process_budget
+        self.idle_seconds = idle_seconds
+        self._lock = threading.Lock()
+        self._sessions = {}
+        self._bytes = 0
+        self._counters = {'evictions': 0, 'evicted_bytes': 0, 'rejected': 0, 'reaped_sessions': 0, 'reaped_bytes': 0}
+        # Sized on each reap: walking every cache entry is too slow for a rerun
+        self._shared_cache_bytes = None
+
+    # --- Stats provider protocol ---
+
+    @property
+    def stats_families(self):
+        return (CACHE_MEMORY_FAMILY,)
+
+    def get_stats(self, family_names=None):
+        with self._lock:
+            stats = [CacheStat('dataflix_session', session_id, session['bytes'])
+                     for session_id, session in self._sessions.items()]
+        return {CACHE_MEMORY_FAMILY: stats}
+
+    # --- Ledger ---
+
+    def _session(self, session_id):
+        session = self._sessions.get(session_id)
+        if session is None:
+            session = self._sessions[session_id] = {'artefacts': OrderedDict(), 'bytes': 0, 'last_seen': time.time()}
+        return session
+
+    def touch(self, session_id):
+        """Marks a session as active (call once per rerun)."""
+        with self._lock:
+            self._session(session_id)['last_seen'] = time.time()
+
+    def get(self, session_id, name, key=None):
+        """A session's artefact if it was stored under the same key, else None."""
+        with self._lock:
+            session = self._sessions.get(session_id)
+            entry = session['artefacts'].get(name) if session else None
+            if entry is None or entry['key'] != key:
+                return None
+            entry['last_used'] = time.time()
+            session['artefacts'].move_to_end(name)
+            return entry['value']
+
+    def put(self, session_id, name, value, key=None):
+        """Stores an artefact for a session, evicting older ones to stay within budget."""
+        nbytes = estimate_bytes(value)
+        with self._lock:
+            session = self._session(session_id)
+            self._discard(session, name)
+            if nbytes > self.session_budget:
+                self._counters['rejected'] += 1
+                return value
+            session['artefacts'][name] = {'value': value, 'key': key, 'bytes': nbytes, 'last_used': time.time()}
+            session['bytes'] += nbytes
+            self._bytes += nbytes
+
+            while session['bytes'] > self.session_budget:
+                self._evict(session, next(iter(session['artefacts'])))
+            while self._bytes > self.process_budget:
+                oldest = min(((s, n, e['last_used']) for s in self._sessions.values()
+                              for n, e in s['artefacts'].items()), key=lambda item: item[2])
+                self._evict(oldest[0], oldest[1])
+        return value
+
+    def _discard(self, session, name):
+        entry = session['artefacts'].pop(name, None)
+        if entry is not None:
+            session['bytes'] -= entry['bytes']
+            self._bytes -= entry['bytes']
+        return entry
+
+    def _evict(self, session, name):
+        entry = self._discard(session, name)
+        self._counters['evictions'] += 1
+        self._counters['evicted_bytes'] += entry['bytes']
+
+    def reap(self, now=None):
+        """Drops the artefacts of sessions that disconnected or were idle too long, and re-sizes the shared caches."""
+        now = now or time.time()
+        runtime = Runtime.instance() if Runtime.exists() else None
+        shared = shared_cache_bytes()
+        with self._lock:
+            self._shared_cache_bytes = shared
+            for session_id, session in list(self._sessions.items()):
+                gone = runtime is not None and not runtime.is_active_session(session_id)
+                if gone or now - session['last_seen'] > self.idle_seconds:
+                    del self._sessions[session_id]
+                    self._bytes -= session['bytes']
+                    self._counters['reaped_sessions'] += 1
+                    self._counters['reaped_bytes'] += session['bytes']
+
+    def metrics(self):
+        """Session counts, bytes held against the budgets, eviction counters and process memory."""
+        with self._lock:
+            metrics = {
+                'sessions': len(self._sessions),
+                'artefacts': sum(len(s['artefacts']) for s in self._sessions.values()),
+                'bytes': self._bytes,
+                'largest_session_bytes': max((s['bytes'] for s in self._sessions.values()), default=0),
+                'session_budget': self.session_budget,
+                'process_budget': self.process_budget,
+                'shared_cache_bytes': self._shared_cache_bytes,
+                **self._counters,
+            }
+        metrics['rss_bytes'] = process_rss_bytes()
+        return metrics
+
+
+def shared_cache_bytes():
+    """Bytes held by the process-wide `st.cache_data` entries (None outside a Streamlit server). Slow: sizes every entry."""
+    if not Runtime.exists():
+        return None
+    stats = Runtime.instance().stats_mgr.get_stats([CACHE_MEMORY_FAMILY]).get(CACHE_MEMORY_FAMILY, [])
+    return sum(stat.byte_length for stat in stats if stat.category_name == 'st_cache_data')
+
+
+def process_rss_bytes():
+    """Resident set size of this worker process, or None where /proc is unavailable."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+@st.cache_resource(show_spinner=False)
+def get_session_resources():
+    """Returns the process-wide session resource manager, registered with Streamlit's stats."""
+    manager = SessionResourceManager()
+    if Runtime.exists():
+        Runtime.instance().stats_mgr.register_provider(manager)
+    return manager
+
+
+def _session_id():
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+def touch_session():
+    """Records activity for the current session."""
+    session_id = _session_id()
+    if session_id:
+        get_session_resources().touch(session_id)
+
+
+def session_artefact(name, key=None):
+    """The current session's artefact `name` if stored under `key`, else None."""
+    session_id = _session_id()
+    return get_session_resources().get(session_id, name, key) if session_id else None
+
+
+def keep_session_artefact(name, value, key=None):
+    """Keeps `value` for the current session within its budget and returns it."""
+    session_id = _session_id()
+    return get_session_resources().put(session_id, name, value, key) if session_id else value
+
@@ -0,0 +1,396 @@
+"""Mergeable per-partition sketches (HyperLogLog, Space-Saving, t-digest) for approximate catalog aggregates."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+from utils.data_loader import catalog_snapshot, VERSIONS_KEPT
+from utils.bitmap_index import category_codes, get_bitmap_index
+
+HLL_PRECISION = 12
+TOP_K_CAPACITY = 32
+TDIGEST_COMPRESSION = 200
+PARTITION_COLUMNS = ['platform', 'type', 'release_year']
+# Filter dimensions (see bitmap_index.FILTER_DIMENSIONS) that select whole partitions
+PARTITION_DIMENSIONS = {'platform': 'platform', 'type': 'type', 'release_year': 'release_year'}
+
+# metric -> (source column, multi-valued)
+DISTINCT_METRICS = {'titles': ('title', False), 'directors': ('director', True)}
+TOP_K_METRICS = {'genre': ('listed_in', True), 'country': ('country', True), 'director': ('director', True),
+                 'rating': ('rating', False)}
+QUANTILE_METRICS = ['movie_minutes', 'tv_seasons', 'lag_years']
+
+
+def _bit_length(values):
+    """Bit length of each uint64, exact (float64 only ever sees 32-bit halves)."""
+    high = (values >> np.uint64(32)).astype(np.float64)
+    low = (values & np.uint64(0xFFFFFFFF)).astype(np.float64)
+    return np.where(high > 0, 32 + np.frexp(high)[1], np.frexp(low)[1])
+
+
+def _hash_strings(values):
+    return pd.util.hash_pandas_object(pd.Series(values, dtype=object).str.lower(), index=False).to_numpy()
+
+
+class HyperLogLog:
+    """Distinct-count sketch; two sketches merge by taking the register-wise maximum."""
+
+    def __init__(self, registers=None, precision=HLL_PRECISION):
+        self.precision = precision
+        self.registers = np.zeros(1 << precision, np.uint8) if registers is None else registers
+
+    @staticmethod
+    def register_updates(hashes, precision=HLL_PRECISION):
+        """Returns the (register index, rank) pair each 64-bit hash contributes."""
+        index = (hashes >> np.uint64(64 - precision)).astype(np.int64)
+        remainder = hashes & np.uint64((1 << (64 - precision)) - 1)
+        rank = (64 - precision) - _bit_length(remainder) + 1
+        return index, rank.astype(np.uint8)
+
+    def merge(self, other):
+        return HyperLogLog(np.maximum(self.registers, other.registers), self.precision)
+
+    @property
+    def relative_error(self):
+        """Standard error of the estimate relative to the true count."""
+        return 1.04 / np.sqrt(len(self.registers))
+
+    def estimate(self):
+        m = len(self.registers)
+        raw = 0.7213 / (1 + 1.079 / m) * m * m / np.sum(np.ldexp(1.0, -self.registers.astype(np.int64)))
+        zeros = int((self.registers == 0).sum())
+        if raw <= 2.5 * m and zeros:
+            return m * np.log(m / zeros)  # linear counting for small cardinalities
+        return raw
+
+
+class SpaceSaving:
+    """Top-k summary: a listed key's true count lies in [count - error, count]; unlisted keys occur <= `bound` times."""
+
+    def __init__(self, counters, bound=0, capacity=TOP_K_CAPACITY):
+        self.counters = counters  # DataFrame indexed by key: count, error
+        self.bound = bound
+        self.capacity = capacity
+
+    @classmethod
+    def from_counts(cls, counts, capacity=TOP_K_CAPACITY):
+        """Builds an exact summary from a Series of counts per key."""
+        counts = counts.sort_values(ascending=False, kind='stable')
+        counters = pd.DataFrame({'count': counts.iloc[:capacity], 'error': 0})
+        return cls(counters, int(counts.iloc[capacity]) if len(counts) > capacity else 0, capacity)
+
+    def merge(self, other):
+        return SpaceSaving.merge_all([self.counters, other.counters], [self.bound, other.bound], self.capacity)
+
+    @staticmethod
+    def merge_all(counter_frames, bounds, capacity=TOP_K_CAPACITY):
+        """Merges many summaries at once: one concat and one groupby."""
+        bounds = np.asarray(bounds, dtype=np.int64)
+        stacked = pd.concat([frame.assign(covered=bound) for frame, bound in zip(counter_frames, bounds)])
+        return SpaceSaving._from_stacked(stacked, int(bounds.sum()), capacity)
+
+    @staticmethod
+    def _from_stacked(stacked, total_bound, capacity):
+        merged = stacked.groupby(level=0, sort=False)[['count', 'error', 'covered']].sum()
+        # A key absent from a summary may still have occurred up to that summary's bound
+        uncovered = total_bound - merged.pop('covered')
+        merged['count'] += uncovered
+        merged['error'] += uncovered
+        merged = merged.sort_values('count', ascending=False, kind='stable')
+        dropped = int(merged['count'].iloc[capacity]) if len(merged) > capacity else 0
+        return SpaceSaving(merged.iloc[:capacity], max(total_bound, dropped), capacity)
+
+    def top(self, n=10):
+        """
+        The `n` heaviest keys. `estimate` is the guaranteed count (`lower`);
+        `upper` adds every occurrence the summaries may have dropped.
+        """
+        lower = (self.counters['count'] - self.counters['error']).clip(lower=0)
+        top = lower.sort_values(ascending=False, kind='stable').iloc[:n]
+        return pd.DataFrame({'key': top.index, 'estimate': top.to_numpy(dtype=float), 'lower': top.to_numpy(),
+                             'upper': self.counters['count'].loc[top.index].to_numpy()})
+
+
+class TDigest:
+    """
+    Quantile sketch: weighted centroids that are small near the tails and large
+    in the middle. Merging concatenates centroids and compresses them again.
+    """
+
+    def __init__(self, means, weights, minimum, maximum, compression=TDIGEST_COMPRESSION):
+        self.means, self.weights = means, weights
+        self.minimum, self.maximum = minimum, maximum
+        self.compression = compression
+
+    @staticmethod
+    def scale(q, compression=TDIGEST_COMPRESSION):
+        """The k1 scale function: equal steps in k are narrow in q near 0 and 1."""
+        return compression / (2 * np.pi) * np.arcsin(2 * np.clip(q, 0, 1) - 1)
+
+    @classmethod
+    def compress(cls, means, weights, group=None, compression=TDIGEST_COMPRESSION):
+        """Merges neighbouring centroids within one scale-function step, per `group`. Returns (group, means, weights)."""
+        group = np.zeros(len(means), np.int64) if group is None else group
+        if not len(means):
+            return group, means, weights
+        order = np.lexsort((means, group))
+        group, means, weights = group[order], means[order], weights[order]
+        starts = np.flatnonzero(np.r_[True, group[1:] != group[:-1]])
+        totals = np.add.reduceat(weights, starts)
+        group_start = np.repeat(starts, np.diff(np.r_[starts, len(group)]))
+        cumulative = np.cumsum(weights)
+        midpoint = cumulative - weights / 2 - np.r_[0, cumulative][group_start]
+        q = midpoint / np.repeat(totals, np.diff(np.r_[starts, len(group)]))
+        bucket = np.floor(cls.scale(q, compression)).astype(np.int64)
+        boundaries = np.flatnonzero(np.r_[True, (bucket[1:] != bucket[:-1]) | (group[1:] != group[:-1])])
+        merged_weights = np.add.reduceat(weights, boundaries)
+        merged_means = np.add.reduceat(means * weights, boundaries) / merged_weights
+        return group[boundaries], merged_means, merged_weights
+
+    @classmethod
+    def from_values(cls, values, compression=TDIGEST_COMPRESSION):
+        values = np.asarray(values, dtype=np.float64)
+        if not len(values):
+            return cls(np.zeros(0), np.zeros(0), np.nan, np.nan, compression)
+        _, means, weights = cls.compress(values, np.ones(len(values)), compression=compression)
+        return cls(means, weights, values.min(), values.max(), compression)
+
+    def merge(self, other):
+        return TDigest.merge_all([self, other], self.compression)
+
+    @staticmethod
+    def merge_all(digests, compression=TDIGEST_COMPRESSION):
+        digests = [digest for digest in digests if len(digest.weights)]
+        if not digests:
+            return TDigest(np.zeros(0), np.zeros(0), np.nan, np.nan, compression)
+        _, means, weights = TDigest.compress(np.concatenate([d.means for d in digests]),
+                                             np.concatenate([d.weights for d in digests]), compression=compression)
+        return TDigest(means, weights, min(d.minimum for d in digests), max(d.maximum for d in digests), compression)
+
+    @property
+    def count(self):
+        return float(self.weights.sum())
+
+    def quantile(self, q):
+        """Interpolated value at quantile `q`, or NaN for an empty digest."""
+        if not len(self.weights):
+            return np.nan
+        midpoints = np.cumsum(self.weights) - self.weights / 2
+        positions = np.r_[0, midpoints, self.count]
+        values = np.r_[self.minimum, self.means, self.maximum]
+        return float(np.interp(q * self.count, positions, values))
+
+    def rank_error(self, q):
+        """
+        Rank error bound at `q`: `quantile` interpolates between the midpoints of
+        two neighbouring centroids, so the true rank can be off by half of each.
+        """
+        if not len(self.weights):
+            return np.nan
+        midpoints = np.cumsum(self.weights) - self.weights / 2
+        right = np.searchsorted(midpoints, q * self.count)
+        left_weight = self.weights[right - 1] if right > 0 else 0.0
+        right_weight = self.weights[right] if right < len(self.weights) else 0.0
+        return float((left_weight + right_weight) / 2 / self.count)
+
+
+def _exploded(series, multi):
+    """(row position, value) pairs for a column; multi-valued columns are split on their labels only."""
+    codes, labels = category_codes(series)
+    tokens = pd.Series(labels, dtype=object)
+    if multi:
+        tokens = tokens.str.split(',').explode().str.strip()
+    tokens = tokens[tokens.notna() & (tokens != '')]
+    pairs = pd.DataFrame({'row': np.arange(len(codes)), 'code': codes}).merge(
+        pd.DataFrame({'code': tokens.index.to_numpy(), 'value': tokens.to_numpy()}), on='code')
+    return pairs['row'].to_numpy(), pairs['value'].to_numpy()
+
+
+def _quantile_values(df):
+    """Per-row numeric values of the distribution metrics (NaN where not applicable)."""
+    codes, labels = category_codes(df['duration'])
+    label_numbers = pd.Series(labels).str.extract(r'(\d+)')[0].astype(float).to_numpy()
+    number = np.where(codes >= 0, label_numbers[codes], np.nan) if len(labels) else np.full(len(df), np.nan)
+    is_movie = (df['type'] == 'Movie').to_numpy()
+    lag = (pd.DatetimeIndex(df['date_added']).year - df['release_year']).to_numpy(dtype=np.float64)
+    return {'movie_minutes': np.where(is_movie, number, np.nan),
+            'tv_seasons': np.where(~is_movie, number, np.nan),
+            'lag_years': np.where(lag >= 0, lag, np.nan)}
+
+
+class SketchStore:
+    """Per-partition sketches of a catalog frame, merged on demand for a set of partitions."""
+
+    def __init__(self, df):
+        keys = df[PARTITION_COLUMNS].astype({'platform': str, 'type': str})
+        partition = keys.groupby(PARTITION_COLUMNS, dropna=False, sort=True).ngroup().to_numpy()
+        self.partitions = (keys.assign(rows=1).groupby(PARTITION_COLUMNS, dropna=False, sort=True)['rows']
+                           .sum().reset_index())
+
+        self.registers = {}
+        for metric, (column, multi) in DISTINCT_METRICS.items():
+            rows, values = _exploded(df[column], multi)
+            index, rank = HyperLogLog.register_updates(_hash_strings(values))
+            registers = np.zeros((len(self.partitions), 1 << HLL_PRECISION), np.uint8)
+            np.maximum.at(registers, (partition[rows], index), rank)
+            self.registers[metric] = registers
+
+        self.counters, self.bounds = {}, {}
+        for metric, (column, multi) in TOP_K_METRICS.items():
+            rows, values = _exploded(df[column], multi)
+            counts = (pd.DataFrame({'partition': partition[rows], 'key': values})
+                      .value_counts().rename('count').reset_index()
+                      .sort_values(['partition', 'count'], ascending=[True, False], kind='stable'))
+            rank = counts.groupby('partition').cumcount().to_numpy()
+            bounds = np.zeros(len(self.partitions), np.int64)
+            overflow = counts[rank == TOP_K_CAPACITY]
+            bounds[overflow['partition'].to_numpy()] = overflow['count'].to_numpy()
+            kept = counts[rank < TOP_K_CAPACITY]
+            self.counters[metric] = kept.assign(error=0, covered=bounds[kept['partition'].to_numpy()]).set_index('key')
+            self.bounds[metric] = bounds
+
+        self.centroids, self.extremes = {}, {}
+        for metric, values in _quantile_values(df).items():
+            present = ~np.isnan(values)
+            groups, means, weights = TDigest.compress(values[present], np.ones(present.sum()), partition[present])
+            self.centroids[metric] = pd.DataFrame({'partition': groups, 'mean': means, 'weight': weights})
+            self.extremes[metric] = (pd.DataFrame({'partition': partition[present], 'value': values[present]})
+                                     .groupby('partition')['value'].agg(['min', 'max']))
+
+    def select(self, selection):
+        """
+        Partition ids matching a filter selection, or None if it filters on a
+        dimension that doesn't align with partitions (genre, country, ...).
+        """
+        if not sketchable(selection):
+            return None
+        keep = np.ones(len(self.partitions), dtype=bool)
+        for dim, selected in selection.items():
+            column = self.partitions[PARTITION_DIMENSIONS[dim]]
+            if dim == 'release_year':
+                keep &= column.between(*selected).to_numpy()
+            else:
+                keep &= column.isin(selected).to_numpy()
+        return np.flatnonzero(keep)
+
+    def rows(self, partitions):
+        return int(self.partitions['rows'].to_numpy()[partitions].sum())
+
+    def distinct(self, metric, partitions):
+        return HyperLogLog(self.registers[metric][partitions].max(axis=0, initial=0))
+
+    def top_k(self, metric, partitions):
+        counters = self.counters[metric]
+        stacked = counters[np.isin(counters['partition'].to_numpy(), partitions)]
+        total_bound = int(self.bounds[metric][partitions].sum())
+        return SpaceSaving._from_stacked(stacked[['count', 'error', 'covered']], total_bound, TOP_K_CAPACITY)
+
+    def digest(self, metric, partitions):
+        centroids = self.centroids[metric]
+        chosen = centroids[np.isin(centroids['partition'].to_numpy(), partitions)]
+        extremes = self.extremes[metric].reindex(partitions).dropna()
+        if chosen.empty:
+            return TDigest.from_values([])
+        _, means, weights = TDigest.compress(chosen['mean'].to_numpy(), chosen['weight'].to_numpy())
+        return TDigest(means, weights, extremes['min'].min(), extremes['max'].max())
+
+
+def sketchable(selection):
+    """
+    Whether the sketches can answer a filter selection: only when every
+    dimension selects whole partitions. Genre, country, rating and date added
+    cut across partitions, so those selections are answered exactly.
+    """
+    return all(dim in PARTITION_DIMENSIONS for dim in dict(selection))
+
+
+def get_sketch_store(version=None):
+    """Returns the partitioned sketches of the combined catalog."""
+    snapshot = catalog_snapshot(version)
+    return _build_sketch_store(snapshot.version, snapshot)
+
+@st.cache_resource(max_entries=VERSIONS_KEPT, show_spinner=False)
+def _build_sketch_store(version, _snapshot):
+    df = _snapshot.frame()
+    if df.empty:
+        return None
+    return SketchStore(df)
+
+
+QUANTILES = {'p50': 0.5, 'p90': 0.9}
+
+
+def approximate_summary(selection=(), n=10, version=None):
+    """
+    Catalog KPIs for a filter selection key (see `bitmap_index.selection_key`)
+    from merged sketches, with error bounds; None if the selection filters on
+    a dimension the sketches aren't partitioned by.
+    """
+    snapshot = catalog_snapshot(version)
+    return _approximate_summary(selection, n, snapshot.version, snapshot)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _approximate_summary(selection, n, version, _snapshot):
+    store = get_sketch_store(_snapshot)
+    partitions = store.select(dict(selection)) if store is not None else None
+    if partitions is None:
+        return None
+    summary = {'approximate': True, 'titles': store.rows(partitions), 'distinct': {}, 'top': {}, 'quantiles': {}}
+    platforms = store.partitions.iloc[partitions]
+    by_platform = platforms.groupby('platform')['rows'].sum()
+    summary['by_platform'] = by_platform[by_platform > 0].to_dict()
+    summary['platforms'] = len(summary['by_platform'])
+    summary['by_type'] = platforms.groupby('type')['rows'].sum().to_dict()
+    for metric in DISTINCT_METRICS:
+        sketch = store.distinct(metric, partitions)
+        estimate = sketch.estimate()
+        summary['distinct'][metric] = (estimate, 2 * sketch.relative_error * estimate)
+    for metric in TOP_K_METRICS:
+        summary['top'][metric] = store.top_k(metric, partitions).top(n)
+    for metric in QUANTILE_METRICS:
+        digest = store.digest(metric, partitions)
+        summary['quantiles'][metric] = {name: (digest.quantile(q), digest.rank_error(q)) for name, q in QUANTILES.items()}
+    return summary
+
+
+def exact_summary(df, n=10):
+    """The same KPIs as `approximate_summary`, computed exactly from a (filtered) catalog frame."""
+    summary = {'approximate': False, 'titles': len(df), 'distinct': {}, 'top': {}, 'quantiles': {}}
+    by_platform = df['platform'].value_counts()
+    summary['by_platform'] = by_platform[by_platform > 0].to_dict()
+    summary['platforms'] = len(summary['by_platform'])
+    summary['by_type'] = df['type'].value_counts().to_dict()
+    for metric, (column, multi) in DISTINCT_METRICS.items():
+        _, values = _exploded(df[column], multi)
+        summary['distinct'][metric] = (float(pd.Series(values, dtype=object).str.lower().nunique()), 0.0)
+    for metric, (column, multi) in TOP_K_METRICS.items():
+        _, values = _exploded(df[column], multi)
+        counts = pd.Series(values, dtype=object).value_counts().iloc[:n]
+        summary['top'][metric] = pd.DataFrame({'key': counts.index, 'estimate': counts.to_numpy(dtype=float),
+                                               'lower': counts.to_numpy(), 'upper': counts.to_numpy()})
+    for metric, values in _quantile_values(df).items():
+        values = values[~np.isnan(values)]
+        summary['quantiles'][metric] = {name: (float(np.quantile(values, q)) if len(values) else np.nan, 0.0)
+                                        for name, q in QUANTILES.items()}
+    return summary
+
+
+def catalog_summary(selection=(), approximate=False, n=10, version=None):
+    """
+    Catalog KPIs for a filter selection key, from sketches when `approximate`
+    is set and they can answer it, otherwise exactly. Both are cached per
+    selection and data version.
+    """
+    # Check the selection first so a genre/country filter never pays for a store build it can't use
+    if approximate and sketchable(selection):
+        summary = approximate_summary(selection, n, version)
+        if summary is not None:
+            return summary
+    snapshot = catalog_snapshot(version)
+    return _exact_summary(selection, n, snapshot.version, snapshot)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _exact_summary(selection, n, version, _snapshot):
+    df = _snapshot.frame()
+    if selection:
+        index = get_bitmap_index(None, _snapshot)
+        df = df[index.to_mask(index.evaluate(dict(selection)))]
+    return exact_summary(df, n)
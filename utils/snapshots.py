@@ -0,0 +1,217 @@
+"""Incremental catalog snapshots (keyframes plus deltas) and the diff engine behind the Catalog Churn tab."""
+import streamlit as st
+import pandas as pd
+import numpy as np
+import argparse
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+
+from utils.data_loader import PLATFORM_FILES, data_path
+
+SNAPSHOT_DIR = os.environ.get("DATAFLIX_SNAPSHOT_DIR", data_path("snapshots"))
+KEYFRAME_CHURN = 0.5
+MAX_DELTAS = 20  # keyframe after this many deltas, so rebuilding a snapshot reads a bounded chain
+KEY_COLUMN = 'show_id'
+OPS = ['added', 'changed', 'removed']
+
+
+def _catalog_dir(platform):
+    return os.path.join(SNAPSHOT_DIR, os.path.splitext(PLATFORM_FILES[platform])[0])
+
+
+def _manifest_path(platform):
+    return os.path.join(_catalog_dir(platform), "manifest.json")
+
+
+def list_snapshots(platform):
+    """Returns the manifest entries of a platform's snapshots, oldest first."""
+    try:
+        with open(_manifest_path(platform)) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return []
+
+
+def _write_manifest(platform, manifest):
+    path = _manifest_path(platform)
+    with open(path + ".tmp", "w") as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(path + ".tmp", path)
+
+
+def fingerprint_rows(df):
+    """Returns a frame of `_key` (hashed show_id) and `_fp` (hash of every other column) per row."""
+    keys = pd.util.hash_pandas_object(df[KEY_COLUMN].astype(str), index=False)
+    content = df.drop(columns=[KEY_COLUMN]).astype('string').fillna('')
+    fingerprints = pd.util.hash_pandas_object(content, index=False)
+    return pd.DataFrame({'_key': keys.to_numpy(), '_fp': fingerprints.to_numpy()})
+
+
+def diff_indexes(old_index, new_index):
+    """
+    Compares two (key, fingerprint) indexes with one hash join.
+    Returns the (added, changed, removed) key arrays.
+    """
+    joined = new_index.merge(old_index, on='_key', how='outer', suffixes=('', '_old'), indicator=True)
+    added = joined.loc[joined['_merge'] == 'left_only', '_key'].to_numpy()
+    changed = joined.loc[(joined['_merge'] == 'both') & (joined['_fp'] != joined['_fp_old']), '_key'].to_numpy()
+    removed = joined.loc[joined['_merge'] == 'right_only', '_key'].to_numpy()
+    return added, changed, removed
+
+
+def _tag_rows(df, added, changed):
+    rows = df[df['_key'].isin(added) | df['_key'].isin(changed)].copy()
+    rows['_op'] = np.where(rows['_key'].isin(added), 'added', 'changed')
+    return rows
+
+
+def _read_state(platform, entry):
+    return pd.read_parquet(os.path.join(_catalog_dir(platform), entry['file']))
+
+
+def take_snapshot(platform, df=None, taken_at=None, source=None):
+    """
+    Records the platform's current catalog as a new snapshot. Returns the new
+    manifest entry, or None if the catalog is unchanged since the last one.
+    """
+    if df is None:
+        df = pd.read_csv(data_path(PLATFORM_FILES[platform]))
+    df = df.drop_duplicates(KEY_COLUMN, keep='last').reset_index(drop=True)
+    df = pd.concat([df, fingerprint_rows(df)], axis=1)
+    taken_at = taken_at or datetime.now(timezone.utc).isoformat(timespec='seconds')
+    catalog_dir = _catalog_dir(platform)
+    os.makedirs(catalog_dir, exist_ok=True)
+    head_path = os.path.join(catalog_dir, "head_index.parquet")
+    manifest = list_snapshots(platform)
+    snapshot_id = len(manifest) + 1
+
+    if manifest:
+        added, changed, removed = diff_indexes(pd.read_parquet(head_path), df[['_key', '_fp']])
+        if not (len(added) or len(changed) or len(removed)):
+            return None
+    else:
+        added, changed, removed = df['_key'].to_numpy(), [], []
+
+    churn = len(added) + len(changed) + len(removed)
+    churn_since, deltas_since = _since_keyframe(manifest)
+    keyframe = not manifest or deltas_since >= MAX_DELTAS or churn_since + churn > KEYFRAME_CHURN * len(df)
+    if keyframe:
+        stored = df.assign(_op='added')
+        filename = f"{snapshot_id:04d}-full.parquet"
+    else:
+        # Removed rows are kept whole so the churn view can still list their titles
+        previous = _materialize(platform, manifest, len(manifest))
+        stored = pd.concat([_tag_rows(df, added, changed),
+                            previous[previous['_key'].isin(removed)].assign(_op='removed')], ignore_index=True)
+        filename = f"{snapshot_id:04d}-delta.parquet"
+    _to_storage(stored).to_parquet(os.path.join(catalog_dir, filename), index=False)
+    df[['_key', '_fp']].to_parquet(head_path, index=False)
+
+    entry = {'id': snapshot_id, 'taken_at': taken_at, 'file': filename, 'keyframe': keyframe, 'rows': len(df),
+             'added': len(added), 'changed': len(changed), 'removed': len(removed), 'source': source}
+    _write_manifest(platform, manifest + [entry])
+    return entry
+
+
+def _since_keyframe(manifest):
+    """Returns the (churn, delta count) recorded since the last keyframe."""
+    churn = deltas = 0
+    for entry in reversed(manifest):
+        if entry['keyframe']:
+            break
+        churn += entry['added'] + entry['changed'] + entry['removed']
+        deltas += 1
+    return churn, deltas
+
+
+def _to_storage(df):
+    """Stores every catalog column as a nullable string so keyframes and deltas share one schema."""
+    return df.astype({col: 'string' for col in df.columns if col not in ('_key', '_fp')})
+
+
+def _materialize(platform, manifest, snapshot_id):
+    """Rebuilds the full catalog of a snapshot from its keyframe and the deltas after it."""
+    entries = manifest[:snapshot_id]
+    start = max(i for i, entry in enumerate(entries) if entry['keyframe'])
+    state = _read_state(platform, entries[start]).drop(columns=['_op'])
+    for entry in entries[start + 1:]:
+        delta = _read_state(platform, entry)
+        touched = delta['_key'].to_numpy()
+        state = state[~state['_key'].isin(touched)]
+        upserts = delta[delta['_op'] != 'removed'].drop(columns=['_op'])
+        state = pd.concat([state, upserts], ignore_index=True)
+    return state.reset_index(drop=True)
+
+
+def diff_snapshots(platform, from_id, to_id):
+    """
+    Returns the titles added, changed and removed between two snapshots as one
+    frame with an `_op` column. Consecutive snapshots read the stored delta
+    directly; wider ranges join the two rebuilt versions on their stored hashes.
+    """
+    manifest = list_snapshots(platform)
+    return _diff_snapshots(platform, from_id, to_id, _manifest_version(manifest[:to_id]), manifest)
+
+
+def _manifest_version(entries):
+    return hashlib.sha1(json.dumps(entries, sort_keys=True).encode()).hexdigest()
+
+
+# Keyed on the manifest entries it reads, so a rebuilt snapshot directory that reuses ids is a miss
+@st.cache_data(max_entries=64)
+def _diff_snapshots(platform, from_id, to_id, manifest_version, _manifest):
+    if to_id == from_id + 1 and not _manifest[to_id - 1]['keyframe']:
+        return _read_state(platform, _manifest[to_id - 1]).drop(columns=['_key', '_fp'])
+
+    old = _materialize(platform, _manifest, from_id)
+    new = _materialize(platform, _manifest, to_id)
+    added, changed, removed = diff_indexes(old[['_key', '_fp']], new[['_key', '_fp']])
+    diff = pd.concat([_tag_rows(new, added, changed), old[old['_key'].isin(removed)].assign(_op='removed')],
+                     ignore_index=True)
+    return diff.drop(columns=['_key', '_fp'])
+
+
+def churn_history(platform):
+    """Per-snapshot added/removed/changed counts, straight from the manifest."""
+    manifest = list_snapshots(platform)
+    if not manifest:
+        return pd.DataFrame(columns=['id', 'taken_at', 'rows'] + OPS)
+    history = pd.DataFrame(manifest)[['id', 'taken_at', 'rows'] + OPS]
+    history['taken_at'] = pd.to_datetime(history['taken_at'], utc=True, format='ISO8601')
+    return history
+
+
+def snapshot_all(taken_at=None, source=None):
+    """
+    Snapshots every platform's current CSV. Returns {platform: entry or None}.
+    A platform that can't be read doesn't stop the others; the failures are
+    raised together once every platform has been tried.
+    """
+    entries, errors = {}, {}
+    for platform in PLATFORM_FILES:
+        try:
+            entries[platform] = take_snapshot(platform, taken_at=taken_at, source=source)
+        except (OSError, ValueError) as exc:
+            errors[platform] = exc
+    if errors:
+        raise RuntimeError("snapshot failed for " + "; ".join(f"{p}: {exc}" for p, exc in errors.items()))
+    return entries
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot the catalog CSVs in `data/`.")
+    parser.add_argument('--platform', choices=list(PLATFORM_FILES), help="snapshot one platform only")
+    parser.add_argument('--csv', help="snapshot this CSV instead of the platform's file in `data/`")
+    parser.add_argument('--taken-at', help="ISO timestamp to record (default: now)")
+    args = parser.parse_args()
+
+    platforms = [args.platform] if args.platform else list(PLATFORM_FILES)
+    for platform in platforms:
+        df = pd.read_csv(args.csv) if args.csv else None
+        entry = take_snapshot(platform, df=df, taken_at=args.taken_at, source=args.csv)
+        if entry:
+            print(f"{platform}: snapshot {entry['id']} (+{entry['added']} -{entry['removed']} ~{entry['changed']})")
+        else:
+            print(f"{platform}: unchanged since the last snapshot")
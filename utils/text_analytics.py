@@ -0,0 +1,166 @@
+import streamlit as st
+import pandas as pd
+import numpy as np
+import scipy.sparse as sp
+import io
+from wordcloud import WordCloud, STOPWORDS
+from utils.data_loader import catalog_snapshot, PLATFORM_FILES, VERSIONS_KEPT
+from utils.bitmap_index import get_bitmap_index
+
+# Words of three or more letters; inner apostrophes and hyphens are kept ("coming-of-age")
+TOKEN_PATTERN = r"[^\W\d_]{3,}(?:['-][^\W\d_]+)*"
+# Words nearly every description uses, on top of the usual English stopwords
+DESCRIPTION_STOPWORDS = {'film', 'series', 'movie', 'show', 'documentary', 'special', 'must', 'will',
+                         'one', 'two', 'three', 'four'}
+STOP_TERMS = frozenset(STOPWORDS) | DESCRIPTION_STOPWORDS
+RECENT_YEARS = 2
+MIN_RECENT_TITLES = 5
+WORD_CLOUD_WORDS = 150
+
+
+class TermIndex:
+    """
+    Descriptions tokenized once into a sparse titles × terms count matrix.
+
+    Term totals for any set of titles are one sparse matrix-vector product with
+    its row mask, so word clouds and trends never re-read the raw text.
+    `presence` holds the same matrix with every count set to 1, for document
+    frequencies.
+    """
+
+    def __init__(self, descriptions, date_added):
+        tokens = (descriptions.str.lower().str.replace(r"['’]s\b", "", regex=True)
+                  .str.findall(TOKEN_PATTERN).explode())
+        tokens = tokens[tokens.notna()]
+        tokens = tokens[~tokens.isin(STOP_TERMS)]
+        codes, terms = pd.factorize(tokens)
+        self.terms = np.asarray(terms, dtype=object)
+        self.n_titles = len(descriptions)
+
+        shape = (self.n_titles, len(self.terms))
+        self.counts = sp.csr_matrix((np.ones(len(codes), np.int32), (tokens.index.to_numpy(), codes)), shape=shape)
+        self.presence = self.counts.copy()
+        self.presence.data[:] = 1
+
+        years = pd.DatetimeIndex(date_added).year
+        self.year_codes, self.years = pd.factorize(pd.Series(years).astype('Int64'), sort=True)
+        self.years = np.asarray(self.years, dtype=np.int64)
+
+    def _weights(self, mask):
+        return np.ones(self.n_titles, np.int32) if mask is None else mask.astype(np.int32)
+
+    def term_counts(self, mask=None):
+        """Occurrences of every term across the titles selected by `mask` (all titles if None)."""
+        return self.counts.T @ self._weights(mask)
+
+    def top_terms(self, mask=None, n=WORD_CLOUD_WORDS):
+        """The `n` most frequent terms as {term: count}."""
+        counts = self.term_counts(mask)
+        top = np.argsort(-counts, kind='stable')[:n]
+        top = top[counts[top] > 0]
+        return dict(zip(self.terms[top], counts[top].tolist()))
+
+    def yearly_presence(self, mask=None):
+        """(years × terms document frequencies, titles per year) for the selected titles with a known year added."""
+        rows = np.flatnonzero((self.year_codes >= 0) & (True if mask is None else mask))
+        year_onehot = sp.csr_matrix((np.ones(len(rows), np.int32), (self.year_codes[rows], rows)),
+                                    shape=(len(self.years), self.n_titles))
+        titles_per_year = np.bincount(self.year_codes[rows], minlength=len(self.years))
+        return (year_onehot @ self.presence).tocsr(), titles_per_year
+
+    def rising_terms(self, mask=None, n=15, recent_years=RECENT_YEARS, min_titles=MIN_RECENT_TITLES):
+        """
+        Terms whose share of titles grew most in the latest `recent_years` years
+        added, relative to all earlier years. Ranked by the two-proportion
+        z-score of the change, so a term seen in a handful of new titles doesn't
+        outrank a broad, well-supported rise.
+        """
+        per_year, titles_per_year = self.yearly_presence(mask)
+        active = np.flatnonzero(titles_per_year)
+        if len(active) <= recent_years:
+            return pd.DataFrame(columns=['term', 'recent_titles', 'recent_share', 'earlier_share', 'z_score'])
+        recent = np.zeros(len(self.years), dtype=bool)
+        recent[active[-recent_years:]] = True
+
+        recent_df = np.asarray(per_year[np.flatnonzero(recent)].sum(axis=0)).ravel()
+        earlier_df = np.asarray(per_year[np.flatnonzero(~recent)].sum(axis=0)).ravel()
+        recent_titles, earlier_titles = titles_per_year[recent].sum(), titles_per_year[~recent].sum()
+        recent_share = recent_df / recent_titles
+        earlier_share = earlier_df / earlier_titles
+        pooled = (recent_df + earlier_df) / (recent_titles + earlier_titles)
+        spread = np.sqrt(pooled * (1 - pooled) * (1 / recent_titles + 1 / earlier_titles))
+        z_score = np.divide(recent_share - earlier_share, spread, out=np.zeros(len(spread)), where=spread > 0)
+
+        candidates = np.flatnonzero((recent_df >= min_titles) & (z_score > 0))
+        top = candidates[np.argsort(-z_score[candidates], kind='stable')[:n]]
+        return pd.DataFrame({'term': self.terms[top], 'recent_titles': recent_df[top],
+                             'recent_share': recent_share[top], 'earlier_share': earlier_share[top],
+                             'z_score': z_score[top]})
+
+    def term_trend(self, terms, mask=None):
+        """Share of titles added each year whose description uses each of `terms` (years × terms frame)."""
+        per_year, titles_per_year = self.yearly_presence(mask)
+        term_ids = pd.Index(self.terms).get_indexer(list(terms))
+        shares = per_year[:, term_ids].toarray() / np.maximum(titles_per_year, 1)[:, None]
+        trend = pd.DataFrame(shares, index=self.years, columns=list(terms))
+        return trend[titles_per_year > 0]
+
+
+def get_term_index(platform=None, version=None):
+    """Returns the description term index for one platform, or the combined catalog when `platform` is None."""
+    snapshot = catalog_snapshot(version)
+    return _build_term_index(platform, snapshot.version, snapshot)
+
+@st.cache_resource(max_entries=VERSIONS_KEPT * (len(PLATFORM_FILES) + 1), show_spinner=False)
+def _build_term_index(platform, version, _snapshot):
+    df = _snapshot.frame(platform)
+    if df is None:
+        return None
+    text = _snapshot.text(platform)
+    return TermIndex(text['description'], df['date_added'])
+
+
+def _selection_mask(platform, selection, snapshot):
+    if not selection:
+        return None
+    index = get_bitmap_index(platform, snapshot)
+    return index.to_mask(index.evaluate(dict(selection)))
+
+
+def word_cloud_image(platform=None, selection=(), colormap='Reds', version=None):
+    """
+    PNG word cloud of the descriptions matching a platform and filter selection
+    key (see `bitmap_index.selection_key`), or None if they have no terms.
+    Rendered once per filter state.
+    """
+    snapshot = catalog_snapshot(version)
+    return _word_cloud_image(platform, selection, colormap, snapshot.version, snapshot)
+
+@st.cache_data(max_entries=128, show_spinner=False)
+def _word_cloud_image(platform, selection, colormap, version, _snapshot):
+    terms = get_term_index(platform, _snapshot)
+    if terms is None:
+        return None
+    frequencies = terms.top_terms(_selection_mask(platform, selection, _snapshot))
+    if not frequencies:
+        return None
+    cloud = WordCloud(width=800, height=360, background_color=None, mode='RGBA', colormap=colormap,
+                      max_words=WORD_CLOUD_WORDS, random_state=42).generate_from_frequencies(frequencies)
+    buffer = io.BytesIO()
+    cloud.to_image().save(buffer, format='PNG')
+    return buffer.getvalue()
+
+
+def rising_terms(platform=None, selection=(), n=15, version=None):
+    """Rising description terms and their yearly share for a platform and filter selection key."""
+    snapshot = catalog_snapshot(version)
+    return _rising_terms(platform, selection, n, snapshot.version, snapshot)
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def _rising_terms(platform, selection, n, version, _snapshot):
+    terms = get_term_index(platform, _snapshot)
+    if terms is None:
+        return pd.DataFrame(), pd.DataFrame()
+    mask = _selection_mask(platform, selection, _snapshot)
+    rising = terms.rising_terms(mask, n=n)
+    return rising, terms.term_trend(rising['term'].head(5), mask)
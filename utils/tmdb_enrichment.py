@@ -0,0 +1,373 @@
+"""Resumable bulk TMDb matching of catalog titles into a parquet table joined by `load_enrichment`."""
+import streamlit as st
+import pandas as pd
+import argparse
+import asyncio
+import json
+import os
+import random
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+import requests
+
+from utils import api_utils
+from utils.data_loader import catalog_snapshot, load_all_data, data_path, PLATFORM_FILES, VERSIONS_KEPT
+
+ENRICHMENT_DIR = os.environ.get("DATAFLIX_ENRICHMENT_DIR", data_path("enrichment"))
+CHECKPOINT_FILE = "tmdb_matches.jsonl"
+GENRES_FILE = "tmdb_genres.json"
+TABLE_FILE = "tmdb_enrichment.parquet"
+DEFAULT_CONCURRENCY = 8
+# Requests per second; TMDb allows roughly 50
+DEFAULT_RATE = 40
+MAX_RETRIES = 4
+# Search results considered when picking the best match
+CANDIDATES = 5
+
+ENRICHMENT_COLUMNS = {
+    'tmdb_id': 'Int64',
+    'tmdb_title': 'string',
+    'tmdb_vote_average': 'Float64',
+    'tmdb_vote_count': 'Int64',
+    'tmdb_popularity': 'Float64',
+    'tmdb_genres': 'string',
+}
+SEARCH = {
+    'Movie': {'path': "search/movie", 'name': 'title', 'date': 'release_date'},
+    'TV Show': {'path': "search/tv", 'name': 'name', 'date': 'first_air_date'},
+}
+
+
+def _path(filename):
+    return os.path.join(ENRICHMENT_DIR, filename)
+
+
+def _normalize(titles):
+    return titles.astype('string').str.lower().str.strip().str.replace(r"\s+", " ", regex=True)
+
+
+def title_keys(df):
+    """The lookup key of every catalog row: type, normalized title and release year."""
+    years = pd.to_numeric(df['release_year'], errors='coerce').astype('Int64').astype('string').fillna('')
+    return df['type'].astype('string').fillna('') + "|" + _normalize(df['title']).fillna('') + "|" + years
+
+
+class TokenBucket:
+    """Async token bucket: `rate` requests per second with bursts of up to `capacity`."""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._resume_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                if now < self._resume_at:
+                    await asyncio.sleep(self._resume_at - now)
+                    continue
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+    def pause(self, seconds):
+        """Holds every request for `seconds`, e.g. after the server answered 429."""
+        self._resume_at = max(self._resume_at, time.monotonic() + seconds)
+        # Refill from the end of the pause, not across it
+        self._tokens = 0
+        self._updated = self._resume_at
+
+
+class TMDbClient:
+    """Rate-limited TMDb GETs, run on worker threads with one HTTP session per thread."""
+
+    def __init__(self, base_url, api_key, rate=DEFAULT_RATE):
+        self.base_url = base_url.rstrip('/')
+        self.api_key = api_key
+        self.bucket = TokenBucket(rate)
+        self.requests = 0
+        self.retries = 0
+        self._local = threading.local()
+
+    def _get(self, path, params):
+        session = getattr(self._local, 'session', None)
+        if session is None:
+            session = self._local.session = requests.Session()
+        response = session.get(f"{self.base_url}/{path}", params={'api_key': self.api_key, **params},
+                               timeout=api_utils.REQUEST_TIMEOUT)
+        retry_after = response.headers.get('Retry-After')
+        payload = response.json() if response.status_code == 200 else None
+        return response.status_code, float(retry_after) if retry_after else None, payload
+
+    async def get_json(self, path, **params):
+        """The JSON body of a GET, retrying 429s, server and network errors. None for other client errors."""
+        for attempt in range(MAX_RETRIES + 1):
+            await self.bucket.acquire()
+            self.requests += 1
+            try:
+                status, retry_after, payload = await asyncio.to_thread(self._get, path, params)
+            except (requests.RequestException, ValueError):
+                status, retry_after, payload = None, None, None
+            if status == 200:
+                return payload
+            if status is not None and status != 429 and status < 500:
+                return None
+            if attempt == MAX_RETRIES:
+                break
+            delay = retry_after or 0.5 * 2 ** attempt * (1 + random.random())
+            if status == 429:
+                self.bucket.pause(delay)
+            self.retries += 1
+            await asyncio.sleep(delay)
+        raise RuntimeError(f"TMDb request failed after {MAX_RETRIES + 1} attempts: {path}")
+
+
+def _best_match(results, title, year, content_type):
+    """The search result whose name and year agree best with the catalog title (TMDb's order breaks ties)."""
+    fields = SEARCH[content_type]
+    wanted = title.lower().strip()
+
+    def score(rank_result):
+        rank, result = rank_result
+        name = str(result.get(fields['name']) or '').lower().strip()
+        date = str(result.get(fields['date']) or '')
+        result_year = int(date[:4]) if date[:4].isdigit() else None
+        year_gap = abs(result_year - year) if result_year and year else 99
+        return (name == wanted, year_gap <= 1, -year_gap, -rank)
+
+    candidates = list(enumerate(results[:CANDIDATES]))
+    return max(candidates, key=score)[1] if candidates else None
+
+
+async def _match_title(client, title, content_type, year):
+    """Checkpoint record for one title: its TMDb match, or status 'not_found'."""
+    payload = await client.get_json(SEARCH[content_type]['path'], query=title)
+    if payload is None:
+        return {'status': 'not_found'}
+    result = _best_match(payload.get('results', []), title, year, content_type)
+    if result is None:
+        return {'status': 'not_found'}
+    return {
+        'status': 'matched',
+        'tmdb_id': result.get('id'),
+        'tmdb_title': result.get(SEARCH[content_type]['name']),
+        'vote_average': result.get('vote_average'),
+        'vote_count': result.get('vote_count'),
+        'popularity': result.get('popularity'),
+        'genre_ids': result.get('genre_ids', []),
+    }
+
+
+async def _fetch_genres(client):
+    genres = {}
+    for kind in ('movie', 'tv'):
+        payload = await client.get_json(f"genre/{kind}/list") or {}
+        genres.update({str(genre['id']): genre['name'] for genre in payload.get('genres', [])})
+    return genres
+
+
+def read_checkpoint():
+    """{title key: record} from the JSONL checkpoint; the last record of a key wins."""
+    records = {}
+    try:
+        with open(_path(CHECKPOINT_FILE)) as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:  # a line cut short by an interrupted run
+                    continue
+                records[record['key']] = record
+    except FileNotFoundError:
+        pass
+    return records
+
+
+def pending_titles(catalog, done=(), limit=None):
+    """Distinct (key, title, type, year) rows of a catalog not in `done`, in catalog order."""
+    titles = pd.DataFrame({'key': title_keys(catalog), 'title': catalog['title'].astype('string'),
+                           'type': catalog['type'].astype('string'),
+                           'year': pd.to_numeric(catalog['release_year'], errors='coerce').astype('Int64')})
+    titles = titles[titles['type'].isin(list(SEARCH)) & titles['title'].notna()].drop_duplicates('key')
+    titles = titles[~titles['key'].isin(set(done))]
+    return titles.head(limit) if limit else titles
+
+
+async def _enrich(pending, client, concurrency, checkpoint):
+    counts = {'matched': 0, 'not_found': 0, 'failed': 0}
+    queue = asyncio.Queue()
+    for row in pending.itertuples(index=False):
+        queue.put_nowait(row)
+
+    async def worker():
+        while True:
+            try:
+                row = queue.get_nowait()
+            except asyncio.QueueEmpty:
+                return
+            year = None if pd.isna(row.year) else int(row.year)
+            try:
+                record = await _match_title(client, row.title, row.type, year)
+            except RuntimeError:
+                counts['failed'] += 1  # not checkpointed, so the next run retries it
+                continue
+            counts[record['status']] += 1
+            checkpoint.write(json.dumps({'key': row.key, **record, 'fetched_at': time.time()}) + "\n")
+            checkpoint.flush()
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return counts
+
+
+async def _run(pending, base_url, api_key, concurrency, rate):
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=concurrency))
+    client = TMDbClient(base_url, api_key, rate)
+    genres = await _fetch_genres(client)
+    if genres:
+        _write_json(GENRES_FILE, genres)
+    with open(_path(CHECKPOINT_FILE), "a") as checkpoint:
+        counts = await _enrich(pending, client, concurrency, checkpoint)
+    return {**counts, 'requests': client.requests, 'retries': client.retries}
+
+
+def _write_json(filename, payload):
+    fd, tmp_path = tempfile.mkstemp(dir=ENRICHMENT_DIR, prefix=f".{filename}-")
+    with os.fdopen(fd, "w") as f:
+        json.dump(payload, f)
+    os.replace(tmp_path, _path(filename))
+
+
+def enrich_catalog(base_url=None, api_key=None, concurrency=DEFAULT_CONCURRENCY, rate=DEFAULT_RATE,
+                   limit=None, platforms=None):
+    """
+    Looks up every catalog title not in the checkpoint yet, then rebuilds the
+    enrichment table. Returns counts of matched, not found and failed titles,
+    requests made and retries.
+    """
+    os.makedirs(ENRICHMENT_DIR, exist_ok=True)
+    catalog = load_all_data()
+    if platforms:
+        catalog = catalog[catalog['platform'].isin(platforms)]
+    done = read_checkpoint()
+    pending = pending_titles(catalog, done, limit)
+
+    started = time.time()
+    stats = asyncio.run(_run(pending, base_url or api_utils.BASE_URL, api_key or api_utils.API_KEY, concurrency, rate))
+    stats.update({'cached': len(done), 'looked_up': len(pending), 'seconds': time.time() - started})
+    stats['titles_matched'] = build_table()
+    return stats
+
+
+def build_table():
+    """Compacts the checkpoint into the typed parquet table keyed by title key. Returns its matched rows."""
+    records = [record for record in read_checkpoint().values() if record['status'] == 'matched']
+    try:
+        with open(_path(GENRES_FILE)) as f:
+            genres = json.load(f)
+    except FileNotFoundError:
+        genres = {}
+
+    table = pd.DataFrame({
+        'title_key': pd.array([r['key'] for r in records], dtype='string'),
+        'tmdb_id': [r.get('tmdb_id') for r in records],
+        'tmdb_title': [r.get('tmdb_title') for r in records],
+        'tmdb_vote_average': [r.get('vote_average') for r in records],
+        'tmdb_vote_count': [r.get('vote_count') for r in records],
+        'tmdb_popularity': [r.get('popularity') for r in records],
+        'tmdb_genres': [", ".join(dict.fromkeys(genres.get(str(g), str(g)) for g in r.get('genre_ids') or []))
+                        or None for r in records],
+    }).astype(ENRICHMENT_COLUMNS)
+
+    os.makedirs(ENRICHMENT_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=ENRICHMENT_DIR, prefix=f".{TABLE_FILE}-")
+    os.close(fd)
+    table.to_parquet(tmp_path, index=False)
+    os.replace(tmp_path, _path(TABLE_FILE))
+    return len(table)
+
+
+_served_enrichment = None
+
+
+def _table_fingerprint(stat):
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def enrichment_fingerprint():
+    """Changes whenever the enrichment table is rewritten; '' if there is none."""
+    try:
+        return _table_fingerprint(os.stat(_path(TABLE_FILE)))
+    except FileNotFoundError:
+        return ''
+
+
+def enrichment_version():
+    """The enrichment table version served to users ('' while there is none)."""
+    global _served_enrichment
+    if _served_enrichment is None:
+        _served_enrichment = enrichment_fingerprint()
+    return _served_enrichment
+
+
+def publish_enrichment_version(version):
+    """Switches users to an enrichment table version whose caches are already warm."""
+    global _served_enrichment
+    _served_enrichment = version
+
+
+def load_enrichment(platform=None, version=None, enrichment=None):
+    """
+    TMDb columns for one platform's catalog, or the combined catalog when
+    `platform` is None. Rows line up with `load_data(platform)` /
+    `load_all_data()`; titles without a match are null.
+    """
+    snapshot = catalog_snapshot(version)
+    enrichment = enrichment if enrichment is not None else enrichment_version()
+    return _load_enrichment(platform, snapshot.version, enrichment, snapshot)
+
+@st.cache_data(max_entries=VERSIONS_KEPT * (len(PLATFORM_FILES) + 1), show_spinner=False)
+def _load_enrichment(platform, version, table_version, _snapshot):
+    df = _snapshot.frame(platform)
+    if df is None:
+        return None
+    empty = pd.DataFrame({column: pd.Series(index=df.index, dtype=dtype)
+                          for column, dtype in ENRICHMENT_COLUMNS.items()})
+    if not table_version:
+        return empty
+    try:
+        table = pd.read_parquet(_path(TABLE_FILE)).set_index('title_key')
+    except FileNotFoundError:
+        return empty
+    joined = table.reindex(title_keys(df).to_numpy())
+    return joined.set_index(df.index).astype(ENRICHMENT_COLUMNS)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Match catalog titles to TMDb and store their ratings and popularity.")
+    parser.add_argument('--platform', action='append', choices=list(PLATFORM_FILES),
+                        help="enrich this platform only (repeatable)")
+    parser.add_argument('--limit', type=int, help="look up at most this many new titles")
+    parser.add_argument('--concurrency', type=int, default=DEFAULT_CONCURRENCY, help="requests in flight")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE, help="requests per second")
+    parser.add_argument('--base-url', help="TMDb API base URL (default: TMDB_BASE_URL or api.themoviedb.org)")
+    parser.add_argument('--stub', action='store_true', help="start tools/tmdb_stub.py and enrich against it")
+    args = parser.parse_args()
+
+    base_url = args.base_url
+    if args.stub:
+        from tools.tmdb_stub import start_stub_server
+        server, base_url = start_stub_server()
+    stats = enrich_catalog(base_url, concurrency=args.concurrency, rate=args.rate, limit=args.limit,
+                           platforms=args.platform)
+    print(f"Looked up {stats['looked_up']:,} titles in {stats['seconds']:.1f}s ({stats['cached']:,} already cached): "
+          f"{stats['matched']:,} matched, {stats['not_found']:,} not found, {stats['failed']:,} failed, "
+          f"{stats['requests']:,} requests, {stats['retries']:,} retries")
+    print(f"Enrichment table: {stats['titles_matched']:,} matched titles in {_path(TABLE_FILE)}")